@@ -0,0 +1,154 @@
+"""
+Benchmark - contact/link extraction throughput, single-pass scanner vs. per-field regexes
+
+The previous ResumeParser.extract_basic_info_with_regex ran one regex per
+field (and per phone format and portfolio host) over the whole text. It is
+reproduced here as the baseline and timed against
+services.contact_scanner.scan_contacts on synthetic resume texts. Results
+(including the moved link categorization) are compared field by field so any
+behavioural difference shows up next to the timing.
+
+Usage (from the backend directory):
+    python benchmarks/bench_contact_scanner.py --docs 5000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_pdfs import LINKS, SECTIONS, WORDS  # noqa: E402
+from services.contact_scanner import categorize_links, scan_contacts  # noqa: E402
+
+PHONE_FORMATS = [
+    "+1 {a} {b} {c}",
+    "+91-{a}{b}{c}",
+    "+44 ({a}) {b}-{c}",
+    "{a}-{b}-{c}",
+    "({a}) {b}-{c}",
+]
+
+
+def legacy_extract_basic_info(text: str) -> Dict[str, Optional[str]]:
+    """Previous extract_basic_info_with_regex: one regex pass per field and variant"""
+    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    email = emails[0] if emails else None
+
+    phone = None
+    for pattern in [
+        r'\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}',
+        r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
+    ]:
+        matches = re.findall(pattern, text)
+        if matches:
+            phone = matches[0].strip()
+            break
+
+    linkedin_match = re.search(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
+    github_match = re.search(r'(?:https?://)?(?:www\.)?github\.com/[\w-]+', text, re.IGNORECASE)
+
+    portfolio = None
+    for pattern in [
+        r'(?:https?://)?(?:www\.)?[\w-]+\.vercel\.app/?[\w/-]*',
+        r'(?:https?://)?(?:www\.)?[\w-]+\.netlify\.app/?[\w/-]*',
+        r'(?:https?://)?(?:www\.)?[\w-]+\.herokuapp\.com/?[\w/-]*',
+        r'(?:https?://)?(?:www\.)?[\w-]+\.github\.io/?[\w/-]*',
+        r'(?:https?://)?portfolio\.[\w-]+\.[\w.]+/?[\w/-]*'
+    ]:
+        portfolio_match = re.search(pattern, text, re.IGNORECASE)
+        if portfolio_match:
+            portfolio = portfolio_match.group(0)
+            break
+
+    return {
+        'email': email,
+        'phone': phone,
+        'linkedin': linkedin_match.group(0) if linkedin_match else None,
+        'github': github_match.group(0) if github_match else None,
+        'portfolio': portfolio
+    }
+
+
+def legacy_categorize_links(all_links: List[str]) -> Dict:
+    """Previous _categorize_links without the logging"""
+    links = {}
+    for url in all_links:
+        url_lower = url.lower()
+        if 'github.com' in url_lower and '/github.com/' in url_lower:
+            links['github'] = url
+        elif 'linkedin.com/in' in url_lower:
+            links['linkedin'] = url
+        elif any(domain in url_lower for domain in ['vercel.app', 'netlify.app', 'herokuapp.com', 'github.io']):
+            if 'github.io' in url_lower or 'vercel' in url_lower or 'netlify' in url_lower:
+                if 'portfolio' not in links:
+                    links['portfolio'] = url
+                else:
+                    links.setdefault('project_links', []).append(url)
+    if all_links:
+        links['all_links'] = all_links
+    return links
+
+
+def synthetic_resume(rng: random.Random, index: int) -> Dict:
+    """Resume-like text (header, sections, links block) and its hyperlink list"""
+    user = f"candidate{index}"
+    phone = rng.choice(PHONE_FORMATS).format(a=rng.randint(200, 999), b=rng.randint(200, 999),
+                                             c=rng.randint(1000, 9999))
+    links = [rng.choice(LINKS).format(user=user) for _ in range(rng.randint(2, 8))]
+    lines = [f"Candidate {index}", f"{phone} | {user}@example.com | " + " | ".join(links[:3])]
+    for _ in range(rng.randint(15, 90)):
+        if rng.random() < 0.1:
+            lines.append(rng.choice(SECTIONS))
+            lines.append(f"Jan {rng.randint(2010, 2020)} - Mar {rng.randint(2020, 2024)}")
+        words = [rng.choice(WORDS) for _ in range(rng.randint(6, 18))]
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), f"{rng.randint(10, 95)}%")
+        lines.append(" ".join(words))
+    lines.append("--- Extracted Links ---")
+    lines.extend(f"{i}. {url}" for i, url in enumerate(links, 1))
+    return {"text": "\n".join(lines), "links": links}
+
+
+def time_it(fn: Callable, inputs: List, repeat: int) -> float:
+    """Best-of-repeat wall time for calling fn on every input"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in inputs:
+            fn(item)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [synthetic_resume(rng, i) for i in range(args.docs)]
+    texts = [doc["text"] for doc in corpus]
+    link_lists = [doc["links"] for doc in corpus]
+    megabytes = sum(len(text) for text in texts) / (1024 * 1024)
+
+    mismatches = sum(legacy_extract_basic_info(text) != scan_contacts(text) for text in texts)
+    link_mismatches = sum(legacy_categorize_links(links) != categorize_links(links) for links in link_lists)
+
+    legacy = time_it(legacy_extract_basic_info, texts, args.repeat)
+    scanner = time_it(scan_contacts, texts, args.repeat)
+
+    print(f"\n{args.docs} synthetic resumes, {megabytes:.1f}MB of text")
+    print(f"{'':<26}{'legacy':>12}{'scanner':>12}{'speedup':>10}")
+    print(f"{'contact fields (docs/s)':<26}{args.docs / legacy:>12.0f}{args.docs / scanner:>12.0f}{legacy / scanner:>9.2f}x")
+    print(f"\nResults differing from legacy: contact fields {mismatches}, link categories {link_mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark - interview event writes: embedded array $push vs bucketed event store
+
+For each session size in --sizes (events already recorded), seeds one
+interview per layout and times --appends further face monitoring events:
+
+- embedded: $push onto the interview document's face_monitoring_logs array
+- buckets: InterviewEventStore.append (counter increment + bucket push)
+
+Also reports the interview document's size and the latency of reading the
+interview by session_id, which every route does.
+
+Needs a running MongoDB; the scratch database is dropped afterwards.
+
+Usage (from the backend directory):
+    python benchmarks/bench_interview_events.py --mongodb-uri mongodb://localhost:27017 --sizes 1,100,10000
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_upload_concurrency import summarize  # noqa: E402
+from config import settings  # noqa: E402
+from services.interview_events import InterviewEventStore  # noqa: E402
+from utils.database import Database  # noqa: E402
+from utils.indexes import INDEXES, apply_indexes  # noqa: E402
+
+KIND = "face_monitoring_logs"
+
+
+def face_log(rng: random.Random) -> Dict:
+    """One face monitoring event shaped like the proctoring client's"""
+    return {
+        "timestamp": datetime.utcnow(),
+        "faces": rng.choice([1, 1, 1, 0, 2]),
+        "looking_away": rng.random() < 0.1,
+        "confidence": round(rng.random(), 4),
+        "bbox": [rng.randint(0, 640) for _ in range(4)]
+    }
+
+
+async def seed(db, store: InterviewEventStore, session_id: str, layout: str, events: List[Dict]):
+    interview = {"session_id": session_id, "user_id": "bench-user", "status": "in_progress",
+                 "questions": [], "created_at": datetime.utcnow()}
+    if layout == "embedded":
+        interview[KIND] = events
+    else:
+        interview["event_counts"] = {KIND: len(events)}
+        buckets = [
+            {"session_id": session_id, "kind": KIND, "seq": start // store.bucket_size,
+             "count": len(events[start:start + store.bucket_size]),
+             "events": events[start:start + store.bucket_size]}
+            for start in range(0, len(events), store.bucket_size)
+        ]
+        if buckets:
+            await db[store.COLLECTION].insert_many(buckets)
+    await db.interviews.insert_one(interview)
+
+
+async def append_embedded(db, session_id: str, event: Dict):
+    await db.interviews.update_one(
+        {"session_id": session_id},
+        {"$push": {KIND: event}, "$set": {"updated_at": datetime.utcnow()}}
+    )
+
+
+async def run(db, store: InterviewEventStore, rng: random.Random, size: int, layout: str, appends: int) -> Dict:
+    session_id = f"bench-{layout}-{size}"
+    await seed(db, store, session_id, layout, [face_log(rng) for _ in range(size)])
+
+    writes = []
+    for _ in range(appends):
+        event = face_log(rng)
+        started = time.perf_counter()
+        if layout == "embedded":
+            await append_embedded(db, session_id, event)
+        else:
+            await store.append(session_id, KIND, [event])
+        writes.append(time.perf_counter() - started)
+
+    reads = []
+    for _ in range(appends):
+        started = time.perf_counter()
+        interview = await db.interviews.find_one({"session_id": session_id})
+        reads.append(time.perf_counter() - started)
+    return {"write": summarize(writes), "read": summarize(reads), "document": len(bson.encode(interview))}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongodb-uri", default=settings.MONGODB_URI)
+    parser.add_argument("--database", default="interview_events_bench", help="Scratch database (dropped afterwards)")
+    parser.add_argument("--sizes", default="1,100,10000", help="Comma-separated events already in each session")
+    parser.add_argument("--appends", type=int, default=200, help="Timed appends (and reads) per session")
+    parser.add_argument("--bucket-size", type=int, default=settings.INTERVIEW_EVENT_BUCKET_SIZE)
+    parser.add_argument("--seed", type=int, default=25)
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(args.mongodb_uri)
+    db = client[args.database]
+    Database.db = db
+    store = InterviewEventStore(bucket_size=args.bucket_size)
+    rng = random.Random(args.seed)
+    try:
+        await apply_indexes({name: INDEXES[name] for name in ("interviews", "interview_event_buckets")})
+        sizes = [int(size) for size in args.sizes.split(",")]
+        print(f"{args.appends} appends per session, {args.bucket_size} events per bucket")
+
+        print(f"\n{'events':>8}  {'layout':<10}{'write p50':>11}{'write p95':>11}{'read p50':>10}{'interview KB':>14}")
+        for size in sizes:
+            for layout in ("embedded", "buckets"):
+                result = await run(db, store, rng, size, layout, args.appends)
+                print(f"{size:>8}  {layout:<10}{result['write']['p50']:>11.2f}{result['write']['p95']:>11.2f}"
+                      f"{result['read']['p50']:>10.2f}{result['document'] / 1024:>14.1f}")
+    finally:
+        await client.drop_database(args.database)
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
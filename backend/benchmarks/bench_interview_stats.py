@@ -0,0 +1,158 @@
+"""
+Benchmark - dashboard stats: loading every interview vs the $facet aggregation
+
+Seeds a scratch database with one user holding --interviews interview
+documents of realistic size (questions, responses with transcripts,
+conversation history, face monitoring logs), then times
+/api/interviews/user/stats both ways:
+
+- legacy: find({"user_id": ...}).to_list() and counting in Python
+- aggregation: InterviewStatsService's single $facet pipeline
+
+Bytes transferred are the BSON size of what each approach receives, plus
+the server's own network.bytesOut delta when serverStatus is allowed.
+
+Needs a running MongoDB; the scratch database is dropped afterwards.
+
+Usage (from the backend directory):
+    python benchmarks/bench_interview_stats.py --mongodb-uri mongodb://localhost:27017 --interviews 500
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_upload_concurrency import summarize  # noqa: E402
+from config import settings  # noqa: E402
+from services.interview_stats import InterviewStatsService  # noqa: E402
+from utils.database import Database  # noqa: E402
+from utils.indexes import INDEXES, apply_indexes  # noqa: E402
+
+USER_ID = "bench-user"
+WORDS = ("design system latency cache index query service deploy test review python react mongodb "
+         "scaling team incident tradeoff api queue worker metrics").split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def make_interview(rng: random.Random, index: int, face_logs: int) -> Dict:
+    """One interview document shaped like the ones /api/interviews writes"""
+    questions = [
+        {"id": q, "question": sentence(rng, 25), "category": rng.choice(["technical", "behavioral", "situational"]),
+         "difficulty": rng.choice(["easy", "medium", "hard"]), "skills_tested": [rng.choice(WORDS) for _ in range(3)]}
+        for q in range(10)
+    ]
+    responses = [
+        {"question_id": q, "answer": sentence(rng, 180), "duration": rng.randint(30, 240),
+         "submitted_at": datetime.utcnow()}
+        for q in range(10)
+    ]
+    status = rng.choice(["completed", "completed", "pending", "in_progress"])
+    return {
+        "session_id": f"bench-{index}",
+        "user_id": USER_ID,
+        "job_role": rng.choice(["Backend Engineer", "Frontend Engineer", "Data Scientist"]),
+        "status": status,
+        "overall_score": round(rng.uniform(40, 95), 1) if status == "completed" else None,
+        "duration": rng.randint(600, 3600),
+        "questions": questions,
+        "responses": responses,
+        "conversation_history": [{"type": "follow_up", "question": sentence(rng, 20)} for _ in range(5)],
+        "face_monitoring_logs": [
+            {"timestamp": datetime.utcnow(), "faces": 1, "looking_away": rng.random() < 0.1, "confidence": rng.random()}
+            for _ in range(face_logs)
+        ],
+        "created_at": datetime(2026, 1, 1) + timedelta(hours=index)
+    }
+
+
+async def legacy_stats(db, user_id: str) -> int:
+    """The previous implementation's data access; returns bytes received"""
+    interviews = await db.interviews.find({"user_id": user_id}).to_list(length=None)
+    completed = [i for i in interviews if i.get("status") == "completed"]
+    scores = [i["overall_score"] for i in completed if i.get("overall_score")]
+    _ = (len(interviews), sum(scores) / len(scores) if scores else 0,
+         {q.get("category") for i in interviews for q in i.get("questions", []) if q.get("category")},
+         sorted(interviews, key=lambda i: i.get("created_at", datetime.min), reverse=True)[:5])
+    return sum(len(bson.encode(interview)) for interview in interviews)
+
+
+async def aggregated_stats(db, service: InterviewStatsService, user_id: str) -> int:
+    """The $facet pipeline; returns bytes received"""
+    results = await db.interviews.aggregate(service.pipeline(user_id)).to_list(length=1)
+    return sum(len(bson.encode(result)) for result in results)
+
+
+async def bytes_out(db) -> Optional[int]:
+    """Server-side network bytes sent so far, if serverStatus is permitted"""
+    try:
+        status = await db.command("serverStatus")
+        return int(status["network"]["bytesOut"])
+    except Exception:
+        return None
+
+
+async def measure(db, rounds: int, run) -> Dict:
+    latencies: List[float] = []
+    received = 0
+    before = await bytes_out(db)
+    for _ in range(rounds):
+        started = time.perf_counter()
+        received = await run()
+        latencies.append(time.perf_counter() - started)
+    after = await bytes_out(db)
+    server = (after - before) / rounds if before is not None and after is not None else None
+    return {"latency": summarize(latencies), "received": received, "server_bytes_out": server}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongodb-uri", default=settings.MONGODB_URI)
+    parser.add_argument("--database", default="interview_stats_bench", help="Scratch database (dropped afterwards)")
+    parser.add_argument("--interviews", type=int, default=500)
+    parser.add_argument("--face-logs", type=int, default=600, help="Face monitoring log entries per interview")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=21)
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(args.mongodb_uri)
+    db = client[args.database]
+    Database.db = db
+    service = InterviewStatsService()
+    rng = random.Random(args.seed)
+    try:
+        await db.interviews.drop()
+        documents = [make_interview(rng, index, args.face_logs) for index in range(args.interviews)]
+        await db.interviews.insert_many(documents)
+        await apply_indexes({"interviews": INDEXES["interviews"]})
+        average_kb = sum(len(bson.encode(document)) for document in documents) / len(documents) / 1024
+        print(f"{args.interviews} interviews for one user, {average_kb:.0f} KB each on average, {args.rounds} rounds")
+
+        legacy = await measure(db, args.rounds, lambda: legacy_stats(db, USER_ID))
+        aggregated = await measure(db, args.rounds, lambda: aggregated_stats(db, service, USER_ID))
+
+        print(f"\n{'approach':<14}{'p50 ms':>10}{'p95 ms':>10}{'received KB':>14}{'server out KB':>16}")
+        for name, result in (("legacy", legacy), ("aggregation", aggregated)):
+            server = result["server_bytes_out"]
+            print(f"{name:<14}{result['latency']['p50']:>10.1f}{result['latency']['p95']:>10.1f}"
+                  f"{result['received'] / 1024:>14.1f}{(f'{server / 1024:.1f}' if server is not None else 'n/a'):>16}")
+        print(f"\nAggregation receives {legacy['received'] / max(aggregated['received'], 1):.0f}x fewer bytes; "
+              f"p50 latency ratio legacy/aggregation: {legacy['latency']['p50'] / max(aggregated['latency']['p50'], 1e-6):.1f}")
+    finally:
+        await client.drop_database(args.database)
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
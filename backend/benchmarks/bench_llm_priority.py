@@ -0,0 +1,128 @@
+"""
+Load test - follow-up latency while a batch of resume parses is queued on the LLM gateway
+
+Queues --parses background resume extractions on an LLMGateway, then sends
+interview follow-ups at a steady rate while the batch drains. The Groq
+client is replaced by a simulated one with fixed latencies, so the numbers
+isolate the gateway's scheduling (no network, no API key needed).
+
+Each scenario runs twice: with every call in the same class (FIFO, the
+previous behaviour) and with follow-ups sent as INTERACTIVE and parses as
+BACKGROUND. Follow-up p95 is checked against --target-ms, and the time for
+the whole parse batch to drain shows that aging keeps background work
+moving.
+
+Usage (from the backend directory):
+    python benchmarks/bench_llm_priority.py --parses 200 --slots 8 --target-ms 1500
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_upload_concurrency import summarize  # noqa: E402
+from services.llm_gateway import LLMGateway, LLMPriority, ProviderLimits  # noqa: E402
+
+
+class SimulatedGroq:
+    """Stands in for AsyncGroq: sleeps for a latency chosen by max_tokens"""
+
+    def __init__(self, latencies: Dict[int, float], jitter: float, rng: random.Random):
+        self.latencies = latencies
+        self.jitter = jitter
+        self.rng = rng
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        base = self.latencies[kwargs["max_tokens"]]
+        await asyncio.sleep(base * self.rng.uniform(1 - self.jitter, 1 + self.jitter))
+        usage = SimpleNamespace(prompt_tokens=kwargs["max_tokens"], completion_tokens=kwargs["max_tokens"] // 2)
+        return SimpleNamespace(usage=usage)
+
+
+async def run_scenario(args, prioritized: bool) -> Dict:
+    """Queue the parse batch, stream follow-ups over it, return latency summaries"""
+    rng = random.Random(args.seed)
+    gateway = LLMGateway(
+        max_in_flight=args.slots, max_retries=0,
+        limits={"groq": ProviderLimits("groq", 0, 0)}, aging_seconds=args.aging_seconds
+    )
+    gateway._groq = SimulatedGroq({3000: args.parse_seconds, 200: args.follow_up_seconds}, args.jitter, rng)
+    parse_priority = LLMPriority.BACKGROUND if prioritized else LLMPriority.STANDARD
+    follow_up_priority = LLMPriority.INTERACTIVE if prioritized else LLMPriority.STANDARD
+
+    # Distinct prompts, so single-flight coalescing doesn't merge the batch
+    async def parse(index: int, samples: List[float]):
+        started = time.perf_counter()
+        await gateway.chat("resume_extraction", priority=parse_priority, model="m",
+                           messages=[{"role": "user", "content": f"resume {index}"}], max_tokens=3000)
+        samples.append(time.perf_counter() - started)
+
+    async def follow_up(index: int, samples: List[float]):
+        started = time.perf_counter()
+        await gateway.chat("follow_up_question", priority=follow_up_priority, model="m",
+                           messages=[{"role": "user", "content": f"answer {index}"}], max_tokens=200)
+        samples.append(time.perf_counter() - started)
+
+    parse_samples: List[float] = []
+    follow_up_samples: List[float] = []
+    started = time.perf_counter()
+    parses = [asyncio.create_task(parse(i, parse_samples)) for i in range(args.parses)]
+    await asyncio.sleep(0)  # Let the whole batch reach the gateway first
+
+    follow_ups = []
+    for i in range(args.follow_ups):
+        follow_ups.append(asyncio.create_task(follow_up(i, follow_up_samples)))
+        await asyncio.sleep(args.follow_up_interval)
+    await asyncio.gather(*follow_ups)
+    await asyncio.gather(*parses)
+
+    return {
+        "follow_up": summarize(follow_up_samples),
+        "parse": summarize(parse_samples),
+        "drain_seconds": time.perf_counter() - started,
+        "promoted": gateway.stats()["promoted_by_aging"]
+    }
+
+
+def print_results(title: str, results: Dict, target_ms: float):
+    follow_up, parse = results["follow_up"], results["parse"]
+    verdict = "PASS" if follow_up["p95"] <= target_ms else "FAIL"
+    print(f"\n{title}")
+    print(f"{'calls':<20}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    print(f"{'follow-up':<20}{follow_up['count']:>6}{follow_up['p50']:>10.0f}{follow_up['p95']:>10.0f}"
+          f"{follow_up['max']:>10.0f}   p95 target {target_ms:.0f}ms: {verdict}")
+    print(f"{'resume parse':<20}{parse['count']:>6}{parse['p50']:>10.0f}{parse['p95']:>10.0f}{parse['max']:>10.0f}")
+    print(f"Batch drained in {results['drain_seconds']:.1f}s, {results['promoted']} calls promoted by aging")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parses", type=int, default=200)
+    parser.add_argument("--follow-ups", type=int, default=40)
+    parser.add_argument("--follow-up-interval", type=float, default=0.25, help="Seconds between follow-ups")
+    parser.add_argument("--slots", type=int, default=8, help="Gateway in-flight limit")
+    parser.add_argument("--parse-seconds", type=float, default=0.4, help="Simulated extraction latency")
+    parser.add_argument("--follow-up-seconds", type=float, default=0.1, help="Simulated follow-up latency")
+    parser.add_argument("--jitter", type=float, default=0.25)
+    parser.add_argument("--aging-seconds", type=float, default=15.0)
+    parser.add_argument("--target-ms", type=float, default=1000.0, help="Follow-up p95 target")
+    parser.add_argument("--seed", type=int, default=12)
+    args = parser.parse_args()
+
+    print(f"{args.parses} queued parses, {args.follow_ups} follow-ups every {args.follow_up_interval}s, "
+          f"{args.slots} slots")
+    fifo = await run_scenario(args, prioritized=False)
+    print_results("Single class (FIFO)", fifo, args.target_ms)
+    prioritized = await run_scenario(args, prioritized=True)
+    print_results("Priority classes (follow-ups INTERACTIVE, parses BACKGROUND)", prioritized, args.target_ms)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+"""
+Benchmark - PDF extraction throughput, single pass vs. the previous pipeline
+
+The previous pipeline opened each PDF with pdfplumber twice (once for link
+annotations, once for text) and re-read the whole file with PyPDF2 when the
+combined text was under 50 characters. It is reproduced here as the
+baseline and compared against ResumeParser.extract_text_from_pdf_enhanced
+on a corpus of synthetic multi-page resumes.
+
+With --workers N it also runs the corpus through ResumeParsePool, where
+PDFs longer than --parallel-threshold pages are split across N processes.
+Page-parallel speedup needs N free CPU cores.
+
+Usage (from the backend directory):
+    python benchmarks/bench_pdf_extraction.py --docs 30 --min-pages 2 --max-pages 20 --workers 4
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdfplumber  # noqa: E402
+import PyPDF2  # noqa: E402
+
+from benchmarks.synthetic_pdfs import build_corpus  # noqa: E402
+from services.parse_pool import ResumeParsePool  # noqa: E402
+from services.resume_parser import resume_parser  # noqa: E402
+
+
+def legacy_extract_text(file_path: str) -> str:
+    """Previous extraction path: two pdfplumber opens plus a document-level PyPDF2 fallback"""
+    all_links = []
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            all_links.extend(a["uri"] for a in (page.annots or []) if a.get("uri"))
+
+    text = ""
+    with pdfplumber.open(file_path) as pdf:
+        for page_num, page in enumerate(pdf.pages, 1):
+            page_text = page.extract_text()
+            if page_text:
+                text += f"\n--- Page {page_num} ---\n" + page_text + "\n"
+    text += resume_parser._format_links_section(resume_parser._categorize_links(all_links))
+
+    if len(text.strip()) < 50:
+        reader = PyPDF2.PdfReader(file_path)
+        text = "".join((page.extract_text() or "") + "\n" for page in reader.pages)
+    return text
+
+
+def page_count(file_path: Path) -> int:
+    """Number of pages in a PDF"""
+    return len(PyPDF2.PdfReader(str(file_path)).pages)
+
+
+def measure(name: str, extract: Callable[[str], str], corpus: List[Path], total_pages: int, rounds: int) -> float:
+    """Run one extractor over the corpus and print pages/sec"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for path in corpus:
+                extract(str(path))
+        best = min(best, time.perf_counter() - started)
+    rate = total_pages / best
+    print(f"{name:<12}{best:>10.2f}s{rate:>14.1f} pages/sec")
+    return rate
+
+
+def measure_page_parallel(corpus: List[Path], total_pages: int, workers: int, threshold: int) -> float:
+    """Run the corpus one document at a time through a page-parallel parse pool"""
+    pool = ResumeParsePool(max_workers=workers, max_queue_depth=0, page_parallel_threshold=threshold)
+
+    async def run() -> float:
+        # Warm the worker processes so spawn cost isn't counted
+        with contextlib.redirect_stdout(io.StringIO()):
+            await asyncio.gather(*[pool.extract_text(str(corpus[0])) for _ in range(workers)])
+            started = time.perf_counter()
+            for path in corpus:
+                await pool.extract_text(str(path))
+        return time.perf_counter() - started
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        pool.start()
+    try:
+        elapsed = asyncio.run(run())
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            pool.shutdown()
+    rate = total_pages / elapsed
+    print(f"{f'parallel x{workers}':<12}{elapsed:>10.2f}s{rate:>14.1f} pages/sec")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=30)
+    parser.add_argument("--min-pages", type=int, default=2)
+    parser.add_argument("--max-pages", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="Best of N runs is reported")
+    parser.add_argument("--workers", type=int, default=0, help="Also benchmark page-parallel extraction")
+    parser.add_argument("--parallel-threshold", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = build_corpus(Path(tmp), args.docs, args.min_pages, args.max_pages)
+        total_pages = sum(page_count(path) for path in corpus)
+        print(f"📚 Corpus: {len(corpus)} PDFs, {total_pages} pages\n")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            mismatches = sum(
+                legacy_extract_text(str(p)) != resume_parser.extract_text_from_pdf_enhanced(str(p)) for p in corpus
+            )
+        print(f"🔍 Output differences vs. legacy: {mismatches}\n")
+
+        before = measure("legacy", legacy_extract_text, corpus, total_pages, args.rounds)
+        after = measure("single-pass", resume_parser.extract_text_from_pdf_enhanced, corpus, total_pages, args.rounds)
+        print(f"\n⚡ Speedup: {after / before:.2f}x")
+
+        if args.workers:
+            parallel = measure_page_parallel(corpus, total_pages, args.workers, args.parallel_threshold)
+            print(f"⚡ Page-parallel speedup over legacy: {parallel / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark - request latency while resume uploads are being parsed
+
+Fires a batch of concurrent resume uploads at a running API server and, for
+the whole time they are in flight, keeps probing /health and
+/api/interviews/{session_id}. Probe latency is reported for an idle
+baseline and for the loaded phase, so a parser that blocks the event loop
+shows up as a jump in p99.
+
+Usage (start the server first, e.g. `uvicorn main:app --port 8000`):
+    python benchmarks/bench_upload_concurrency.py \\
+        --base-url http://localhost:8000 \\
+        --resume uploads/resumes/sample.pdf \\
+        --token <firebase-id-token> --session-id <interview-session-id>
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds"""
+    return {
+        "count": len(samples),
+        "p50": percentile(samples, 50) * 1000,
+        "p95": percentile(samples, 95) * 1000,
+        "p99": percentile(samples, 99) * 1000,
+        "max": (max(samples) if samples else 0.0) * 1000,
+        "mean": (statistics.mean(samples) if samples else 0.0) * 1000
+    }
+
+
+async def probe(client: httpx.AsyncClient, path: str, headers: Dict, stop: asyncio.Event,
+                samples: List[float], interval: float):
+    """Hit one endpoint repeatedly until stop is set"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            await client.get(path, headers=headers)
+        except httpx.HTTPError as e:
+            print(f"⚠️ Probe {path} failed: {e}")
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(interval)
+
+
+async def upload(client: httpx.AsyncClient, resume: bytes, filename: str, headers: Dict) -> int:
+    """Upload one resume and return the status code"""
+    response = await client.post(
+        "/api/resumes/upload",
+        files={"file": (filename, resume, "application/pdf")},
+        data={"job_role": "Software Engineer"},
+        headers=headers,
+        timeout=300
+    )
+    return response.status_code
+
+
+async def run_phase(client: httpx.AsyncClient, args, headers: Dict,
+                    resume: Optional[bytes]) -> Dict[str, Dict[str, float]]:
+    """Probe both endpoints, optionally while uploads are running"""
+    stop = asyncio.Event()
+    health_samples: List[float] = []
+    interview_samples: List[float] = []
+    probes = [
+        asyncio.create_task(probe(client, "/health", {}, stop, health_samples, args.interval)),
+    ]
+    if args.session_id:
+        probes.append(asyncio.create_task(
+            probe(client, f"/api/interviews/{args.session_id}", headers, stop, interview_samples, args.interval)
+        ))
+
+    if resume is None:
+        await asyncio.sleep(args.baseline_seconds)
+    else:
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*[
+            upload(client, resume, Path(args.resume).name, headers) for _ in range(args.uploads)
+        ], return_exceptions=True)
+        elapsed = time.perf_counter() - started
+        counts: Dict[str, int] = {}
+        for status in statuses:
+            key = str(status) if isinstance(status, int) else type(status).__name__
+            counts[key] = counts.get(key, 0) + 1
+        print(f"📤 {args.uploads} uploads finished in {elapsed:.1f}s, results: {counts}")
+
+    stop.set()
+    await asyncio.gather(*probes)
+    return {"/health": summarize(health_samples), "/api/interviews/{id}": summarize(interview_samples)}
+
+
+def print_table(title: str, results: Dict[str, Dict[str, float]]):
+    """Print a latency table for one phase"""
+    print(f"\n{title}")
+    print(f"{'endpoint':<24}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for endpoint, s in results.items():
+        if s["count"]:
+            print(f"{endpoint:<24}{s['count']:>6}{s['p50']:>10.1f}{s['p95']:>10.1f}{s['p99']:>10.1f}{s['max']:>10.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--resume", required=True, help="PDF to upload")
+    parser.add_argument("--token", default=None, help="Firebase ID token for authenticated endpoints")
+    parser.add_argument("--session-id", default=None, help="Interview session to probe")
+    parser.add_argument("--uploads", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.05, help="Seconds between probes")
+    parser.add_argument("--baseline-seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    resume = Path(args.resume).read_bytes()
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.uploads + 10)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        baseline = await run_phase(client, args, headers, resume=None)
+        loaded = await run_phase(client, args, headers, resume=resume)
+
+    print_table("Idle baseline", baseline)
+    print_table(f"During {args.uploads} concurrent uploads", loaded)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""
+Query plan check - fail if any route or service query needs a collection scan
+
+Applies the index registry (utils/indexes.py) to a scratch database, seeds
+one document per collection, and runs explain() on every query shape the
+routes and background services issue. Any winning plan containing a
+COLLSCAN stage is reported and the script exits with status 1, so it can
+gate CI or a deploy.
+
+When a new query is added to a route or service, add its shape to QUERIES
+below (and an index to utils/indexes.py if this check then fails).
+
+Needs a running MongoDB; the scratch database is dropped afterwards.
+
+Usage (from the backend directory):
+    python benchmarks/check_query_plans.py --mongodb-uri mongodb://localhost:27017
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import settings  # noqa: E402
+from models.resume import ResumeJobStage  # noqa: E402
+from services.interview_stats import InterviewStatsService  # noqa: E402
+from utils.database import Database  # noqa: E402
+from utils.indexes import apply_indexes  # noqa: E402
+
+USER_ID = "plan-check-user"
+SESSION_ID = "plan-check-session"
+NOW = datetime.utcnow()
+ACTIVE_STAGES = [ResumeJobStage.EXTRACTING.value, ResumeJobStage.LLM.value, ResumeJobStage.SAVING.value]
+FINISHED_STAGES = [ResumeJobStage.DONE.value, ResumeJobStage.FAILED.value]
+
+# One representative document per collection, so every collection exists
+SEED: Dict[str, Dict] = {
+    "users": {"email": "plan@example.com", "firebase_uid": USER_ID, "role": "candidate"},
+    "interviews": {"session_id": SESSION_ID, "user_id": USER_ID, "status": "pending", "created_at": NOW,
+                   "questions": [{"question": "Q", "category": "technical"}], "event_counts": {"responses": 1}},
+    "interview_event_buckets": {"session_id": SESSION_ID, "kind": "responses", "seq": 0, "count": 1,
+                                "events": [{"answer": "A"}]},
+    "resumes": {"user_id": USER_ID, "uploaded_at": NOW, "blob_key": "ab/cd/abcd.pdf", "model_tier": "fast"},
+    "resume_parse_jobs": {"_id": "job", "stage": ResumeJobStage.QUEUED.value, "available_at": NOW,
+                          "blob_key": "ab/cd/abcd.pdf"},
+    "user_interview_stats": {"_id": USER_ID, "total_interviews": 1},
+    "question_set_cache": {"_id": "key", "expires_at": NOW},
+    "question_speculations": {"_id": "resume", "expires_at": NOW},
+    "resume_parse_cache": {"_id": "hash:version"},
+    "llm_quota": {"_id": "groq"},
+}
+
+# (where the query comes from, collection, explain command body)
+QUERIES: List[Tuple[str, str, Dict]] = [
+    ("auth register: email exists", "users", {"find": "users", "filter": {"email": "plan@example.com"}}),
+    ("auth login: email or firebase_uid", "users", {"find": "users", "filter": {
+        "$or": [{"email": "plan@example.com"}, {"firebase_uid": USER_ID}]}}),
+    ("auth me: firebase_uid", "users", {"find": "users", "filter": {"firebase_uid": USER_ID}}),
+    ("interviews: by session_id", "interviews", {"find": "interviews", "filter": {"session_id": SESSION_ID}}),
+    ("interviews: owned open session", "interviews", {"find": "interviews", "filter": {
+        "session_id": SESSION_ID, "user_id": USER_ID, "status": {"$in": ["pending", "in_progress"]}}}),
+    ("interviews: dashboard stats pipeline", "interviews", {
+        "aggregate": "interviews", "pipeline": InterviewStatsService().pipeline(USER_ID), "cursor": {}}),
+    ("user stats: reconcile users", "interviews", {"distinct": "interviews", "key": "user_id", "query": {}}),
+    ("interview events: bucket headers", "interview_event_buckets", {"find": "interview_event_buckets", "filter": {
+        "session_id": SESSION_ID, "kind": "responses"}, "projection": {"seq": 1, "count": 1}, "sort": {"seq": 1}}),
+    ("interview events: headers mid-migration", "interview_event_buckets", {"find": "interview_event_buckets", "filter": {
+        "session_id": SESSION_ID, "kind": "responses", "migrated": {"$ne": True}},
+        "projection": {"seq": 1, "count": 1}, "sort": {"seq": 1}}),
+    ("interview events: buckets from seq", "interview_event_buckets", {"find": "interview_event_buckets", "filter": {
+        "session_id": SESSION_ID, "kind": "responses", "seq": {"$gte": 0}}, "sort": {"seq": 1}}),
+    ("user stats: point read", "user_interview_stats", {
+        "find": "user_interview_stats", "filter": {"_id": USER_ID}}),
+    ("resumes: latest for user", "resumes", {
+        "find": "resumes", "filter": {"user_id": USER_ID}, "sort": {"uploaded_at": -1}, "limit": 1}),
+    ("resumes: count for user", "resumes", {"count": "resumes", "query": {"user_id": USER_ID}}),
+    ("resumes: by id", "resumes", {"find": "resumes", "filter": {"_id": ObjectId()}}),
+    ("resume jobs: model upgrade", "resumes", {"find": "resumes", "filter": {
+        "_id": ObjectId(), "model_tier": "fast", "profile_edited_at": {"$exists": False}}}),
+    ("blob gc: reference counts", "resumes", {"aggregate": "resumes", "pipeline": [
+        {"$match": {"blob_key": {"$type": "string"}}},
+        {"$group": {"_id": "$blob_key", "count": {"$sum": 1}}}], "cursor": {}}),
+    ("blob gc: blob still referenced", "resumes", {"count": "resumes", "query": {"blob_key": "ab/cd/abcd.pdf"}, "limit": 1}),
+    ("blob gc: legacy upload paths", "resumes", {"distinct": "resumes", "key": "file_path", "query": {"blob_key": None}}),
+    ("resume jobs: claim next", "resume_parse_jobs", {"find": "resume_parse_jobs", "filter": {"$or": [
+        {"stage": ResumeJobStage.QUEUED.value, "available_at": {"$lte": NOW}},
+        {"stage": {"$in": ACTIVE_STAGES}, "lease_expires_at": {"$lt": NOW}}]},
+        "sort": {"kind": 1, "created_at": 1}, "limit": 1}),
+    ("blob gc: blobs of pending jobs", "resume_parse_jobs", {"distinct": "resume_parse_jobs", "key": "blob_key", "query": {
+        "stage": {"$nin": FINISHED_STAGES}, "blob_key": {"$type": "string"}}}),
+    ("blob gc: blob still needed by a job", "resume_parse_jobs", {"count": "resume_parse_jobs", "query": {
+        "blob_key": "ab/cd/abcd.pdf", "stage": {"$nin": FINISHED_STAGES}}, "limit": 1}),
+    ("blob gc: legacy paths of pending jobs", "resume_parse_jobs", {"distinct": "resume_parse_jobs", "key": "file_path", "query": {
+        "stage": {"$nin": FINISHED_STAGES}, "blob_key": None}}),
+    ("question cache: lookup", "question_set_cache", {"find": "question_set_cache", "filter": {
+        "_id": "key", "expires_at": {"$gt": NOW}}}),
+    ("question speculation: claim", "question_speculations", {
+        "find": "question_speculations", "filter": {"_id": "resume"}}),
+    ("parse cache: lookup", "resume_parse_cache", {"find": "resume_parse_cache", "filter": {"_id": "hash:version"}}),
+    ("llm quota: bucket state", "llm_quota", {"find": "llm_quota", "filter": {"_id": "groq"}}),
+]
+
+
+def plan_stages(node) -> Iterator[str]:
+    """Every stage name in an explain document, ignoring rejected plans"""
+    if isinstance(node, dict):
+        stage = node.get("stage")
+        if isinstance(stage, str):
+            yield stage
+        for key, value in node.items():
+            if key != "rejectedPlans":
+                yield from plan_stages(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from plan_stages(item)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongodb-uri", default=settings.MONGODB_URI)
+    parser.add_argument("--database", default="query_plan_check", help="Scratch database (dropped afterwards)")
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(args.mongodb_uri)
+    db = client[args.database]
+    Database.db = db
+    failures = []
+    try:
+        for collection, document in SEED.items():
+            await db[collection].insert_one(dict(document))
+        await apply_indexes()
+
+        print(f"{'query':<42}{'collection':<24}plan")
+        for label, collection, command in QUERIES:
+            explain = await db.command("explain", command, verbosity="queryPlanner")
+            stages = list(plan_stages(explain.get("queryPlanner", explain)))
+            collscan = "COLLSCAN" in stages
+            if collscan:
+                failures.append(label)
+            print(f"{label:<42}{collection:<24}{'❌ ' if collscan else '✅ '}{' > '.join(dict.fromkeys(stages))}")
+    finally:
+        await client.drop_database(args.database)
+        client.close()
+
+    if failures:
+        print(f"\n❌ {len(failures)} quer{'y' if len(failures) == 1 else 'ies'} scan a whole collection: {', '.join(failures)}")
+        sys.exit(1)
+    print(f"\n✅ All {len(QUERIES)} queries use an index")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Synthetic resume PDFs for extraction benchmarks
+"""
+import random
+from pathlib import Path
+from typing import List
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+SECTIONS = ["EXPERIENCE", "EDUCATION", "SKILLS", "PROJECTS", "PUBLICATIONS", "CERTIFICATIONS"]
+WORDS = (
+    "designed built scalable distributed services python fastapi mongodb react "
+    "kubernetes pipelines latency throughput reduced improved team led migrated "
+    "analytics models training inference dashboards customers reliability"
+).split()
+LINKS = [
+    "https://github.com/{user}",
+    "https://www.linkedin.com/in/{user}",
+    "https://{user}.vercel.app/",
+    "https://{user}-demo.netlify.app/",
+    "https://{user}.github.io/project",
+]
+
+
+def write_resume_pdf(path: Path, pages: int, seed: int) -> Path:
+    """Write a resume-like PDF with dense text and a few link annotations per page"""
+    rng = random.Random(seed)
+    user = f"candidate{seed}"
+    pdf = canvas.Canvas(str(path), pagesize=letter)
+    width, height = letter
+
+    for page in range(pages):
+        y = height - 60
+        if page == 0:
+            pdf.setFont("Helvetica-Bold", 16)
+            pdf.drawString(50, y, f"Candidate {seed}")
+            pdf.setFont("Helvetica", 10)
+            y -= 18
+            pdf.drawString(50, y, f"{user}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}")
+            y -= 24
+
+        for link_index in range(2):
+            url = rng.choice(LINKS).format(user=user)
+            pdf.drawString(50, y, url)
+            pdf.linkURL(url, (50, y - 2, 300, y + 10), relative=0)
+            y -= 14
+
+        while y > 60:
+            if rng.random() < 0.12:
+                pdf.setFont("Helvetica-Bold", 12)
+                pdf.drawString(50, y, rng.choice(SECTIONS))
+                pdf.setFont("Helvetica", 10)
+                y -= 18
+            pdf.drawString(60, y, " ".join(rng.choice(WORDS) for _ in range(14)))
+            y -= 13
+        pdf.showPage()
+
+    pdf.save()
+    return path
+
+
+def build_corpus(directory: Path, count: int, min_pages: int, max_pages: int, seed: int = 7) -> List[Path]:
+    """Create `count` PDFs with page counts spread between min_pages and max_pages"""
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    return [
+        write_resume_pdf(directory / f"resume_{i:03d}.pdf", rng.randint(min_pages, max_pages), seed + i)
+        for i in range(count)
+    ]
@@ -21,11 +21,45 @@ class Settings:
     # Groq API
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
     
+    # LLM gateway (shared by every service that calls an LLM)
+    LLM_MAX_IN_FLIGHT: int = int(os.getenv("LLM_MAX_IN_FLIGHT", 8))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", 3))
+    # Seconds a queued background call waits before it is promoted one priority class
+    LLM_PRIORITY_AGING_SECONDS: float = float(os.getenv("LLM_PRIORITY_AGING_SECONDS", 15))
+    # Consecutive provider failures (5xx, timeouts) that open its circuit breaker, 0 disables,
+    # and how long calls then fail fast to their fallbacks
+    LLM_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", 5))
+    LLM_BREAKER_COOLDOWN_SECONDS: float = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", 30))
+    # Send a duplicate request when a hedged call is slower than its p95 latency
+    LLM_HEDGING_ENABLED: bool = os.getenv("LLM_HEDGING_ENABLED", "true").lower() == "true"
+    # Per-provider rate limits; match your plan, 0 disables a limit
+    GROQ_REQUESTS_PER_MINUTE: int = int(os.getenv("GROQ_REQUESTS_PER_MINUTE", 30))
+    GROQ_TOKENS_PER_MINUTE: int = int(os.getenv("GROQ_TOKENS_PER_MINUTE", 0))
+    GEMINI_REQUESTS_PER_MINUTE: int = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", 15))
+    GEMINI_TOKENS_PER_MINUTE: int = int(os.getenv("GEMINI_TOKENS_PER_MINUTE", 0))
+    # Where those budgets are kept: memory (per worker process), file (shared by the
+    # workers on one host, via LLM_QUOTA_DIR) or mongo (shared by every node)
+    LLM_QUOTA_BACKEND: str = os.getenv("LLM_QUOTA_BACKEND", "memory")
+    LLM_QUOTA_DIR: str = os.getenv("LLM_QUOTA_DIR", "")
+    
+    # LLM router - enabled providers (groq, gemini, fake) in overall preference order
+    LLM_PROVIDERS: list = [name.strip() for name in os.getenv("LLM_PROVIDERS", "groq,gemini").split(",") if name.strip()]
+    GROQ_CHAT_MODEL: str = os.getenv("GROQ_CHAT_MODEL", "llama-3.3-70b-versatile")
+    GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-pro")
+    # Recent error rate above which a backend is routed around, and share of calls
+    # sent to the runner-up backend to keep its latency numbers fresh
+    LLM_ROUTER_MAX_ERROR_RATE: float = float(os.getenv("LLM_ROUTER_MAX_ERROR_RATE", 0.5))
+    LLM_ROUTER_EXPLORE_RATE: float = float(os.getenv("LLM_ROUTER_EXPLORE_RATE", 0.05))
+    
     # JWT
     JWT_SECRET: str = os.getenv("JWT_SECRET", "your-secret-key-change-this")
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24
     
+    # Shared secret for operational endpoints (X-Admin-Token header); empty disables them
+    ADMIN_API_TOKEN: str = os.getenv("ADMIN_API_TOKEN", "")
+    
     # CORS
     CORS_ORIGINS: list = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
     
@@ -34,10 +68,48 @@ class Settings:
     PORT: int = int(os.getenv("PORT", 8000))
     
     # File Upload
-    MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5MB
-    ALLOWED_FILE_TYPES: list = [".pdf"]
+    MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", 10 * 1024 * 1024))  # 10MB
+    ALLOWED_FILE_TYPES: list = [".pdf", ".docx", ".doc"]
     UPLOAD_DIR: str = "uploads"
     REPORTS_DIR: str = "reports"
+    
+    # Upload storage (content-addressed blobs)
+    BLOB_STORE_BACKEND: str = os.getenv("BLOB_STORE_BACKEND", "local")  # local | s3
+    BLOB_STORE_DIR: str = os.getenv("BLOB_STORE_DIR", "uploads/blobs")
+    BLOB_S3_BUCKET: str = os.getenv("BLOB_S3_BUCKET", "")
+    BLOB_S3_PREFIX: str = os.getenv("BLOB_S3_PREFIX", "resumes/")
+    BLOB_S3_ENDPOINT_URL: str = os.getenv("BLOB_S3_ENDPOINT_URL", "")
+    BLOB_GC_INTERVAL_SECONDS: int = int(os.getenv("BLOB_GC_INTERVAL_SECONDS", 3600))  # 0 disables
+    BLOB_GC_GRACE_SECONDS: int = int(os.getenv("BLOB_GC_GRACE_SECONDS", 3600))
+    
+    # Rebuild materialized dashboard stats from the interviews and report drift
+    USER_STATS_RECONCILE_INTERVAL_SECONDS: int = int(os.getenv("USER_STATS_RECONCILE_INTERVAL_SECONDS", 86400))  # 0 disables
+    
+    # Interview event arrays (responses, conversation, face logs, incidents) stored in buckets of this many events
+    INTERVIEW_EVENT_BUCKET_SIZE: int = int(os.getenv("INTERVIEW_EVENT_BUCKET_SIZE", 100))
+    
+    # Resume Parsing
+    PARSE_POOL_WORKERS: int = int(os.getenv("PARSE_POOL_WORKERS", 2))
+    PARSE_QUEUE_DEPTH: int = int(os.getenv("PARSE_QUEUE_DEPTH", 16))
+    PDF_PARALLEL_PAGE_THRESHOLD: int = int(os.getenv("PDF_PARALLEL_PAGE_THRESHOLD", 8))  # 0 disables
+    PDF_MIN_PAGES_PER_RANGE: int = int(os.getenv("PDF_MIN_PAGES_PER_RANGE", 2))
+    RESUME_PROMPT_TOKEN_BUDGET: int = int(os.getenv("RESUME_PROMPT_TOKEN_BUDGET", 3000))
+    RESUME_CACHE_MAX_ENTRIES: int = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", 256))
+    RESUME_JOB_WORKERS: int = int(os.getenv("RESUME_JOB_WORKERS", 4))
+    RESUME_JOB_LEASE_SECONDS: int = int(os.getenv("RESUME_JOB_LEASE_SECONDS", 180))
+    RESUME_JOB_MAX_ATTEMPTS: int = int(os.getenv("RESUME_JOB_MAX_ATTEMPTS", 3))
+    # Model cascade: parse with a small fast model first, upgrade with the 70B model in the background
+    RESUME_MODEL_CASCADE: bool = os.getenv("RESUME_MODEL_CASCADE", "false").lower() == "true"
+    RESUME_FAST_MODEL: str = os.getenv("RESUME_FAST_MODEL", "llama-3.1-8b-instant")
+    
+    # Interview question set cache (keyed by job role + skill fingerprint)
+    QUESTION_CACHE_TTL_SECONDS: int = int(os.getenv("QUESTION_CACHE_TTL_SECONDS", 7 * 24 * 3600))  # 0 disables
+    QUESTION_CACHE_MAX_ENTRIES: int = int(os.getenv("QUESTION_CACHE_MAX_ENTRIES", 512))
+    QUESTION_CACHE_POLICY: str = os.getenv("QUESTION_CACHE_POLICY", "shuffle")  # reuse | shuffle
+    # Distinct generated sets kept per fingerprint, served in turn; hits start once this many exist
+    QUESTION_CACHE_VARIANTS: int = int(os.getenv("QUESTION_CACHE_VARIANTS", 3))
+    # Questions generated right after a resume is parsed, kept until /start claims them
+    QUESTION_SPECULATION_TTL_SECONDS: int = int(os.getenv("QUESTION_SPECULATION_TTL_SECONDS", 1800))  # 0 disables
 
 
 settings = Settings()
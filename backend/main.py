@@ -4,8 +4,16 @@ Main FastAPI application entry point
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
-from routes import auth_router, candidates_router, interviews_router, recruiters_router, resumes_router
+from routes import auth_router, candidates_router, interviews_router, metrics_router, recruiters_router, resumes_router
 from utils.database import Database
+from utils.indexes import apply_indexes
+from services.parse_pool import parse_pool
+from services.resume_jobs import resume_job_queue
+from services.blob_gc import blob_gc
+from services.llm_gateway import llm_gateway
+from services.question_feed import question_feed
+from services.question_speculation import question_speculator
+from services.user_stats import user_interview_stats
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -17,15 +25,37 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting AI Recruiter Pro API...")
     await Database.connect_db()
     
+    # Create the indexes every route query relies on (utils/indexes.py)
+    await apply_indexes()
+    
     # Ensure upload directories exist
     Path(settings.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
     Path(settings.UPLOAD_DIR, "resumes").mkdir(parents=True, exist_ok=True)
     Path(settings.REPORTS_DIR).mkdir(parents=True, exist_ok=True)
     print("✅ Upload directories created")
     
+    # Start resume text extraction workers
+    parse_pool.start()
+    
+    # Start background resume parse jobs (picks up jobs left by a previous run)
+    await resume_job_queue.start()
+    
+    # Sweep unreferenced uploads from the blob store periodically
+    await blob_gc.start()
+    
+    # Rebuild materialized dashboard stats from source periodically, reporting drift
+    await user_interview_stats.start()
+    
     yield
     # Shutdown
     print("🔄 Shutting down AI Recruiter Pro API...")
+    await blob_gc.stop()
+    await user_interview_stats.stop()
+    await resume_job_queue.stop()
+    await question_speculator.stop()
+    await question_feed.stop()
+    parse_pool.shutdown()
+    await llm_gateway.close()
     await Database.close_db()
 
 
@@ -52,6 +82,7 @@ app.include_router(candidates_router)
 app.include_router(interviews_router)
 app.include_router(recruiters_router)
 app.include_router(resumes_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
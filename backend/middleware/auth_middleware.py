@@ -1,13 +1,16 @@
 """
 Authentication middleware for protecting routes
 """
-from fastapi import Request, HTTPException, status, Security, Depends
+from fastapi import Request, HTTPException, status, Security, Depends, Header, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from config import settings
 from services.firebase_service import FirebaseService
 from typing import Optional
+import hmac
 
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 firebase_service = FirebaseService()
 
 
@@ -105,6 +108,53 @@ async def get_current_user(
     return token_data
 
 
+async def get_current_user_for_stream(
+    token: Optional[str] = Query(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Security(optional_security)
+) -> dict:
+    """
+    Get current authenticated user for an event stream
+    
+    EventSource can't set headers, so like the interview WebSocket the
+    Firebase ID token may come as a ?token= query param instead of the
+    Authorization header.
+    
+    Args:
+        token: Firebase ID token from the query string
+        credentials: HTTP Bearer credentials, if sent
+        
+    Returns:
+        Decoded token with user info (uid, email, etc.)
+        
+    Raises:
+        HTTPException: 401 if no valid token was sent
+    """
+    id_token = credentials.credentials if credentials else token
+    if not id_token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        return firebase_service.verify_token(id_token)
+    except Exception:
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Require the shared operator secret for operational endpoints
+    
+    There is no admin role yet, so endpoints that run expensive maintenance
+    (reconciliation, garbage collection) need the X-Admin-Token header to
+    match ADMIN_API_TOKEN. They are disabled while that setting is empty.
+    
+    Raises:
+        HTTPException: 403 if the endpoints are disabled or the token doesn't match
+    """
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(status_code=403, detail="Operational endpoints are disabled (ADMIN_API_TOKEN not set)")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_API_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
 async def require_role(required_role: str):
     """
     Dependency to require specific user role
@@ -4,6 +4,7 @@ Resume model for storing parsed resume data
 from pydantic import BaseModel, EmailStr
 from typing import Optional, List, Dict
 from datetime import datetime
+from enum import Enum
 from bson import ObjectId
 
 
@@ -50,6 +51,7 @@ class Resume(BaseModel):
     raw_text: str  # Full extracted text
     filename: str
     file_path: str
+    blob_key: Optional[str] = None  # Content-addressed key in the blob store
     file_size: int
     uploaded_at: datetime = datetime.utcnow()
     
@@ -67,3 +69,23 @@ class ResumeUploadResponse(BaseModel):
     resume_id: str
     extracted_data: Dict
     can_start_interview: bool
+
+
+class ResumeJobStage(str, Enum):
+    """Resume parse job stages, in the order a job moves through them"""
+    QUEUED = "queued"
+    EXTRACTING = "extracting"
+    LLM = "llm"
+    SAVING = "saving"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ResumeJobAccepted(BaseModel):
+    """Response after a resume is accepted for background parsing"""
+    success: bool
+    message: str
+    job_id: str
+    stage: ResumeJobStage
+    status_url: str
+    events_url: str
@@ -4,6 +4,7 @@ Routes package - API endpoint handlers
 from .auth import router as auth_router
 from .candidates import router as candidates_router
 from .interviews import router as interviews_router
+from .metrics import router as metrics_router
 from .recruiters import router as recruiters_router
 from .resumes import router as resumes_router
 
@@ -11,6 +12,7 @@ __all__ = [
     "auth_router",
     "candidates_router",
     "interviews_router",
+    "metrics_router",
     "recruiters_router",
     "resumes_router",
 ]
@@ -2,18 +2,87 @@
 Interview routes - Interview management and WebSocket handler
 """
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from models.interview import InterviewCreate, InterviewSession, InterviewResponse, InterviewStatus
 from models.response import SuccessResponse
 from utils.database import Database
 from services.groq_service import groq_service
-from middleware.auth_middleware import get_current_user
+from services.interview_events import EVENT_KINDS, count_expression, interview_events
+from services.question_feed import QUESTIONS_COMPLETE, QUESTIONS_GENERATING, question_feed
+from services.question_speculation import INTERVIEW_QUESTION_COUNT, question_speculator
+from services.user_stats import user_interview_stats
+from middleware.auth_middleware import firebase_service, get_current_user
 from bson import ObjectId
 from datetime import datetime
+from typing import Optional
+import json
+import time
 import uuid
 
 router = APIRouter(prefix="/api/interviews", tags=["Interviews"])
 
+# Statuses in which answers, follow-ups and completion are accepted
+OPEN_STATUSES = [InterviewStatus.PENDING.value, InterviewStatus.IN_PROGRESS.value]
+
+# Target status -> statuses an interview may be moved to it from
+STATUS_TRANSITIONS = {
+    InterviewStatus.PENDING.value: [InterviewStatus.PENDING.value],
+    InterviewStatus.IN_PROGRESS.value: OPEN_STATUSES,
+    InterviewStatus.COMPLETED.value: OPEN_STATUSES,
+    InterviewStatus.CANCELLED.value: OPEN_STATUSES,
+}
+
+# Interview fields the dashboard stats need from a status change's previous document
+STATUS_PROJECTION = {"user_id": 1, "session_id": 1, "status": 1, "overall_score": 1, "duration": 1, "start_time": 1}
+
+# Interview fields needed to generate a follow-up question
+FOLLOW_UP_PROJECTION = {"job_role": 1, "questions.id": 1, "questions._id": 1, "questions.question": 1}
+
+
+def _owned(session_id: str, user_id: str, statuses: Optional[list] = None) -> dict:
+    """Filter matching the session only if the user owns it (and it is in one of the statuses)"""
+    query = {"session_id": session_id, "user_id": user_id}
+    if statuses is not None:
+        query["status"] = {"$in": statuses}
+    return query
+
+
+async def _rejection(session_id: str, user_id: str) -> HTTPException:
+    """
+    Why a conditional interview update or read matched nothing
+    
+    Only runs on the failure path, so the common case stays one round trip.
+    
+    Returns:
+        404 for an unknown session, 403 for another user's, 409 when its status doesn't allow the change
+    """
+    interview = await Database.db.interviews.find_one({"session_id": session_id}, {"user_id": 1, "status": 1})
+    if not interview:
+        return HTTPException(status_code=404, detail="Interview session not found")
+    if interview["user_id"] != user_id:
+        return HTTPException(status_code=403, detail="Access denied")
+    return HTTPException(status_code=409, detail=f"Interview is {interview.get('status')}")
+
+
+def _completion_fields(now: datetime) -> dict:
+    """Pipeline $set fields completing an interview; duration is computed from the stored start_time"""
+    return {
+        "status": InterviewStatus.COMPLETED.value,
+        "end_time": now,
+        "duration": {"$cond": [
+            {"$ifNull": ["$start_time", False]},
+            {"$toInt": {"$divide": [{"$subtract": [now, "$start_time"]}, 1000]}},
+            None
+        ]},
+        "updated_at": now
+    }
+
+
+def _duration(start_time: Optional[datetime], end_time: datetime) -> Optional[int]:
+    """Seconds between start and end, as _completion_fields stores it"""
+    return int((end_time - start_time).total_seconds()) if start_time else None
+
 
 @router.get("/user/stats")
 async def get_user_interview_stats(current_user: dict = Depends(get_current_user)):
@@ -21,66 +90,12 @@ async def get_user_interview_stats(current_user: dict = Depends(get_current_user
     Get interview statistics for the current user's dashboard
     """
     try:
-        db = Database.db
         user_id = current_user.get("uid") or current_user.get("id")
         
-        # Get all interviews for this user
-        interviews = await db.interviews.find({"user_id": user_id}).to_list(length=None)
-        
-        # Calculate statistics
-        total_interviews = len(interviews)
-        completed_interviews = len([i for i in interviews if i.get("status") == "completed"])
-        pending_interviews = len([i for i in interviews if i.get("status") in ["pending", "in_progress"]])
-        
-        # Calculate average score (if scores exist)
-        scores = []
-        for interview in interviews:
-            if interview.get("status") == "completed" and interview.get("overall_score"):
-                scores.append(interview.get("overall_score"))
-        
-        avg_score = sum(scores) / len(scores) if scores else 0
-        
-        # Count unique skills assessed
-        all_skills = set()
-        for interview in interviews:
-            questions = interview.get("questions", [])
-            for q in questions:
-                if q.get("category"):
-                    all_skills.add(q.get("category"))
-        
-        # Get recent interviews (last 5)
-        recent_interviews = sorted(
-            interviews,
-            key=lambda x: x.get("created_at", datetime.min),
-            reverse=True
-        )[:5]
-        
-        # Format recent interviews for frontend
-        formatted_recent = []
-        for interview in recent_interviews:
-            formatted_recent.append({
-                "id": str(interview.get("_id")),
-                "session_id": interview.get("session_id"),
-                "position": interview.get("job_role", "N/A"),
-                "date": interview.get("created_at").isoformat() if interview.get("created_at") else None,
-                "status": interview.get("status", "pending"),
-                "score": interview.get("overall_score"),
-                "duration": interview.get("duration"),
-                "responses_count": len(interview.get("responses", []))
-            })
-        
+        # Single read of the user's materialized stats (kept current by the routes below)
         return {
             "success": True,
-            "data": {
-                "stats": {
-                    "total_interviews": total_interviews,
-                    "completed_interviews": completed_interviews,
-                    "pending_interviews": pending_interviews,
-                    "average_score": round(avg_score, 1),
-                    "skills_assessed": len(all_skills)
-                },
-                "recent_interviews": formatted_recent
-            }
+            "data": await user_interview_stats.get(user_id)
         }
         
     except Exception as e:
@@ -115,37 +130,53 @@ async def start_interview(interview_data: InterviewCreate, current_user: dict =
         # Generate session ID
         session_id = str(uuid.uuid4())
         
-        # Generate interview questions using Groq
-        print(f"🤖 Generating questions for {interview_data.job_role}...")
-        questions = groq_service.generate_questions(
-            resume_data=resume,
-            job_role=interview_data.job_role,
-            num_questions=10
-        )
-        
-        # Create interview session
-        interview_session = {
-            "session_id": session_id,
-            "candidate_id": interview_data.candidate_id,
-            "user_id": user_id,
-            "job_role": interview_data.job_role,
-            "status": InterviewStatus.PENDING.value,
-            "questions": questions,
-            "responses": [],
-            "conversation_history": [],
-            "face_monitoring_logs": [],
-            "cheating_incidents": [],
-            "current_question_index": 0,
-            "resume_id": str(resume["_id"]),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        }
-        
-        # Save to database
-        result = await db.interviews.insert_one(interview_session)
+        # Use the questions speculated at upload time, or generate them now.
+        # Generated questions are streamed: the session is created as soon as
+        # the first one is complete and the rest are appended as they arrive.
+        questions = await question_speculator.claim(str(resume["_id"]), resume, interview_data.job_role)
+        remaining = None
+        try:
+            if questions is None:
+                print(f"🤖 Generating questions for {interview_data.job_role}...")
+                remaining = groq_service.stream_questions(
+                    resume_data=resume,
+                    job_role=interview_data.job_role,
+                    num_questions=INTERVIEW_QUESTION_COUNT
+                )
+                questions = [await anext(remaining)]
+            questions_status = QUESTIONS_GENERATING if remaining is not None else QUESTIONS_COMPLETE
+            
+            # Create interview session
+            interview_session = {
+                "session_id": session_id,
+                "candidate_id": interview_data.candidate_id,
+                "user_id": user_id,
+                "job_role": interview_data.job_role,
+                "status": InterviewStatus.PENDING.value,
+                "questions": questions,
+                "questions_status": questions_status,
+                "event_counts": {kind: 0 for kind in EVENT_KINDS},
+                "current_question_index": 0,
+                "resume_id": str(resume["_id"]),
+                "created_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow()
+            }
+            
+            # Save to database
+            result = await db.interviews.insert_one(interview_session)
+        except BaseException:
+            # The question stream holds an LLM slot until it is closed
+            if remaining is not None:
+                await remaining.aclose()
+            raise
         
         print(f"✅ Interview session created: {session_id}")
-        print(f"📝 Generated {len(questions)} questions")
+        if remaining is not None:
+            question_feed.start(session_id, remaining, user_id=user_id)
+            print(f"📝 First question ready, generating the rest in the background")
+        else:
+            print(f"📝 Generated {len(questions)} questions")
+        await user_interview_stats.interview_created(interview_session)
         
         return {
             "success": True,
@@ -153,6 +184,8 @@ async def start_interview(interview_data: InterviewCreate, current_user: dict =
             "data": {
                 "session_id": session_id,
                 "questions_count": len(questions),
+                "questions_status": questions_status,
+                "questions_events_url": f"{router.prefix}/{session_id}/questions/events",
                 "job_role": interview_data.job_role,
                 "status": "pending"
             }
@@ -165,16 +198,61 @@ async def start_interview(interview_data: InterviewCreate, current_user: dict =
         raise HTTPException(status_code=500, detail=f"Failed to start interview: {str(e)}")
 
 
+@router.get("/{session_id}/questions/events")
+async def stream_interview_questions(session_id: str):
+    """
+    Server-Sent Events stream of an interview's questions
+    
+    Emits a `question` event (index and question) for every question,
+    stored ones first and then each new one as generation completes it,
+    followed by a `complete` event with the final count, and closes. As with
+    resume parse jobs, the session id is an unguessable UUID returned only
+    to the candidate, so it doubles as the access token (EventSource can't
+    send auth headers).
+    """
+    interview = await Database.db.interviews.find_one({"session_id": session_id}, {"_id": 1})
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview session not found")
+    
+    async def event_stream():
+        async for item in question_feed.follow(session_id):
+            if item is None:
+                yield ": keep-alive\n\n"
+                continue
+            event, data = item
+            yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{session_id}")
-async def get_interview(session_id: str, current_user: dict = Depends(get_current_user)):
+async def get_interview(
+    session_id: str,
+    include_events: bool = False,
+    current_user: dict = Depends(get_current_user)
+):
     """
     Get interview details by session ID
+    
+    Event streams (responses, conversation history, face monitoring logs,
+    cheating incidents) are summarized as event_counts; pass
+    include_events=true to load them all, or page through one with
+    GET /{session_id}/events/{kind}.
     """
     try:
         db = Database.db
         
-        # Find interview session
-        interview = await db.interviews.find_one({"session_id": session_id})
+        # Find interview session, counting its events instead of loading them
+        results = await db.interviews.aggregate([
+            {"$match": {"session_id": session_id}},
+            {"$set": {"event_counts": {kind: count_expression(kind) for kind in EVENT_KINDS}}},
+            {"$project": {kind: 0 for kind in EVENT_KINDS}}
+        ]).to_list(length=1)
+        interview = results[0] if results else None
         
         if not interview:
             raise HTTPException(status_code=404, detail="Interview session not found")
@@ -189,6 +267,10 @@ async def get_interview(session_id: str, current_user: dict = Depends(get_curren
         if "resume_id" in interview:
             interview["resume_id"] = str(interview["resume_id"])
         
+        if include_events:
+            for kind in EVENT_KINDS:
+                interview[kind] = await interview_events.get_events(session_id, kind)
+        
         return {
             "success": True,
             "data": interview
@@ -201,9 +283,48 @@ async def get_interview(session_id: str, current_user: dict = Depends(get_curren
         raise HTTPException(status_code=500, detail=f"Failed to fetch interview: {str(e)}")
 
 
+@router.get("/{session_id}/events/{kind}")
+async def get_interview_events(
+    session_id: str,
+    kind: str,
+    offset: int = 0,
+    limit: int = 100,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Page through one of an interview's event streams, oldest first
+    
+    Only the buckets covering the requested page are read.
+    """
+    try:
+        if kind not in EVENT_KINDS:
+            raise HTTPException(status_code=404, detail=f"Unknown event stream: {kind}")
+        if offset < 0 or not 0 < limit <= 1000:
+            raise HTTPException(status_code=400, detail="offset must be >= 0 and limit between 1 and 1000")
+        
+        user_id = current_user.get("uid") or current_user.get("id")
+        interview = await Database.db.interviews.find_one({"session_id": session_id}, {"user_id": 1})
+        if not interview:
+            raise HTTPException(status_code=404, detail="Interview session not found")
+        if interview["user_id"] != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
+        
+        events = await interview_events.get_events(session_id, kind, offset=offset, limit=limit)
+        return {
+            "success": True,
+            "data": {"kind": kind, "offset": offset, "events": events}
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Error fetching interview events: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch interview events: {str(e)}")
+
+
 class StatusUpdate(BaseModel):
     """Status update model"""
-    status: str
+    status: InterviewStatus
 
 
 @router.put("/{session_id}/status")
@@ -215,41 +336,32 @@ async def update_interview_status(
     """
     Update interview status (e.g., from 'pending' to 'in_progress')
     """
-    status = status_data.status
+    status = status_data.status.value
     try:
-        db = Database.db
-        
-        # Find interview
-        interview = await db.interviews.find_one({"session_id": session_id})
-        
-        if not interview:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-        
         user_id = current_user.get("uid") or current_user.get("id")
-        if interview["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Access denied")
-        
-        # Update status
-        update_data = {
-            "status": status,
-            "updated_at": datetime.utcnow()
-        }
-        
-        # If starting interview, set start_time
-        if status == "in_progress" and not interview.get("start_time"):
-            update_data["start_time"] = datetime.utcnow()
-        
-        # If completing interview, set end_time
-        if status == "completed" and not interview.get("end_time"):
-            update_data["end_time"] = datetime.utcnow()
-            if interview.get("start_time"):
-                duration = (update_data["end_time"] - interview["start_time"]).total_seconds()
-                update_data["duration"] = int(duration)
-        
-        await db.interviews.update_one(
-            {"session_id": session_id},
-            {"$set": update_data}
+        now = datetime.utcnow()
+        
+        # One conditional update: ownership and the allowed transition are part of the filter
+        if status == InterviewStatus.COMPLETED.value:
+            update_data = _completion_fields(now)
+        else:
+            update_data = {"status": status, "updated_at": now}
+            if status == InterviewStatus.IN_PROGRESS.value:
+                # Starting keeps the first start_time
+                update_data["start_time"] = {"$ifNull": ["$start_time", now]}
+        
+        before = await Database.db.interviews.find_one_and_update(
+            _owned(session_id, user_id, STATUS_TRANSITIONS[status]),
+            [{"$set": update_data}],
+            projection=STATUS_PROJECTION
         )
+        if before is None:
+            raise await _rejection(session_id, user_id)
+        
+        after = {**before, "status": status}
+        if status == InterviewStatus.COMPLETED.value:
+            after["duration"] = _duration(before.get("start_time"), now)
+        await user_interview_stats.status_changed(before, after)
         
         return {
             "success": True,
@@ -282,17 +394,7 @@ async def submit_answer(
     Submit an answer to a question during the interview
     """
     try:
-        db = Database.db
-        
-        # Find interview
-        interview = await db.interviews.find_one({"session_id": session_id})
-        
-        if not interview:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-        
         user_id = current_user.get("uid") or current_user.get("id")
-        if interview["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Access denied")
         
         # Create response object
         response_obj = {
@@ -303,14 +405,14 @@ async def submit_answer(
             "timestamp": datetime.utcnow()
         }
         
-        # Add to responses array
-        await db.interviews.update_one(
-            {"session_id": session_id},
-            {
-                "$push": {"responses": response_obj},
-                "$set": {"updated_at": datetime.utcnow()}
-            }
+        # Append to the responses stream, only on the user's own open interview
+        appended = await interview_events.append(
+            session_id, "responses", [response_obj], match=_owned(session_id, user_id, OPEN_STATUSES)
         )
+        if appended is None:
+            raise await _rejection(session_id, user_id)
+        
+        await user_interview_stats.answer_added(user_id, session_id)
         
         print(f"✅ Answer submitted for session {session_id}")
         
@@ -327,6 +429,33 @@ async def submit_answer(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _find_original_question(interview: dict, question_id: str) -> Optional[str]:
+    """Text of the question a follow-up is about, by question id or else by index"""
+    for q in interview.get("questions", []):
+        q_id = q.get("_id") or q.get("id")
+        if str(q_id) == question_id:
+            return q.get("question")
+    
+    # Try matching by index
+    try:
+        idx = int(question_id)
+        if 0 <= idx < len(interview.get("questions", [])):
+            return interview["questions"][idx].get("question")
+    except (ValueError, IndexError):
+        pass
+    return None
+
+
+async def _log_follow_up(session_id: str, follow_up_question: str, **timings):
+    """Append a generated follow-up (and how long it took) to the conversation history"""
+    await interview_events.append(session_id, "conversation_history", [{
+        "type": "follow_up",
+        "question": follow_up_question,
+        "timestamp": datetime.utcnow(),
+        **timings
+    }])
+
+
 class FollowUpRequest(BaseModel):
     """Follow-up question request model"""
     question_id: str
@@ -343,57 +472,29 @@ async def generate_follow_up(
     Generate a follow-up question based on the candidate's answer
     """
     try:
-        db = Database.db
-        
-        # Find interview
-        interview = await db.interviews.find_one({"session_id": session_id})
+        user_id = current_user.get("uid") or current_user.get("id")
         
+        # Only the question texts and role, from the user's own open interview
+        interview = await Database.db.interviews.find_one(
+            _owned(session_id, user_id, OPEN_STATUSES), FOLLOW_UP_PROJECTION
+        )
         if not interview:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-        
-        user_id = current_user.get("uid") or current_user.get("id")
-        if interview["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Access denied")
+            raise await _rejection(session_id, user_id)
         
         # Find the original question
-        original_question = None
-        for q in interview.get("questions", []):
-            q_id = q.get("_id") or q.get("id")
-            if str(q_id) == follow_up_data.question_id:
-                original_question = q.get("question")
-                break
-        
-        if not original_question:
-            # Try matching by index
-            try:
-                idx = int(follow_up_data.question_id)
-                if 0 <= idx < len(interview.get("questions", [])):
-                    original_question = interview["questions"][idx].get("question")
-            except (ValueError, IndexError):
-                pass
+        original_question = _find_original_question(interview, follow_up_data.question_id)
         
         # Generate follow-up using Groq
         print(f"🤖 Generating follow-up question...")
-        follow_up_question = groq_service.generate_follow_up_question(
+        started = time.perf_counter()
+        follow_up_question = await groq_service.generate_follow_up_question(
             original_question=original_question or "the previous question",
             candidate_answer=follow_up_data.answer,
             job_role=interview.get("job_role", "")
         )
         
         # Log follow-up to conversation history
-        await db.interviews.update_one(
-            {"session_id": session_id},
-            {
-                "$push": {
-                    "conversation_history": {
-                        "type": "follow_up",
-                        "question": follow_up_question,
-                        "timestamp": datetime.utcnow()
-                    }
-                },
-                "$set": {"updated_at": datetime.utcnow()}
-            }
-        )
+        await _log_follow_up(session_id, follow_up_question, total_ms=round((time.perf_counter() - started) * 1000))
         
         print(f"✅ Follow-up question generated")
         
@@ -418,35 +519,21 @@ async def complete_interview(
     Mark interview as completed and trigger report generation
     """
     try:
-        db = Database.db
-        
-        # Find interview
-        interview = await db.interviews.find_one({"session_id": session_id})
-        
-        if not interview:
-            raise HTTPException(status_code=404, detail="Interview session not found")
-        
         user_id = current_user.get("uid") or current_user.get("id")
-        if interview["user_id"] != user_id:
-            raise HTTPException(status_code=403, detail="Access denied")
         
-        # Calculate duration if start_time exists
+        # Complete the user's own open interview; duration is computed by the update itself
         end_time = datetime.utcnow()
-        duration = None
-        if interview.get("start_time"):
-            duration = int((end_time - interview["start_time"]).total_seconds())
-        
-        # Update interview status
-        await db.interviews.update_one(
-            {"session_id": session_id},
-            {
-                "$set": {
-                    "status": InterviewStatus.COMPLETED.value,
-                    "end_time": end_time,
-                    "duration": duration,
-                    "updated_at": end_time
-                }
-            }
+        before = await Database.db.interviews.find_one_and_update(
+            _owned(session_id, user_id, OPEN_STATUSES),
+            [{"$set": _completion_fields(end_time)}],
+            projection={**STATUS_PROJECTION, "responses_count": count_expression("responses")}
+        )
+        if before is None:
+            raise await _rejection(session_id, user_id)
+        
+        duration = _duration(before.get("start_time"), end_time)
+        await user_interview_stats.status_changed(
+            before, {**before, "status": InterviewStatus.COMPLETED.value, "duration": duration}
         )
         
         print(f"✅ Interview {session_id} marked as completed")
@@ -460,7 +547,7 @@ async def complete_interview(
             "data": {
                 "session_id": session_id,
                 "duration": duration,
-                "responses_count": len(interview.get("responses", []))
+                "responses_count": before["responses_count"]
             }
         }
         
@@ -471,13 +558,94 @@ async def complete_interview(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _authorize_socket(websocket: WebSocket, session_id: str, token: Optional[str]) -> Optional[dict]:
+    """
+    Check the socket's token against the interview's owner
+    
+    Closes the socket (4401 bad token, 4404 unknown session, 4403 not the
+    owner) and returns None when the caller may not use this interview.
+    """
+    try:
+        user = firebase_service.verify_token(token) if token else None
+    except Exception:
+        user = None
+    if not user:
+        await websocket.close(code=4401, reason="Invalid authentication credentials")
+        return None
+    
+    interview = await Database.db.interviews.find_one({"session_id": session_id}, {"user_id": 1})
+    if not interview:
+        await websocket.close(code=4404, reason="Interview session not found")
+        return None
+    if interview["user_id"] != (user.get("uid") or user.get("id")):
+        await websocket.close(code=4403, reason="Access denied")
+        return None
+    return interview
+
+
+async def _stream_follow_up(websocket: WebSocket, session_id: str, user_id: str, data: dict):
+    """
+    Stream a follow-up question to the socket token by token
+    
+    Sends "follow_up_token" messages as the text arrives, then persists the
+    final text to conversation_history and sends "follow_up_done" with it
+    and its time to first token / total time. Like POST /follow-up, only
+    the user's own open interview gets one; otherwise an "error" message
+    says why.
+    """
+    interview = await Database.db.interviews.find_one(
+        _owned(session_id, user_id, OPEN_STATUSES), FOLLOW_UP_PROJECTION
+    )
+    if not interview:
+        rejection = await _rejection(session_id, user_id)
+        await websocket.send_json({"type": "error", "status": rejection.status_code, "message": rejection.detail})
+        return
+    original_question = _find_original_question(interview, str(data.get("question_id", "")))
+    
+    started = time.perf_counter()
+    first_token_ms = None
+    parts = []
+    stream = groq_service.stream_follow_up_question(
+        original_question=original_question or "the previous question",
+        candidate_answer=data.get("answer", ""),
+        job_role=interview.get("job_role", "")
+    )
+    try:
+        async for piece in stream:
+            if first_token_ms is None:
+                first_token_ms = round((time.perf_counter() - started) * 1000)
+            parts.append(piece)
+            await websocket.send_json({"type": "follow_up_token", "token": piece})
+    finally:
+        await stream.aclose()
+    total_ms = round((time.perf_counter() - started) * 1000)
+    
+    follow_up_question = "".join(parts).strip().strip('"\'')
+    await _log_follow_up(session_id, follow_up_question, ttft_ms=first_token_ms, total_ms=total_ms, streamed=True)
+    await websocket.send_json({
+        "type": "follow_up_done",
+        "follow_up": follow_up_question,
+        "ttft_ms": first_token_ms,
+        "total_ms": total_ms
+    })
+    print(f"✅ Follow-up streamed for session {session_id} (first token {first_token_ms}ms, total {total_ms}ms)")
+
+
 @router.websocket("/ws/{session_id}")
-async def websocket_interview(websocket: WebSocket, session_id: str):
+async def websocket_interview(websocket: WebSocket, session_id: str, token: Optional[str] = None):
     """
     WebSocket endpoint for real-time interview communication
     Handles video frames, audio, and bidirectional messaging
+    
+    Connect with ?token=<Firebase ID token> (browsers can't set headers on a
+    WebSocket). Send {"type": "follow_up_request", "question_id", "answer"}
+    to get a follow-up question streamed back as "follow_up_token" messages
+    and a final "follow_up_done".
     """
     await websocket.accept()
+    owner = await _authorize_socket(websocket, session_id, token)
+    if owner is None:
+        return
     
     try:
         # TODO: Implement WebSocket interview logic
@@ -501,6 +669,10 @@ async def websocket_interview(websocket: WebSocket, session_id: str):
                 # Process audio response
                 pass
             
+            elif message_type == "follow_up_request":
+                # Stream an adaptive follow-up to the candidate's answer
+                await _stream_follow_up(websocket, session_id, owner["user_id"], data)
+            
             elif message_type == "end_interview":
                 # End interview and generate report
                 break
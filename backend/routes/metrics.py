@@ -0,0 +1,112 @@
+"""
+Metrics routes - Operational counters for caches, pools and LLM usage
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from middleware.auth_middleware import require_admin_token
+from services.blob_gc import blob_gc
+from services.llm_gateway import llm_gateway
+from services.llm_router import llm_router
+from services.model_cascade import model_cascade_metrics
+from services.parse_cache import resume_parse_cache
+from services.parse_pool import parse_pool
+from services.question_cache import question_set_cache
+from services.question_speculation import question_speculator
+from services.resume_parser import resume_parser
+from services.user_stats import user_interview_stats
+
+router = APIRouter(prefix="/api/metrics", tags=["Metrics"])
+
+
+@router.get("/resume-parsing")
+async def get_resume_parsing_metrics():
+    """
+    Resume parse cache hit/miss counters, parse pool occupancy,
+    LLM token/latency totals for extraction calls (overall and per model)
+    and fast-vs-full model cascade agreement
+    """
+    llm = dict(resume_parser.llm_stats)
+    calls = llm["calls"]
+    llm["avg_prompt_tokens"] = round(llm["prompt_tokens"] / calls) if calls else 0
+    llm["avg_latency_ms"] = round(llm["llm_latency_ms"] / calls) if calls else 0
+    llm["by_model"] = {
+        model: {**stats, "avg_latency_ms": round(stats["llm_latency_ms"] / stats["calls"]) if stats["calls"] else 0}
+        for model, stats in resume_parser.model_stats.items()
+    }
+    
+    return {
+        "success": True,
+        "data": {
+            "cache": resume_parse_cache.stats(),
+            "pool": parse_pool.stats(),
+            "llm": llm,
+            "cascade": model_cascade_metrics.stats()
+        }
+    }
+
+
+@router.get("/llm")
+async def get_llm_metrics():
+    """
+    LLM gateway occupancy, per-provider rate limit state and per-caller
+    queue wait, latency and token totals, plus the router's backend health
+    and where each call class is currently sent
+    """
+    return {
+        "success": True,
+        "data": {**llm_gateway.stats(), "router": llm_router.stats()}
+    }
+
+
+@router.get("/questions")
+async def get_question_cache_metrics():
+    """Interview question set cache hit/miss counters and speculative generation outcomes"""
+    return {
+        "success": True,
+        "data": {
+            "cache": question_set_cache.stats(),
+            "speculation": question_speculator.stats()
+        }
+    }
+
+
+@router.get("/storage")
+async def get_storage_metrics():
+    """Blob store garbage collection totals and the last sweep's report"""
+    return {
+        "success": True,
+        "data": {
+            "backend": type(blob_gc.store).__name__,
+            "gc": blob_gc.stats()
+        }
+    }
+
+
+@router.post("/storage/gc", dependencies=[Depends(require_admin_token)])
+async def run_blob_gc():
+    """Run a blob garbage collection sweep now and return its report (needs X-Admin-Token)"""
+    try:
+        report = await blob_gc.collect()
+        return {"success": True, "data": report}
+    except Exception as e:
+        print(f"❌ Error running blob GC: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to run blob GC: {str(e)}")
+
+
+@router.get("/user-stats")
+async def get_user_stats_metrics():
+    """Materialized dashboard stats read/build counters and the last reconciliation report"""
+    return {
+        "success": True,
+        "data": user_interview_stats.stats()
+    }
+
+
+@router.post("/user-stats/reconcile", dependencies=[Depends(require_admin_token)])
+async def run_user_stats_reconciliation():
+    """Rebuild every user's dashboard stats from source now and return the drift report (needs X-Admin-Token)"""
+    try:
+        report = await user_interview_stats.reconcile()
+        return {"success": True, "data": report}
+    except Exception as e:
+        print(f"❌ Error reconciling user stats: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to reconcile user stats: {str(e)}")
@@ -1,204 +1,103 @@
 """
 Resume upload and management routes
 """
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
-from fastapi.responses import JSONResponse
-from typing import Optional
-import os
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
+import uuid
 from datetime import datetime
 from pathlib import Path
-import shutil
+import json
 
-from models.resume import Resume, ResumeUploadResponse
-from services.resume_parser import resume_parser
-from middleware.auth_middleware import get_current_user
+from models.resume import ResumeJobAccepted, ResumeJobStage
+from services.blob_store import blob_store
+from services.resume_jobs import resume_job_queue
+from middleware.auth_middleware import get_current_user, get_current_user_for_stream
 from utils.database import Database
+from utils.upload_stream import UploadRejectedError, receive_upload
 from config import settings
-from typing import Optional
 
 
 router = APIRouter(prefix="/api/resumes", tags=["resumes"])
 
-# Ensure upload directory exists
-UPLOAD_DIR = Path(settings.UPLOAD_DIR) / "resumes"
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def validate_file(file: UploadFile) -> tuple[bool, Optional[str]]:
-    """Validate uploaded file"""
-    # Check file extension
-    file_ext = Path(file.filename).suffix.lower()
-    allowed_extensions = ['.pdf', '.docx', '.doc']
-    
-    if file_ext not in allowed_extensions:
-        return False, f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
-    
-    # Check file size (read first chunk to estimate)
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-    
-    max_size = 10 * 1024 * 1024  # 10MB
-    if file_size > max_size:
-        return False, f"File too large. Maximum size: {max_size // (1024*1024)}MB"
-    
-    return True, None
-
-
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-
-security = HTTPBearer(auto_error=False)  # Don't auto-error if no token
-
-
-async def get_optional_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
-) -> Optional[dict]:
-    """
-    Get current user if authenticated, otherwise return None
-    This allows the endpoint to work with or without authentication
-    """
-    if not credentials:
-        print("⚠️ No authentication credentials provided")
-        return None
-    
-    try:
-        from services.firebase_service import FirebaseService
-        firebase_service = FirebaseService()
-        token = credentials.credentials
-        decoded_token = firebase_service.verify_token(token)
-        print(f"✅ User authenticated: {decoded_token.get('uid')}")
-        return decoded_token
-    except Exception as e:
-        print(f"⚠️ Authentication failed: {e}")
-        return None
+# Request body schema for /upload, which parses multipart itself
+UPLOAD_REQUEST_SCHEMA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file", "job_role"],
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "job_role": {"type": "string"}
+                    }
+                }
+            }
+        }
+    }
+}
 
 
-@router.post("/upload", response_model=ResumeUploadResponse)
+@router.post("/upload", response_model=ResumeJobAccepted, status_code=202, openapi_extra=UPLOAD_REQUEST_SCHEMA)
 async def upload_resume(
-    file: UploadFile = File(...),
-    job_role: str = Form(...),
-    current_user: Optional[dict] = Depends(get_optional_current_user)
+    request: Request,
+    current_user: dict = Depends(get_current_user)
 ):
     """
-    Upload and parse a resume
+    Upload a resume and queue it for parsing
     
-    - **file**: PDF or DOCX resume file (max 10MB)
+    - **file**: PDF or DOCX resume file (max MAX_FILE_SIZE, 10MB by default)
     - **job_role**: Target job role for the interview
-    - Returns parsed resume data and resume_id
+    - The body is streamed straight to disk; oversized files are refused
+      with 413 as soon as the limit is crossed
+    - Returns 202 with a job_id; follow progress at `events_url` (SSE) or
+      poll `status_url`, authenticated as the uploader. The finished job
+      carries the ResumeUploadResponse.
     """
     try:
-        # Debug: Log authentication
-        print(f"🔐 Attempting resume upload...")
-        print(f"🔐 Current user type: {type(current_user)}")
-        print(f"🔐 Current user: {current_user}")
-        
-        # Extract user ID safely
-        user_id = "unknown"
-        if current_user and isinstance(current_user, dict):
-            user_id = current_user.get("uid") or current_user.get("user_id") or current_user.get("sub") or "unknown"
-            print(f"✅ User ID extracted: {user_id}")
-        else:
-            print(f"⚠️ Warning: current_user is not a valid dict, using 'unknown' as user_id")
-        
-        # Validate file
-        is_valid, error_msg = validate_file(file)
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        # Generate unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_ext = Path(file.filename).suffix
-        filename = f"{user_id}_{timestamp}{file_ext}"
-        file_path = UPLOAD_DIR / filename
-        
-        # Save file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # Parse resume
-        print(f"📄 Parsing resume: {filename}")
-        parsed_data = resume_parser.parse(str(file_path))
-        
-        # Delete previous resumes for this user (keep only the latest)
-        resumes_collection = Database.get_collection("resumes")
-        previous_resumes = await resumes_collection.find({"user_id": user_id}).to_list(length=None)
-        
-        if previous_resumes:
-            print(f"🗑️ Found {len(previous_resumes)} previous resume(s) for user {user_id}")
-            for old_resume in previous_resumes:
-                # Delete old resume file from disk
-                # old_file_path = Path(old_resume.get("file_path", ""))
-                # if old_file_path.exists():
-                #     try:
-                #         old_file_path.unlink()
-                #         print(f"   ✅ Deleted old file: {old_file_path.name}")
-                #     except Exception as e:
-                #         print(f"   ⚠️ Could not delete old file {old_file_path.name}: {e}")
-                
-                # Delete old resume from database
-                await resumes_collection.delete_one({"_id": old_resume["_id"]})
-                print(f"   ✅ Deleted old resume from database: {old_resume['_id']}")
-        
-        # Create resume document with all extracted fields
-        resume_data = {
-            "user_id": user_id,
-            "full_name": parsed_data.get("name", "Unknown"),
-            "email": parsed_data.get("email"),
-            "phone": parsed_data.get("phone"),
-            "skills": parsed_data.get("skills", []),
-            "experience": parsed_data.get("experience", []),
-            "education": parsed_data.get("education", []),
-            "certifications": parsed_data.get("certifications", []),
-            "projects": parsed_data.get("projects", []),
-            "achievements": parsed_data.get("achievements", []),
-            "languages": parsed_data.get("languages", []),
-            "publications": parsed_data.get("publications", []),
-            "volunteer": parsed_data.get("volunteer", []),
-            "summary": parsed_data.get("summary"),
-            "job_role": job_role,
-            "linkedin": parsed_data.get("linkedin"),
-            "github": parsed_data.get("github"),
-            "portfolio": parsed_data.get("portfolio"),
-            "raw_text": parsed_data.get("raw_text", ""),
-            "filename": filename,
-            "file_path": str(file_path),
-            "file_size": file_path.stat().st_size,
-            "uploaded_at": datetime.utcnow()
-        }
+        user_id = current_user.get("uid")
         
-        # Save new resume to database
-        result = await resumes_collection.insert_one(resume_data)
-        resume_id = str(result.inserted_id)
-        
-        print(f"✅ Resume saved with ID: {resume_id}")
-        print(f"✅ Saved with user_id: {resume_data['user_id']}")
-        
-        # Prepare response with all extracted data
-        extracted_data = {
-            "name": resume_data["full_name"],
-            "email": resume_data["email"],
-            "phone": resume_data["phone"],
-            "skills": resume_data["skills"],
-            "experience": resume_data["experience"],  # Full experience array
-            "education": resume_data["education"],    # Full education array
-            "certifications": resume_data["certifications"],
-            "projects": resume_data["projects"],
-            "achievements": resume_data["achievements"],
-            "languages": resume_data["languages"],
-            "publications": resume_data["publications"],
-            "volunteer": resume_data["volunteer"],
-            "summary": resume_data["summary"],
-            "linkedin": resume_data["linkedin"],
-            "github": resume_data["github"],
-            "portfolio": resume_data["portfolio"]
-        }
+        # Stream the file to staging, validating type and size and hashing as it arrives
+        try:
+            upload = await receive_upload(
+                request,
+                file_field="file",
+                dest_dir=blob_store.staging_dir,
+                dest_stem=uuid.uuid4().hex,
+                allowed_extensions=settings.ALLOWED_FILE_TYPES,
+                max_size=settings.MAX_FILE_SIZE
+            )
+        except UploadRejectedError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+        
+        job_role = upload["fields"].get("job_role", "").strip()
+        if not job_role:
+            upload["file_path"].unlink(missing_ok=True)
+            raise HTTPException(status_code=400, detail="job_role is required")
+        
+        # Store under its content hash; identical files share one blob
+        blob_key = blob_store.key_for(upload["content_hash"], upload["file_path"].suffix)
+        if not await blob_store.put(upload["file_path"], blob_key):
+            print(f"♻️ Reusing stored blob {blob_key}")
+        
+        # Parsing happens on the background job workers
+        job_id = await resume_job_queue.enqueue(
+            user_id=user_id,
+            job_role=job_role,
+            filename=upload["original_filename"],
+            blob_key=blob_key,
+            file_size=upload["file_size"],
+            content_hash=upload["content_hash"]
+        )
         
-        return ResumeUploadResponse(
+        return ResumeJobAccepted(
             success=True,
-            message="Resume uploaded and parsed successfully!",
-            resume_id=resume_id,
-            extracted_data=extracted_data,
-            can_start_interview=len(resume_data["skills"]) > 0
+            message="Resume uploaded. Parsing has started.",
+            job_id=job_id,
+            stage=ResumeJobStage.QUEUED,
+            status_url=f"{router.prefix}/jobs/{job_id}",
+            events_url=f"{router.prefix}/jobs/{job_id}/events"
         )
         
     except HTTPException:
@@ -208,6 +107,72 @@ async def upload_resume(
         raise HTTPException(status_code=500, detail=f"Failed to upload resume: {str(e)}")
 
 
+async def _owned_job(job_id: str, current_user: dict) -> dict:
+    """The parse job, if the current user uploaded it (404 / 403 otherwise)"""
+    job = await resume_job_queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Parse job not found")
+    if job.get("user_id") != current_user.get("uid"):
+        raise HTTPException(status_code=403, detail="Not authorized to access this parse job")
+    return job
+
+
+@router.get("/jobs/{job_id}")
+async def get_parse_job(job_id: str, current_user: dict = Depends(get_current_user)):
+    """
+    Current state of a resume parse job
+    
+    Only the uploader can read it; the result carries the parsed resume.
+    """
+    try:
+        job = await _owned_job(job_id, current_user)
+        
+        return {
+            "success": True,
+            "data": {
+                "job_id": job["_id"],
+                "stage": job["stage"],
+                "stages": [{"stage": entry["stage"], "at": entry["at"].isoformat()} for entry in job["stages"]],
+                "result": job.get("result"),
+                "error": job.get("error")
+            }
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Error fetching parse job: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch parse job: {str(e)}")
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_parse_job(job_id: str, current_user: dict = Depends(get_current_user_for_stream)):
+    """
+    Server-Sent Events stream of a resume parse job
+    
+    Emits a `stage` event for each transition (queued, extracting, llm,
+    saving, done), then either a `result` event carrying the
+    ResumeUploadResponse or a `failed` event, and closes. Only the uploader
+    can follow it; pass the ID token as ?token= (EventSource can't set
+    headers).
+    """
+    await _owned_job(job_id, current_user)
+    
+    async def event_stream():
+        async for item in resume_job_queue.follow(job_id):
+            if item is None:
+                yield ": keep-alive\n\n"
+                continue
+            event, data = item
+            yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/profile")
 async def get_user_profile(current_user: dict = Depends(get_current_user)):
     """Get user profile data from latest resume"""
@@ -229,9 +194,6 @@ async def get_user_profile(current_user: dict = Depends(get_current_user)):
         )
         
         if not resume:
-            # Debug: Check all user_ids in database
-            all_resumes = await resumes_collection.find({}, {"user_id": 1}).to_list(length=10)
-            print(f"🔍 Sample user_ids in database: {[r.get('user_id') for r in all_resumes]}")
             raise HTTPException(status_code=404, detail="No resume found. Please upload a resume first.")
         
         # Convert ObjectId to string
@@ -281,10 +243,11 @@ async def update_user_profile(
         if not update_data:
             raise HTTPException(status_code=400, detail="No valid fields to update")
         
-        # Update the resume
+        # Update the resume (profile_edited_at stops a background model
+        # upgrade from overwriting the user's edits)
         result = await resumes_collection.update_one(
             {"_id": resume["_id"]},
-            {"$set": update_data}
+            {"$set": {**update_data, "profile_edited_at": datetime.utcnow()}}
         )
         
         if result.modified_count == 0:
@@ -374,10 +337,12 @@ async def delete_resume(
         if resume.get("user_id") != current_user.get("uid"):
             raise HTTPException(status_code=403, detail="Not authorized to delete this resume")
         
-        # Delete file if exists
-        file_path = Path(resume.get("file_path", ""))
-        if file_path.exists():
-            file_path.unlink()
+        # Blobs can be shared by several resumes, so stored uploads are left
+        # to the blob GC; only pre-blob-store files are deleted here
+        if not resume.get("blob_key") and resume.get("file_path"):
+            file_path = Path(resume["file_path"])
+            if file_path.is_file():
+                file_path.unlink()
         
         # Delete from database
         await resumes_collection.delete_one({"_id": ObjectId(resume_id)})
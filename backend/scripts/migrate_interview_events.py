@@ -0,0 +1,51 @@
+"""
+Migration - move embedded interview event arrays into interview_event_buckets
+
+Interviews created before the bucket store keep responses,
+conversation_history, face_monitoring_logs and cheating_incidents as
+arrays in the interview document. This moves them into bucket documents
+(see services/interview_events.py) and removes the arrays. The API reads
+both layouts, so it can run while the API is serving, and re-running it
+is safe.
+
+Usage (from the backend directory):
+    python scripts/migrate_interview_events.py --mongodb-uri mongodb://localhost:27017
+    python scripts/migrate_interview_events.py --session-id <session_id>
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import settings  # noqa: E402
+from services.interview_events import interview_events  # noqa: E402
+from utils.database import Database  # noqa: E402
+from utils.indexes import INDEXES, apply_indexes  # noqa: E402
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mongodb-uri", default=settings.MONGODB_URI)
+    parser.add_argument("--session-id", help="Migrate only this interview")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    settings.MONGODB_URI = args.mongodb_uri
+    await Database.connect_db()
+    try:
+        # Buckets are keyed by the unique {session_id, kind, seq} index
+        await apply_indexes({"interview_event_buckets": INDEXES["interview_event_buckets"]})
+        if args.session_id:
+            moved = await interview_events.migrate(args.session_id)
+            print(f"✅ Session {args.session_id}: {moved or 'nothing to migrate'}")
+        else:
+            totals = await interview_events.migrate_all(batch_size=args.batch_size)
+            print(f"✅ Migrated {totals.pop('interviews')} interviews: {totals or 'no embedded events'}")
+    finally:
+        await Database.close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,200 @@
+"""
+Blob garbage collector - Remove stored uploads that no resume or pending job references
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from config import settings
+from models.resume import ResumeJobStage
+from services.blob_store import BlobStore, blob_store
+from utils.database import Database
+
+
+class BlobGarbageCollector:
+    """
+    Periodic sweep of the blob store
+
+    Reference counts come from the `resumes` collection (documents per
+    blob_key). Blobs with no resume and no unfinished parse job pointing at
+    them are deleted once they are older than the grace period, which
+    covers the window between an upload landing in the store and its parse
+    job being recorded.
+
+    Uploads saved before the blob store (uploads/resumes/*, referenced by
+    a resume's file_path and no blob_key) are swept the same way, so files
+    of replaced resumes don't stay behind.
+    """
+
+    def __init__(self, store: BlobStore, interval_seconds: int, grace_seconds: int,
+                 legacy_dir: Optional[str] = None):
+        """
+        Args:
+            store: Blob store to sweep
+            interval_seconds: Seconds between sweeps (0 disables the background task)
+            grace_seconds: Minimum age of an unreferenced blob before it is deleted
+            legacy_dir: Directory of pre-blob-store uploads to sweep too (None skips it)
+        """
+        self.store = store
+        self.legacy_dir = Path(legacy_dir) if legacy_dir else None
+        self.interval_seconds = interval_seconds
+        self.grace_seconds = grace_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.total_removed = 0
+        self.total_reclaimed_bytes = 0
+        self.last_run: Optional[Dict] = None
+
+    async def start(self):
+        """Start the periodic sweep"""
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._loop())
+            print(f"✅ Blob GC scheduled every {self.interval_seconds}s")
+
+    async def stop(self):
+        """Cancel the periodic sweep"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.collect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Blob GC failed: {e}")
+
+    async def refcounts(self) -> Dict[str, int]:
+        """Number of resume documents referencing each blob"""
+        pipeline = [
+            {"$match": {"blob_key": {"$type": "string"}}},
+            {"$group": {"_id": "$blob_key", "count": {"$sum": 1}}}
+        ]
+        cursor = Database.get_collection("resumes").aggregate(pipeline)
+        return {doc["_id"]: doc["count"] async for doc in cursor}
+
+    async def _pending_job_keys(self) -> Set[str]:
+        """Blobs still needed by queued or running parse jobs"""
+        finished = [ResumeJobStage.DONE.value, ResumeJobStage.FAILED.value]
+        keys = await Database.get_collection("resume_parse_jobs").distinct(
+            "blob_key", {"stage": {"$nin": finished}, "blob_key": {"$type": "string"}}
+        )
+        return set(keys)
+
+    async def _still_referenced(self, key: str) -> bool:
+        """Whether a resume or an unfinished parse job references the blob right now"""
+        if await Database.get_collection("resumes").count_documents({"blob_key": key}, limit=1):
+            return True
+        finished = [ResumeJobStage.DONE.value, ResumeJobStage.FAILED.value]
+        return bool(await Database.get_collection("resume_parse_jobs").count_documents(
+            {"blob_key": key, "stage": {"$nin": finished}}, limit=1
+        ))
+
+    async def _legacy_references(self) -> Set[Path]:
+        """Pre-blob-store upload paths still used by a resume or an unfinished job"""
+        finished = [ResumeJobStage.DONE.value, ResumeJobStage.FAILED.value]
+        paths = await Database.get_collection("resumes").distinct("file_path", {"blob_key": None})
+        paths += await Database.get_collection("resume_parse_jobs").distinct(
+            "file_path", {"stage": {"$nin": finished}, "blob_key": None}
+        )
+        return {Path(path).resolve() for path in paths if isinstance(path, str) and path}
+
+    def _scan_legacy(self) -> List[Tuple[Path, int, datetime]]:
+        if self.legacy_dir is None or not self.legacy_dir.is_dir():
+            return []
+        files = []
+        for entry in os.scandir(self.legacy_dir):
+            if entry.is_file():
+                stat = entry.stat()
+                files.append((Path(entry.path), stat.st_size, datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)))
+        return files
+
+    async def _collect_legacy(self, cutoff: datetime) -> Tuple[int, int]:
+        """Delete unreferenced pre-blob-store uploads older than the cutoff; returns (removed, bytes)"""
+        files = await asyncio.to_thread(self._scan_legacy)
+        if not files:
+            return 0, 0
+        referenced = await self._legacy_references()
+        removed = 0
+        reclaimed = 0
+        for path, size, modified_at in files:
+            if modified_at > cutoff or path.resolve() in referenced:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+            reclaimed += size
+        return removed, reclaimed
+
+    async def collect(self) -> Dict:
+        """
+        Delete unreferenced blobs older than the grace period
+
+        Returns:
+            Report with blobs scanned/referenced/removed and bytes reclaimed
+        """
+        started = time.perf_counter()
+        referenced = set(await self.refcounts()) | await self._pending_job_keys()
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.grace_seconds)
+
+        scanned = 0
+        removed = 0
+        reclaimed = 0
+        for key, size, modified_at in await self.store.list_blobs():
+            scanned += 1
+            if key in referenced or modified_at > cutoff:
+                continue
+            # Re-check right before deleting in case an upload reused the blob mid-sweep;
+            # a deduplicated upload gets a parse job first and a resume only once it is parsed
+            if await self._still_referenced(key):
+                continue
+            freed = await self.store.delete(key)
+            removed += 1
+            reclaimed += freed
+        legacy_removed, legacy_reclaimed = await self._collect_legacy(cutoff)
+
+        report = {
+            "ran_at": datetime.utcnow(),
+            "duration_ms": round((time.perf_counter() - started) * 1000),
+            "scanned": scanned,
+            "referenced": len(referenced),
+            "removed": removed,
+            "reclaimed_bytes": reclaimed,
+            "legacy_removed": legacy_removed,
+            "legacy_reclaimed_bytes": legacy_reclaimed
+        }
+        self.runs += 1
+        self.total_removed += removed + legacy_removed
+        self.total_reclaimed_bytes += reclaimed + legacy_reclaimed
+        self.last_run = report
+        print(f"🧹 Blob GC: removed {removed}/{scanned} blobs and {legacy_removed} legacy uploads, "
+              f"reclaimed {(reclaimed + legacy_reclaimed) / 1024:.1f}KB")
+        return report
+
+    def stats(self) -> Dict:
+        """Totals since process start and the last sweep's report"""
+        return {
+            "interval_seconds": self.interval_seconds,
+            "grace_seconds": self.grace_seconds,
+            "runs": self.runs,
+            "total_removed": self.total_removed,
+            "total_reclaimed_bytes": self.total_reclaimed_bytes,
+            "last_run": self.last_run
+        }
+
+
+# Singleton instance
+blob_gc = BlobGarbageCollector(
+    store=blob_store,
+    interval_seconds=settings.BLOB_GC_INTERVAL_SECONDS,
+    grace_seconds=settings.BLOB_GC_GRACE_SECONDS,
+    legacy_dir=str(Path(settings.UPLOAD_DIR, "resumes"))
+)
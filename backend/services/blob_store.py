@@ -0,0 +1,256 @@
+"""
+Blob store - Content-addressed storage for uploaded files
+"""
+import asyncio
+import os
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, List, Tuple
+from config import settings
+
+
+class BlobStore(ABC):
+    """
+    Storage backend for uploaded files, addressed by content hash
+
+    Blobs live at sharded keys such as `ab/cd/abcd1234....pdf`, so
+    byte-identical uploads share one stored copy. Uploads are first
+    streamed into `staging_dir` on local disk and then handed to put().
+    Backends don't track references: the `resumes` collection does, and
+    BlobGarbageCollector removes blobs nothing points to.
+    """
+
+    @staticmethod
+    def key_for(content_hash: str, extension: str) -> str:
+        """Sharded blob key for a SHA-256 hex digest and file extension"""
+        return f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{extension.lower()}"
+
+    @property
+    @abstractmethod
+    def staging_dir(self) -> Path:
+        """Local directory uploads are written to before put()"""
+
+    @abstractmethod
+    async def put(self, local_path: Path, key: str) -> bool:
+        """
+        Move a staged file into the store
+
+        The staged file is consumed either way. If the blob already exists
+        its modification time is refreshed so the garbage collector's grace
+        period starts over.
+
+        Returns:
+            True if a new blob was stored, False if it was deduplicated
+        """
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Whether a blob is stored under key"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> int:
+        """Delete a blob; returns the bytes freed (0 if it was already gone)"""
+
+    @abstractmethod
+    async def list_blobs(self) -> List[Tuple[str, int, datetime]]:
+        """(key, size in bytes, last modified as UTC) for every stored blob"""
+
+    @abstractmethod
+    def local_file(self, key: str):
+        """Async context manager yielding a local path to the blob's bytes"""
+
+    @abstractmethod
+    def uri(self, key: str) -> str:
+        """Human-readable location of a blob (stored on resume documents)"""
+
+
+class LocalBlobStore(BlobStore):
+    """Blob store in a local directory (single node, or a shared volume)"""
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Directory blobs are stored under
+        """
+        self.root = Path(root)
+        self._staging = self.root / ".incoming"
+        self._staging.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def staging_dir(self) -> Path:
+        return self._staging
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    async def put(self, local_path: Path, key: str) -> bool:
+        target = self._path(key)
+        if target.exists():
+            Path(local_path).unlink(missing_ok=True)
+            os.utime(target)
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Staging lives under root, so this is a same-filesystem atomic rename
+        os.replace(local_path, target)
+        return True
+
+    async def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    async def delete(self, key: str) -> int:
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        # Drop emptied shard directories
+        for parent in (path.parent, path.parent.parent):
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+        return size
+
+    def _scan(self) -> List[Tuple[str, int, datetime]]:
+        blobs = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                stat = path.stat()
+                blobs.append((
+                    path.relative_to(self.root).as_posix(),
+                    stat.st_size,
+                    datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+                ))
+        return blobs
+
+    async def list_blobs(self) -> List[Tuple[str, int, datetime]]:
+        return await asyncio.to_thread(self._scan)
+
+    @asynccontextmanager
+    async def local_file(self, key: str) -> AsyncIterator[Path]:
+        yield self._path(key)
+
+    def uri(self, key: str) -> str:
+        return str(self._path(key))
+
+
+class S3BlobStore(BlobStore):
+    """
+    Blob store in an S3-compatible object store (AWS S3, MinIO, R2, ...)
+
+    Requires boto3 (`pip install boto3`). Calls are made from worker
+    threads so they don't block the event loop.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", endpoint_url: str = None, staging_dir: str = None):
+        """
+        Args:
+            bucket: Bucket name
+            prefix: Key prefix inside the bucket
+            endpoint_url: Custom endpoint for S3-compatible services
+            staging_dir: Local directory for in-progress uploads and downloads
+        """
+        try:
+            import boto3
+        except ImportError:
+            raise RuntimeError("BLOB_STORE_BACKEND=s3 requires boto3: pip install boto3")
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = boto3.client("s3", endpoint_url=endpoint_url or None)
+        self._staging = Path(staging_dir or tempfile.gettempdir()) / "blob-staging"
+        self._staging.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def staging_dir(self) -> Path:
+        return self._staging
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _head(self, key: str):
+        from botocore.exceptions import ClientError
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def _put(self, local_path: Path, key: str) -> bool:
+        object_key = self._object_key(key)
+        try:
+            if self._head(key) is not None:
+                # Copy onto itself to refresh LastModified for the GC grace period
+                self.client.copy_object(
+                    Bucket=self.bucket, Key=object_key,
+                    CopySource={"Bucket": self.bucket, "Key": object_key},
+                    MetadataDirective="REPLACE"
+                )
+                return False
+            self.client.upload_file(str(local_path), self.bucket, object_key)
+            return True
+        finally:
+            Path(local_path).unlink(missing_ok=True)
+
+    async def put(self, local_path: Path, key: str) -> bool:
+        return await asyncio.to_thread(self._put, local_path, key)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._head, key) is not None
+
+    def _delete(self, key: str) -> int:
+        head = self._head(key)
+        if head is None:
+            return 0
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+        return head["ContentLength"]
+
+    async def delete(self, key: str) -> int:
+        return await asyncio.to_thread(self._delete, key)
+
+    def _scan(self) -> List[Tuple[str, int, datetime]]:
+        blobs = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for item in page.get("Contents", []):
+                blobs.append((item["Key"][len(self.prefix):], item["Size"], item["LastModified"]))
+        return blobs
+
+    async def list_blobs(self) -> List[Tuple[str, int, datetime]]:
+        return await asyncio.to_thread(self._scan)
+
+    @asynccontextmanager
+    async def local_file(self, key: str) -> AsyncIterator[Path]:
+        path = self._staging / f"{uuid.uuid4().hex}{Path(key).suffix}"
+        await asyncio.to_thread(self.client.download_file, self.bucket, self._object_key(key), str(path))
+        try:
+            yield path
+        finally:
+            path.unlink(missing_ok=True)
+
+    def uri(self, key: str) -> str:
+        return f"s3://{self.bucket}/{self._object_key(key)}"
+
+
+def create_blob_store() -> BlobStore:
+    """Build the blob store selected by BLOB_STORE_BACKEND"""
+    if settings.BLOB_STORE_BACKEND == "s3":
+        return S3BlobStore(
+            bucket=settings.BLOB_S3_BUCKET,
+            prefix=settings.BLOB_S3_PREFIX,
+            endpoint_url=settings.BLOB_S3_ENDPOINT_URL,
+            staging_dir=str(Path(settings.UPLOAD_DIR) / "staging")
+        )
+    return LocalBlobStore(settings.BLOB_STORE_DIR)
+
+
+# Singleton instance
+blob_store = create_blob_store()
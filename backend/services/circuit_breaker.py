@@ -0,0 +1,97 @@
+"""
+Circuit breaker - Fail fast while an LLM provider is degraded
+"""
+import time
+from typing import Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose breaker is open"""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} circuit is open, retry in {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker for one provider
+
+    - closed: calls go through; failure_threshold provider failures in a row
+      (5xx, timeouts, connection errors - not 429s or bad requests) open it
+    - open: calls fail immediately with CircuitOpenError, so callers drop to
+      their fallbacks instead of queueing behind a provider that isn't
+      answering
+    - half_open: after cooldown_seconds calls are let through again; the
+      first success closes the breaker, the first failure reopens it
+
+    Plain synchronous methods, so the blocking resume parse path can use the
+    same breaker as the gateway.
+    """
+
+    def __init__(self, provider: str, failure_threshold: int, cooldown_seconds: float):
+        """
+        Args:
+            provider: Provider name (for errors and logs)
+            failure_threshold: Consecutive failures that open the breaker (0 disables it)
+            cooldown_seconds: How long the breaker stays open before letting calls probe
+        """
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def allows_calls(self) -> bool:
+        """False while open and still cooling down (check() would raise)"""
+        return self.state != OPEN or time.monotonic() >= self.opened_at + self.cooldown_seconds
+
+    def check(self):
+        """Raise CircuitOpenError if calls should not be made right now"""
+        if self.state != OPEN:
+            return
+        retry_in = self.opened_at + self.cooldown_seconds - time.monotonic()
+        if retry_in > 0:
+            self.rejected += 1
+            raise CircuitOpenError(self.provider, retry_in)
+        self.state = HALF_OPEN
+        print(f"🟡 {self.provider} circuit half-open, probing")
+
+    def record_success(self):
+        if self.state != CLOSED:
+            print(f"🟢 {self.provider} circuit closed")
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if not self.failure_threshold:
+            return
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            print(f"🔴 {self.provider} circuit open after {self.consecutive_failures} failures, "
+                  f"failing fast for {self.cooldown_seconds:.0f}s")
+
+    def stats(self) -> Dict:
+        retry_in = 0.0
+        if self.state == OPEN:
+            retry_in = max(0.0, self.opened_at + self.cooldown_seconds - time.monotonic())
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in_seconds": round(retry_in, 1),
+            "trips": self.trips,
+            "rejected": self.rejected
+        }
@@ -1,53 +1,108 @@
 """
 Groq API service for LLM and Whisper (Speech-to-Text)
 """
-from groq import Groq
-from config import settings
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Optional
 import json
+from config import settings
+from services.llm_gateway import LLMPriority
+from services.llm_router import llm_router
+from services.question_cache import question_set_cache
+from utils.json_stream import JSONArrayStream
+
+# Bump when the question prompt changes so cached sets from the old prompt stop matching
+QUESTION_PROMPT_VERSION = 1
+
+# Follow-up asked when the LLM call fails
+FALLBACK_FOLLOW_UP = "Can you elaborate more on that with a specific example?"
+
+# Longest the candidate should wait on each call before the fallback is used
+QUESTIONS_DEADLINE_SECONDS = 30
+FOLLOW_UP_DEADLINE_SECONDS = 10
 
 
 class GroqService:
     """Groq API wrapper for LLM and Whisper"""
     
     def __init__(self):
-        """Initialize Groq client"""
-        self.client = Groq(api_key=settings.GROQ_API_KEY)
-        self.llm_model = "llama-3.3-70b-versatile"  # Updated from deprecated mixtral-8x7b-32768
+        """Initialize model names (completions go through the LLM router, which may fail over to another provider)"""
+        self.llm_model = settings.GROQ_CHAT_MODEL  # Preferred model; part of the question cache version
         self.whisper_model = "whisper-large-v3"
     
-    def generate_questions(self, resume_data: Dict, job_role: str, num_questions: int = 10) -> List[Dict]:
+    def question_profile(self, resume_data: Dict, job_role: str, num_questions: int = 10) -> Dict:
+        """
+        The inputs the question prompt depends on (and the question cache is keyed by)
+        
+        Args:
+            resume_data: Parsed resume information
+            job_role: Target job role
+            num_questions: Total number of questions
+            
+        Returns:
+            Job role, top skills, experience count, first degree, project count and question count
+        """
+        skills = resume_data.get("skills", []) or []
+        education = resume_data.get("education", []) or []
+        return {
+            "job_role": job_role,
+            "skills": skills[:10],
+            "exp_years": len(resume_data.get("experience", []) or []),
+            "degree": education[0].get('degree', 'Computer Science') if education and isinstance(education[0], dict) else 'Computer Science',
+            "project_count": len(resume_data.get("projects", []) or []),
+            "num_questions": num_questions
+        }
+    
+    async def generate_questions(self, resume_data: Dict, job_role: str, num_questions: int = 10,
+                                 priority: LLMPriority = LLMPriority.STANDARD,
+                                 use_fallback: bool = True) -> Optional[List[Dict]]:
         """
         Generate interview questions based on resume and job role
         20% general, 80% technical
         
+        Sets generated for an equivalent profile are served from the question
+        set cache; only LLM-generated sets are cached, never the fallback.
+        
         Args:
             resume_data: Parsed resume information
             job_role: Target job role
             num_questions: Total number of questions (default 10)
+            priority: LLM gateway dispatch class
+            use_fallback: Return the default questions if generation fails (else None)
             
         Returns:
             List of interview questions with metadata
         """
-        try:
-            # Extract key information from resume
-            skills = resume_data.get("skills", [])
-            experience = resume_data.get("experience", [])
-            education = resume_data.get("education", [])
-            projects = resume_data.get("projects", [])
-            
-            # Build context
-            skills_str = ", ".join(skills[:10]) if skills else "general programming"
-            exp_years = len(experience) if experience else 0
-            
-            # Create prompt
-            prompt = f"""You are an expert technical interviewer conducting an interview for a {job_role} position.
+        profile = self.question_profile(resume_data, job_role, num_questions)
+        version = f"{self.llm_model}:{QUESTION_PROMPT_VERSION}"
+        
+        cached = await question_set_cache.get(profile, version)
+        if cached is not None:
+            return cached
+        
+        questions = await self._generate_question_set(profile, priority)
+        if questions is None:
+            return self._get_default_questions(job_role) if use_fallback else None
+        
+        await question_set_cache.put(profile, version, questions)
+        return questions
+    
+    def _question_messages(self, profile: Dict) -> List[Dict]:
+        """Chat messages asking for a question set for a profile (see question_profile)"""
+        job_role = profile["job_role"]
+        num_questions = profile["num_questions"]
+        skills = profile["skills"]
+        
+        # Build context
+        skills_str = ", ".join(skills) if skills else "general programming"
+        exp_years = profile["exp_years"]
+        
+        # Create prompt
+        prompt = f"""You are an expert technical interviewer conducting an interview for a {job_role} position.
 
 Based on the candidate's profile:
 - Skills: {skills_str}
 - Years of Experience: {exp_years}
-- Education: {education[0].get('degree', 'Computer Science') if education else 'Computer Science'}
-- Projects: {len(projects)} project(s)
+- Education: {profile["degree"]}
+- Projects: {profile["project_count"]} project(s)
 
 Generate exactly {num_questions} interview questions following this distribution:
 - 2 general/behavioral questions (20%)
@@ -77,19 +132,29 @@ Return ONLY a JSON array in this exact format:
 
 Make questions specific to {job_role} and the candidate's skills: {skills_str}.
 Return ONLY the JSON array, no additional text."""
-
-            # Call Groq API
-            response = self.client.chat.completions.create(
-                model=self.llm_model,
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
+        
+        return [
+            {"role": "system", "content": "You are an expert technical interviewer. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    async def _generate_question_set(self, profile: Dict, priority: LLMPriority) -> Optional[List[Dict]]:
+        """Ask the LLM for a question set; None if the call or the JSON fails"""
+        try:
+            num_questions = profile["num_questions"]
+            
+            # Fastest healthy provider for this call class, failing over on errors
+            completion = await llm_router.complete(
+                "interview_questions",
+                self._question_messages(profile),
                 temperature=0.7,
-                max_tokens=2000
+                max_tokens=2000,
+                priority=priority,
+                deadline=QUESTIONS_DEADLINE_SECONDS,
+                hedge=True
             )
             
-            response_text = response.choices[0].message.content.strip()
+            response_text = completion.text.strip()
             
             # Extract JSON if wrapped in markdown
             if "```json" in response_text:
@@ -103,14 +168,76 @@ Return ONLY the JSON array, no additional text."""
             # Validate and return
             if isinstance(questions, list) and len(questions) > 0:
                 return questions[:num_questions]
-            else:
-                # Fallback to default questions
-                return self._get_default_questions(job_role)
+            return None
                 
         except Exception as e:
             print(f"❌ Error generating questions: {e}")
-            # Return default questions on error
-            return self._get_default_questions(job_role)
+            return None
+    
+    async def stream_questions(self, resume_data: Dict, job_role: str, num_questions: int = 10,
+                               priority: LLMPriority = LLMPriority.STANDARD) -> AsyncIterator[Dict]:
+        """
+        Generate interview questions, yielding each one as soon as it is complete
+        
+        The completion is streamed and its JSON array parsed incrementally,
+        so the first question is available long before the last. Cached sets
+        are yielded straight away, and a streamed set is cached once the
+        whole array has arrived. If the stream fails or ends early, the
+        questions received so far are topped up with default questions to
+        num_questions, skipping any already asked.
+        
+        Args:
+            resume_data: Parsed resume information
+            job_role: Target job role
+            num_questions: Total number of questions (default 10)
+            priority: LLM gateway dispatch class
+            
+        Yields:
+            Interview questions with metadata, in order
+        """
+        profile = self.question_profile(resume_data, job_role, num_questions)
+        version = f"{self.llm_model}:{QUESTION_PROMPT_VERSION}"
+        
+        cached = await question_set_cache.get(profile, version)
+        questions = []
+        if cached is not None:
+            for question in cached[:num_questions]:
+                questions.append(question)
+                yield question
+        else:
+            parser = JSONArrayStream()
+            stream = llm_router.stream(
+                "interview_questions",
+                self._question_messages(profile),
+                temperature=0.7,
+                max_tokens=2000,
+                priority=priority,
+                deadline=QUESTIONS_DEADLINE_SECONDS
+            )
+            try:
+                async for delta in stream:
+                    for question in parser.feed(delta):
+                        if isinstance(question, dict) and len(questions) < num_questions:
+                            questions.append(question)
+                            yield question
+            except Exception as e:
+                print(f"❌ Error streaming questions after {len(questions)} of {num_questions}: {e}")
+            finally:
+                await stream.aclose()
+            
+            if questions and (parser.finished or len(questions) >= num_questions):
+                await question_set_cache.put(profile, version, list(questions))
+        
+        # Top up a short set (stream failed, timed out or ended early) with default questions
+        asked = {str(question.get("question", "")).strip().lower() for question in questions}
+        for question in self._get_default_questions(job_role):
+            if len(questions) >= num_questions:
+                break
+            text = question["question"].strip().lower()
+            if text not in asked:
+                asked.add(text)
+                questions.append(question)
+                yield question
     
     def _get_default_questions(self, job_role: str) -> List[Dict]:
         """Fallback questions if LLM fails"""
@@ -177,20 +304,9 @@ Return ONLY the JSON array, no additional text."""
             }
         ]
     
-    def generate_follow_up_question(self, original_question: str, candidate_answer: str, job_role: str) -> str:
-        """
-        Generate adaptive follow-up question based on candidate's answer
-        
-        Args:
-            original_question: The original question asked
-            candidate_answer: Candidate's answer to the original question
-            job_role: Job role being interviewed for
-            
-        Returns:
-            Follow-up question string
-        """
-        try:
-            prompt = f"""You are an expert interviewer conducting an interview for a {job_role} position.
+    def _follow_up_messages(self, original_question: str, candidate_answer: str, job_role: str) -> List[Dict]:
+        """Chat messages asking for one follow-up question"""
+        prompt = f"""You are an expert interviewer conducting an interview for a {job_role} position.
 
 Original Question: {original_question}
 
@@ -204,18 +320,36 @@ Based on the candidate's response, generate ONE insightful follow-up question th
 5. Is relevant to the {job_role} role
 
 Return ONLY the follow-up question text, no additional formatting or explanations."""
-
-            response = self.client.chat.completions.create(
-                model=self.llm_model,
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer. Generate concise, targeted follow-up questions."},
-                    {"role": "user", "content": prompt}
-                ],
+        
+        return [
+            {"role": "system", "content": "You are an expert technical interviewer. Generate concise, targeted follow-up questions."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    async def generate_follow_up_question(self, original_question: str, candidate_answer: str, job_role: str) -> str:
+        """
+        Generate adaptive follow-up question based on candidate's answer
+        
+        Args:
+            original_question: The original question asked
+            candidate_answer: Candidate's answer to the original question
+            job_role: Job role being interviewed for
+            
+        Returns:
+            Follow-up question string
+        """
+        try:
+            completion = await llm_router.complete(
+                "follow_up_question",
+                self._follow_up_messages(original_question, candidate_answer, job_role),
                 temperature=0.7,
-                max_tokens=200
+                max_tokens=200,
+                priority=LLMPriority.INTERACTIVE,
+                deadline=FOLLOW_UP_DEADLINE_SECONDS,
+                hedge=True
             )
             
-            follow_up = response.choices[0].message.content.strip()
+            follow_up = completion.text.strip()
             
             # Clean up any quotes or formatting
             follow_up = follow_up.strip('"\'')
@@ -225,13 +359,56 @@ Return ONLY the follow-up question text, no additional formatting or explanation
         except Exception as e:
             print(f"❌ Error generating follow-up question: {e}")
             # Fallback generic follow-up
-            return "Can you elaborate more on that with a specific example?"
+            return FALLBACK_FOLLOW_UP
+    
+    async def stream_follow_up_question(self, original_question: str, candidate_answer: str,
+                                        job_role: str) -> AsyncIterator[str]:
+        """
+        Generate a follow-up question, yielding its text as the tokens arrive
+        
+        Leading quotes/whitespace are dropped as they stream; trailing ones
+        can only be seen at the end, so callers should strip('"\'') the
+        joined text before storing it. If the call fails before any text
+        arrives, the generic fallback follow-up is yielded instead.
+        
+        Args:
+            original_question: The original question asked
+            candidate_answer: Candidate's answer to the original question
+            job_role: Job role being interviewed for
+            
+        Yields:
+            Pieces of the follow-up question text
+        """
+        stream = llm_router.stream(
+            "follow_up_question",
+            self._follow_up_messages(original_question, candidate_answer, job_role),
+            temperature=0.7,
+            max_tokens=200,
+            priority=LLMPriority.INTERACTIVE,
+            deadline=FOLLOW_UP_DEADLINE_SECONDS
+        )
+        started = False
+        try:
+            async for delta in stream:
+                if not started:
+                    delta = delta.lstrip(' \t\n"\'')
+                    if not delta:
+                        continue
+                    started = True
+                yield delta
+        except Exception as e:
+            print(f"❌ Error streaming follow-up question: {e}")
+        finally:
+            await stream.aclose()
+        
+        if not started:
+            yield FALLBACK_FOLLOW_UP
     
-    def generate_followup(self, previous_answer: str, context: Dict) -> str:
+    async def generate_followup(self, previous_answer: str, context: Dict) -> str:
         """
         DEPRECATED: Use generate_follow_up_question instead
         """
-        return self.generate_follow_up_question(
+        return await self.generate_follow_up_question(
             context.get("question", ""),
             previous_answer,
             context.get("job_role", "")
@@ -0,0 +1,283 @@
+"""
+Interview events - Per-session event streams stored in bucket documents instead of interview arrays
+"""
+import math
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from config import settings
+from utils.database import Database
+
+# Event streams kept per interview session
+EVENT_KINDS = ("responses", "conversation_history", "face_monitoring_logs", "cheating_incidents")
+
+
+def count_expression(kind: str) -> Dict:
+    """Aggregation expression for an interview's number of `kind` events, migrated or not"""
+    return {"$add": [
+        {"$ifNull": [f"$event_counts.{kind}", 0]},
+        {"$ifNull": [f"$migrated_counts.{kind}", 0]},
+        {"$size": {"$ifNull": [f"${kind}", []]}}
+    ]}
+
+
+def stored_count(interview: Dict, kind: str) -> int:
+    """Number of `kind` events of an interview document, as count_expression computes it"""
+    return ((interview.get("event_counts") or {}).get(kind, 0)
+            + (interview.get("migrated_counts") or {}).get(kind, 0)
+            + len(interview.get(kind) or []))
+
+
+class InterviewEventStore:
+    """
+    Interview event streams in `interview_event_buckets`
+
+    Interviews used to $push every answer, follow-up, face monitoring log and
+    cheating incident into the interview document itself, so long proctored
+    sessions grew it toward MongoDB's 16MB limit and made every read and
+    write of the interview slower. Events now live in bucket documents of
+    up to bucket_size events, keyed by {session_id, kind, seq}.
+
+    The interview keeps one counter per kind (event_counts). An append
+    increments it atomically to reserve event positions, then writes each
+    event into its reserved slot, events.<position % bucket_size> of bucket
+    position // bucket_size, creating the bucket on first use. The counter
+    increment can carry extra filter conditions (ownership, status), so the
+    check and the reservation are one write. Because events land in their
+    reserved slots, concurrent appends keep reservation order and a bucket
+    never holds more than bucket_size events.
+
+    Reservation and bucket write are still two writes: a slot reserved by an
+    append that dies before writing stays an empty (null) slot. Reads skip
+    empty slots, but they still count toward event_counts and the offsets
+    iter_events() takes, which are slot positions.
+
+    Interviews written before buckets keep their events in the embedded
+    arrays until migrate() moves them into buckets with negative seq
+    numbers, ahead of anything appended since, and counts them separately
+    in migrated_counts so appended positions are unaffected. Reads return
+    the embedded events first, so they are complete before and after
+    migration.
+    """
+
+    COLLECTION = "interview_event_buckets"
+
+    def __init__(self, bucket_size: int):
+        """
+        Args:
+            bucket_size: Maximum events per bucket document
+        """
+        self.bucket_size = max(1, bucket_size)
+
+    def _collection(self):
+        return Database.get_collection(self.COLLECTION)
+
+    def _interviews(self):
+        return Database.get_collection("interviews")
+
+    async def _write(self, session_id: str, kind: str, seq: int, first: int, events: List[Dict], now: datetime):
+        """Write events into their reserved slots of one bucket, starting at slot first, creating it if needed"""
+        bucket = {"session_id": session_id, "kind": kind, "seq": seq}
+        slots = {f"events.{first + i}": event for i, event in enumerate(events)}
+        # Setting a slot past the end of the array pads it with nulls
+        update = {"$set": {**slots, "updated_at": now}, "$max": {"count": first + len(events)}}
+        result = await self._collection().update_one(bucket, update)
+        if result.matched_count:
+            return
+        try:
+            await self._collection().insert_one({
+                **bucket, "count": first + len(events), "events": [None] * first + events,
+                "created_at": now, "updated_at": now
+            })
+        except DuplicateKeyError:
+            # Another append created the bucket between our update and insert
+            await self._collection().update_one(bucket, update)
+
+    async def append(
+        self,
+        session_id: str,
+        kind: str,
+        events: List[Dict],
+        match: Optional[Dict] = None
+    ) -> Optional[int]:
+        """
+        Append events to a session's stream
+
+        Args:
+            session_id: Interview session
+            kind: One of EVENT_KINDS
+            events: Events in order
+            match: Extra interview filter conditions the append requires (e.g. owner and status)
+
+        Returns:
+            The stream's appended event count (event_counts) after the append, or None if no
+            interview matched (nothing is written then)
+        """
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"Unknown interview event kind: {kind}")
+        now = datetime.utcnow()
+        counted = await self._interviews().find_one_and_update(
+            {"session_id": session_id, **(match or {})},
+            {"$inc": {f"event_counts.{kind}": len(events)}, "$set": {"updated_at": now}},
+            projection={f"event_counts.{kind}": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if counted is None:
+            return None
+
+        total = counted["event_counts"][kind]
+        position = total - len(events)
+        while events:
+            seq, first = divmod(position, self.bucket_size)
+            room = self.bucket_size - first
+            await self._write(session_id, kind, seq, first, events[:room], now)
+            events = events[room:]
+            position += room
+        return total
+
+    async def iter_events(self, session_id: str, kind: str, offset: int = 0) -> AsyncIterator[Dict]:
+        """
+        A session's events in order, loaded one bucket at a time
+
+        Args:
+            session_id: Interview session
+            kind: One of EVENT_KINDS
+            offset: Event positions to skip; buckets entirely before it are not fetched
+
+        Yields:
+            Events, oldest first (empty slots skipped)
+        """
+        interview = await self._interviews().find_one({"session_id": session_id}, {kind: 1})
+        embedded = (interview or {}).get(kind)
+        for event in (embedded or [])[offset:]:
+            yield event
+        offset = max(0, offset - len(embedded or []))
+
+        # Find the first bucket holding an event at or after offset from the bucket sizes alone
+        query = {"session_id": session_id, "kind": kind}
+        if embedded is not None:
+            # Mid-migration the migrated buckets copy the embedded array, which is still authoritative
+            query["migrated"] = {"$ne": True}
+        first_seq = None
+        async for header in self._collection().find(query, {"seq": 1, "count": 1}).sort("seq", 1):
+            if offset < header["count"]:
+                first_seq = header["seq"]
+                break
+            offset -= header["count"]
+        if first_seq is None:
+            return
+
+        cursor = self._collection().find({**query, "seq": {"$gte": first_seq}}, {"events": 1}).sort("seq", 1)
+        async for bucket in cursor.batch_size(2):
+            events = bucket.get("events", [])
+            for event in events[offset:]:
+                if event is not None:
+                    yield event
+            offset = 0
+
+    async def get_events(self, session_id: str, kind: str, offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """
+        A page of a session's events
+
+        Args:
+            session_id: Interview session
+            kind: One of EVENT_KINDS
+            offset: Events to skip
+            limit: Maximum events to return (None for all)
+
+        Returns:
+            Events, oldest first
+        """
+        events = []
+        if limit is not None and limit <= 0:
+            return events
+        stream = self.iter_events(session_id, kind, offset)
+        try:
+            async for event in stream:
+                events.append(event)
+                if limit is not None and len(events) >= limit:
+                    break
+        finally:
+            await stream.aclose()
+        return events
+
+    async def migrate(self, session_id: str) -> Dict[str, int]:
+        """
+        Move an interview's embedded event arrays into buckets
+
+        Embedded events go into buckets numbered -n..-1, ahead of events
+        appended since the bucket store went live, and are counted in
+        migrated_counts rather than event_counts, which only numbers
+        appended positions. Buckets are written with replace_one keyed by
+        seq and the array is only removed once its buckets exist, and only
+        if it wasn't changed meanwhile; otherwise the buckets just written
+        are deleted again. Reads ignore migrated buckets while the array
+        exists, so re-running after an interruption is safe.
+
+        Args:
+            session_id: Interview session
+
+        Returns:
+            Events moved per kind
+        """
+        interview = await self._interviews().find_one({"session_id": session_id}, {kind: 1 for kind in EVENT_KINDS})
+        moved: Dict[str, int] = {}
+        if interview is None:
+            return moved
+
+        now = datetime.utcnow()
+        for kind in EVENT_KINDS:
+            embedded = interview.get(kind)
+            if embedded is None:
+                continue
+            buckets = math.ceil(len(embedded) / self.bucket_size)
+            for index in range(buckets):
+                events = embedded[index * self.bucket_size:(index + 1) * self.bucket_size]
+                seq = index - buckets
+                await self._collection().replace_one(
+                    {"session_id": session_id, "kind": kind, "seq": seq},
+                    {"session_id": session_id, "kind": kind, "seq": seq, "count": len(events), "events": events,
+                     "created_at": now, "updated_at": now, "migrated": True},
+                    upsert=True
+                )
+            result = await self._interviews().update_one(
+                {"_id": interview["_id"], kind: {"$size": len(embedded)}},
+                {"$unset": {kind: ""}, "$inc": {f"migrated_counts.{kind}": len(embedded)}}
+            )
+            if result.modified_count:
+                moved[kind] = len(embedded)
+                continue
+            still_embedded = await self._interviews().count_documents(
+                {"_id": interview["_id"], kind: {"$exists": True}}, limit=1
+            )
+            if still_embedded:
+                await self._collection().delete_many({"session_id": session_id, "kind": kind, "seq": {"$lt": 0}})
+                print(f"⚠️ {kind} of session {session_id} changed during migration, leaving it embedded")
+        return moved
+
+    async def migrate_all(self, batch_size: int = 100) -> Dict[str, int]:
+        """
+        Migrate every interview that still has embedded event arrays
+
+        Args:
+            batch_size: Interview ids fetched per round trip
+
+        Returns:
+            Interviews migrated and events moved per kind
+        """
+        pending = {"$or": [{kind: {"$exists": True}} for kind in EVENT_KINDS]}
+        totals: Dict[str, int] = {"interviews": 0}
+        cursor = self._interviews().find(pending, {"session_id": 1}).batch_size(batch_size)
+        async for interview in cursor:
+            moved = await self.migrate(interview["session_id"])
+            totals["interviews"] += 1
+            for kind, count in moved.items():
+                totals[kind] = totals.get(kind, 0) + count
+            if totals["interviews"] % batch_size == 0:
+                print(f"🔁 Migrated events of {totals['interviews']} interviews")
+        return totals
+
+
+# Singleton instance
+interview_events = InterviewEventStore(bucket_size=settings.INTERVIEW_EVENT_BUCKET_SIZE)
@@ -0,0 +1,153 @@
+"""
+Interview stats - Dashboard statistics computed by MongoDB instead of in Python
+"""
+from datetime import datetime
+from typing import Dict, List
+from services.interview_events import count_expression
+from utils.database import Database
+
+# Interviews shown in the dashboard's "recent" list
+RECENT_INTERVIEWS = 5
+
+# Interview statuses counted as pending on the dashboard
+PENDING_STATUSES = ["pending", "in_progress"]
+
+
+class InterviewStatsService:
+    """
+    Per-user dashboard statistics as one $facet aggregation
+
+    Interview documents carry every question (and, until migrated to
+    interview_event_buckets, every response and face log), so loading them
+    all to count them moves megabytes per dashboard view. The pipeline
+    matches and sorts on the {user_id, created_at} index (see
+    utils/indexes.py), projects each interview down to the handful of
+    fields the dashboard uses, and computes the counts, average score,
+    distinct question categories and recent interviews in a single round
+    trip.
+    """
+
+    def _collection(self):
+        return Database.get_collection("interviews")
+
+    def pipeline(self, user_id: str) -> List[Dict]:
+        """
+        Aggregation pipeline producing one document with the user's stats
+
+        Args:
+            user_id: Interview owner
+
+        Returns:
+            Pipeline stages for db.interviews.aggregate
+        """
+        return [
+            {"$match": {"user_id": user_id}},
+            {"$sort": {"created_at": -1}},
+            {"$project": {
+                "_id": 1,
+                "session_id": 1,
+                "job_role": 1,
+                "created_at": 1,
+                "status": 1,
+                "overall_score": 1,
+                "duration": 1,
+                "categories": "$questions.category",
+                "responses_count": count_expression("responses")
+            }},
+            {"$facet": {
+                "counts": [
+                    {"$group": {
+                        "_id": None,
+                        "total": {"$sum": 1},
+                        "completed": {"$sum": {"$cond": [{"$eq": ["$status", "completed"]}, 1, 0]}},
+                        "pending": {"$sum": {"$cond": [{"$in": ["$status", PENDING_STATUSES]}, 1, 0]}},
+                        # Only completed interviews with a (non-zero) score count towards the average
+                        "score_total": {"$sum": {"$cond": [
+                            {"$and": [{"$eq": ["$status", "completed"]}, "$overall_score"]}, "$overall_score", 0
+                        ]}},
+                        "scored": {"$sum": {"$cond": [
+                            {"$and": [{"$eq": ["$status", "completed"]}, "$overall_score"]}, 1, 0
+                        ]}}
+                    }}
+                ],
+                "categories": [
+                    {"$unwind": "$categories"},
+                    {"$match": {"categories": {"$nin": [None, "", 0, False]}}},
+                    {"$group": {"_id": "$categories"}},
+                    {"$group": {"_id": None, "names": {"$push": "$_id"}}}
+                ],
+                "recent": [
+                    {"$limit": RECENT_INTERVIEWS},
+                    {"$project": {"categories": 0}}
+                ]
+            }}
+        ]
+
+    async def compute(self, user_id: str) -> Dict:
+        """
+        A user's stats computed from the interviews collection
+
+        Args:
+            user_id: Interview owner
+
+        Returns:
+            Counters, score total/count, distinct question categories and the
+            recent interview summaries (the fields kept in user_interview_stats)
+        """
+        results = await self._collection().aggregate(self.pipeline(user_id)).to_list(length=1)
+        facets = results[0] if results else {}
+        counts = (facets.get("counts") or [{}])[0]
+        categories = (facets.get("categories") or [{}])[0]
+        return {
+            "total_interviews": counts.get("total", 0),
+            "completed_interviews": counts.get("completed", 0),
+            "pending_interviews": counts.get("pending", 0),
+            "score_total": counts.get("score_total", 0),
+            "scored_interviews": counts.get("scored", 0),
+            "categories": sorted(categories.get("names", []), key=str),
+            "recent_interviews": facets.get("recent", [])
+        }
+
+    async def get_user_stats(self, user_id: str) -> Dict:
+        """
+        Dashboard stats and recent interviews for a user, computed from source
+
+        Args:
+            user_id: Interview owner
+
+        Returns:
+            {"stats": {...}, "recent_interviews": [...]} as served by /api/interviews/user/stats
+        """
+        return self.format(await self.compute(user_id))
+
+    def format(self, stats: Dict) -> Dict:
+        """Dashboard response for stats in the compute() shape"""
+        scored = stats.get("scored_interviews", 0)
+        return {
+            "stats": {
+                "total_interviews": stats.get("total_interviews", 0),
+                "completed_interviews": stats.get("completed_interviews", 0),
+                "pending_interviews": stats.get("pending_interviews", 0),
+                "average_score": round(stats.get("score_total", 0) / scored, 1) if scored else 0,
+                "skills_assessed": len(stats.get("categories", []))
+            },
+            "recent_interviews": [self._format_recent(interview) for interview in stats.get("recent_interviews", [])]
+        }
+
+    @staticmethod
+    def _format_recent(interview: Dict) -> Dict:
+        created_at = interview.get("created_at")
+        return {
+            "id": str(interview.get("_id")),
+            "session_id": interview.get("session_id"),
+            "position": interview.get("job_role", "N/A"),
+            "date": created_at.isoformat() if isinstance(created_at, datetime) else None,
+            "status": interview.get("status", "pending"),
+            "score": interview.get("overall_score"),
+            "duration": interview.get("duration"),
+            "responses_count": interview.get("responses_count", 0)
+        }
+
+
+# Singleton instance
+interview_stats = InterviewStatsService()
@@ -0,0 +1,698 @@
+"""
+LLM gateway - Shared, rate-limited access to the LLM providers for every service
+"""
+import asyncio
+import itertools
+import random
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+import httpx
+from groq import AsyncGroq
+from config import settings
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.llm_quota import MAX_POLL_SECONDS, MemoryQuota, QuotaBackend, create_quota_backend, initial_state, take
+from services.resume_compactor import estimate_tokens
+from services.single_flight import SingleFlight, chat_request_key
+
+# Status codes worth retrying (rate limited, overloaded, transient upstream errors)
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+# Backoff for retries without a retry-after hint
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+# Successful call latencies kept per caller for the hedge delay (p95), and
+# how many are needed before hedging starts
+LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+
+# A stream whose consumer hasn't asked for the next delta for this long
+# (abandoned without aclose()) gives its in-flight slot back
+STREAM_IDLE_SECONDS = 30.0
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """Raised when a call site's deadline passes before the provider answered"""
+
+
+class LLMPriority(IntEnum):
+    """Dispatch classes for LLM calls; lower values get free slots first"""
+    INTERACTIVE = 0  # A candidate is waiting on camera (follow-ups)
+    STANDARD = 1  # A user is waiting on a page (starting an interview)
+    BACKGROUND = 2  # Nobody is waiting (resume parsing, reports)
+
+
+class _SlotWaiter:
+    """A call waiting for an in-flight slot"""
+
+    __slots__ = ("priority", "seq", "enqueued", "future")
+
+    def __init__(self, priority: int, seq: int, future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.enqueued = time.monotonic()
+        self.future = future
+
+
+class ProviderLimits:
+    """
+    Requests/tokens-per-minute budget and 429 cool-down for one provider
+
+    The bucket state lives in a QuotaBackend. With the file or mongo
+    backend it is shared, so several uvicorn workers (or nodes) draw from
+    one budget and a 429 seen by any of them pauses all of them. If the
+    backend fails, calls are admitted rather than blocked.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int, tokens_per_minute: int,
+                 quota: Optional[QuotaBackend] = None):
+        """
+        Args:
+            name: Provider name (the key the shared state is stored under)
+            requests_per_minute: Request budget; 0 disables it
+            tokens_per_minute: Token budget; 0 disables it
+            quota: Where the bucket state is kept (defaults to this process)
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.quota = quota or MemoryQuota()
+        self.rate_limited = 0
+        self.backend_errors = 0
+        self._last_state = self._initial()
+
+    def _initial(self) -> Dict[str, float]:
+        return initial_state(self.requests_per_minute, self.tokens_per_minute)
+
+    async def _update(self, mutate: Callable[[Dict[str, float]], float]) -> float:
+        def tracked(state):
+            result = mutate(state)
+            self._last_state = dict(state)
+            return result
+        try:
+            return await self.quota.update(self.name, self._initial, tracked)
+        except Exception as e:
+            self.backend_errors += 1
+            print(f"⚠️ LLM quota backend ({self.quota.name}) error for {self.name}: {e}")
+            return 0.0
+
+    async def admit(self, estimated_tokens: int):
+        """Wait out any cool-down, then take one request and the estimated tokens"""
+        while True:
+            wait = await self._update(
+                lambda state: take(state, self.requests_per_minute, self.tokens_per_minute, estimated_tokens)
+            )
+            if wait <= 0:
+                return
+            # Re-check at least every MAX_POLL_SECONDS: other workers may settle tokens back
+            await asyncio.sleep(min(wait, MAX_POLL_SECONDS))
+
+    async def settle(self, tokens: float):
+        """
+        Return (positive) or charge (negative) tokens after the fact
+
+        Used to settle an estimate against the provider's reported usage.
+        The balance may go negative, which delays later callers.
+        """
+        if not self.tokens_per_minute:
+            return
+
+        def apply(state):
+            take(state, 0, self.tokens_per_minute, 0)  # Refill only
+            state["tokens"] = min(self.tokens_per_minute, state["tokens"] + tokens)
+            return 0.0
+        await self._update(apply)
+
+    async def pause(self, seconds: float):
+        """Hold back every caller of this provider, not just the one that got the 429"""
+        self.rate_limited += 1
+
+        def apply(state):
+            state["paused_until"] = max(state["paused_until"], time.time() + seconds)
+            return 0.0
+        await self._update(apply)
+
+    def stats(self) -> Dict:
+        """Budget as last seen by this process (shared backends may have moved on since)"""
+        state = self._last_state
+        return {
+            "quota_backend": self.quota.name,
+            "requests_per_minute": self.requests_per_minute or None,
+            "tokens_per_minute": self.tokens_per_minute or None,
+            "requests_available": int(state["requests"]) if self.requests_per_minute else None,
+            "tokens_available": int(state["tokens"]) if self.tokens_per_minute else None,
+            "rate_limited": self.rate_limited,
+            "backend_errors": self.backend_errors,
+            "paused_for_ms": max(0, round((state["paused_until"] - time.time()) * 1000))
+        }
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    """HTTP status of a provider error (Groq SDK and google-api-core style)"""
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Seconds to wait according to the error's retry-after headers, if any"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass  # HTTP-date form; fall back to exponential backoff
+    return None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, (httpx.TransportError, asyncio.TimeoutError)):
+        return True
+    if type(exc).__name__ in ("APIConnectionError", "APITimeoutError"):
+        return True
+    return _status_code(exc) in RETRYABLE_STATUS
+
+
+def is_provider_failure(exc: Exception) -> bool:
+    """Errors that say the provider is degraded (count against its circuit breaker)"""
+    if isinstance(exc, (httpx.TransportError, asyncio.TimeoutError)):
+        return True
+    if type(exc).__name__ in ("APIConnectionError", "APITimeoutError"):
+        return True
+    status = _status_code(exc)
+    return status is not None and status >= 500
+
+
+def _usage(response) -> Dict[str, int]:
+    """Prompt/completion tokens from a Groq (OpenAI-style) or Gemini response"""
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        return {"prompt_tokens": usage.prompt_tokens or 0, "completion_tokens": usage.completion_tokens or 0}
+    metadata = getattr(response, "usage_metadata", None)
+    if metadata is not None:
+        return {
+            "prompt_tokens": getattr(metadata, "prompt_token_count", 0) or 0,
+            "completion_tokens": getattr(metadata, "candidates_token_count", 0) or 0
+        }
+    return {"prompt_tokens": 0, "completion_tokens": 0}
+
+
+class LLMGateway:
+    """
+    Single entry point for LLM calls from every service
+
+    All calls share:
+    - one pooled keep-alive HTTP client for Groq (no per-service clients)
+    - a global limit on requests in flight
+    - per-provider token buckets for requests and tokens per minute, so
+      bursts queue here instead of being rejected by the provider
+    - 429 handling that honours retry-after and pauses the whole provider,
+      so concurrent callers don't each burn retries against the limit
+    - single-flight coalescing of identical concurrent chat requests
+
+    Token buckets are charged an estimate up front (prompt size plus
+    max_tokens) and settled against the reported usage afterwards.
+    Metrics are kept per caller name.
+
+    Call sites pass a deadline covering queueing, admission, every attempt
+    and backoff; LLMDeadlineExceeded is raised once it passes. Each provider
+    has a CircuitBreaker that fails calls fast with CircuitOpenError while
+    the provider keeps erroring or timing out, so callers fall back instead
+    of waiting. chat() can hedge: if no response arrived after the caller's
+    p95 latency, a duplicate request is sent and the first answer wins.
+
+    When every slot is busy, a freed slot goes to the waiting call with the
+    best LLMPriority, so live interview traffic overtakes queued background
+    work. A waiter's class improves by one for every aging_seconds it has
+    waited, so a steady stream of interactive calls can delay background
+    calls but never starve them. Rate-limit admission happens after a slot
+    is granted, so only slot holders queue on the buckets.
+    """
+
+    def __init__(self, max_in_flight: int, max_retries: int, limits: Dict[str, ProviderLimits],
+                 aging_seconds: float = 15.0, breaker_failures: int = 5, breaker_cooldown: float = 30.0,
+                 hedging: bool = True):
+        """
+        Args:
+            max_in_flight: LLM requests allowed in flight at once, across providers
+            max_retries: Retries for rate-limited or transient failures
+            limits: Rate limits per provider name
+            aging_seconds: Wait after which a queued call is promoted one priority class
+            breaker_failures: Consecutive provider failures that open its breaker (0 disables)
+            breaker_cooldown: Seconds an open breaker fails fast before probing again
+            hedging: Allow call sites to hedge requests
+        """
+        if aging_seconds <= 0:
+            raise ValueError(f"aging_seconds must be positive, got {aging_seconds}")
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.limits = limits
+        self.aging_seconds = aging_seconds
+        self._free_slots = max_in_flight
+        self._waiters: List[_SlotWaiter] = []
+        self._seq = itertools.count()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._groq: Optional[AsyncGroq] = None
+        self.in_flight = 0
+        self._callers: Dict[str, Dict[str, float]] = {}
+        self._dispatched = {priority.name.lower(): 0 for priority in LLMPriority}
+        self._promoted = 0
+        self.single_flight = SingleFlight()
+        self.breakers = {name: CircuitBreaker(name, breaker_failures, breaker_cooldown) for name in limits}
+        self.hedging = hedging
+        self._latencies: Dict[str, deque] = {}
+
+    @property
+    def groq(self) -> AsyncGroq:
+        """Groq client on the shared connection pool (retries are done by the gateway)"""
+        if self._groq is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_in_flight,
+                    max_keepalive_connections=self.max_in_flight,
+                    keepalive_expiry=60
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0)
+            )
+            self._groq = AsyncGroq(api_key=settings.GROQ_API_KEY, http_client=self._http_client, max_retries=0)
+        return self._groq
+
+    async def _acquire_slot(self, priority: int):
+        """Wait for an in-flight slot; freed slots go to the best (aged) priority"""
+        if self._free_slots > 0 and not self._waiters:
+            self._free_slots -= 1
+            return
+        waiter = _SlotWaiter(priority, next(self._seq), asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release_slot()  # Granted just before the cancellation; pass it on
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def _effective_priority(self, waiter: _SlotWaiter, now: float) -> float:
+        return waiter.priority - (now - waiter.enqueued) / self.aging_seconds
+
+    def _release_slot(self):
+        """Hand a finished call's slot to the next waiter, or free it"""
+        # Waiters cancelled (deadline, lost hedge, disconnect) but not yet resumed
+        # to remove themselves are dropped rather than handed a slot they can't take
+        self._waiters = [w for w in self._waiters if not w.future.done()]
+        if not self._waiters:
+            self._free_slots += 1
+            return
+        now = time.monotonic()
+        waiter = min(self._waiters, key=lambda w: (self._effective_priority(w, now), w.seq))
+        if waiter.priority > min(w.priority for w in self._waiters):
+            self._promoted += 1  # Aging let it overtake a higher class
+        self._waiters.remove(waiter)
+        waiter.future.set_result(None)
+
+    async def close(self):
+        """Close pooled connections (called on shutdown)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._groq = None
+
+    def _caller_metrics(self, caller: str) -> Dict[str, float]:
+        return self._callers.setdefault(caller, {
+            "calls": 0, "errors": 0, "retries": 0, "coalesced": 0,
+            "queue_wait_ms": 0, "max_queue_wait_ms": 0, "latency_ms": 0,
+            "prompt_tokens": 0, "completion_tokens": 0,
+            "streams": 0, "first_token_ms": 0, "max_first_token_ms": 0, "stream_ms": 0,
+            "deadline_exceeded": 0, "circuit_rejected": 0, "hedged": 0, "hedge_wins": 0,
+            "streams_abandoned": 0
+        })
+
+    def _hedge_delay(self, caller: str) -> Optional[float]:
+        """p95 latency of the caller's recent successful calls, in seconds"""
+        samples = self._latencies.get(caller)
+        if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[int(0.95 * (len(ordered) - 1))] / 1000
+
+    async def _hedged(self, caller: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run call(), starting a duplicate if it is slower than the caller's p95
+
+        The first successful response wins and the other request is
+        cancelled. No hedge is sent without enough latency history or when
+        every slot is busy (it would only queue behind the original).
+        """
+        primary = asyncio.ensure_future(call())
+        delay = self._hedge_delay(caller)
+        if delay is None:
+            return await primary
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except BaseException:
+            primary.cancel()
+            raise
+        if done or self._free_slots == 0:
+            return await primary
+
+        metrics = self._caller_metrics(caller)
+        metrics["hedged"] += 1
+        backup = asyncio.ensure_future(call())
+        pending = {primary, backup}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            metrics["hedge_wins"] += 1
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def chat(self, caller: str, priority: LLMPriority = LLMPriority.STANDARD,
+                   single_flight: bool = True, deadline: Optional[float] = None,
+                   hedge: bool = False, **kwargs) -> Any:
+        """
+        Groq chat completion through the gateway
+
+        Concurrent requests with the same (whitespace-normalized) messages,
+        model and parameters share one provider call and its response, e.g.
+        a double-clicked "Start interview". The call runs at the priority of
+        whichever request started it.
+
+        Args:
+            caller: Name metrics are recorded under (e.g. "resume_extraction")
+            priority: Dispatch class when slots are contended
+            single_flight: Join an identical in-flight request instead of sending another
+            deadline: Seconds the caller is willing to wait in total (None waits indefinitely)
+            hedge: Send a duplicate request if this one is slower than the caller's p95
+            **kwargs: Arguments for chat.completions.create
+
+        Returns:
+            The completion response
+        """
+        prompt_tokens = sum(estimate_tokens(str(message.get("content", ""))) for message in kwargs.get("messages", []))
+        estimated = prompt_tokens + kwargs.get("max_tokens", 1024)
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+        def attempt():
+            # Hedged duplicates share the original's deadline
+            return self.run(
+                caller, lambda: self.groq.chat.completions.create(**kwargs),
+                provider="groq", estimated_tokens=estimated, priority=priority,
+                deadline=deadline_at - time.monotonic() if deadline_at is not None else None
+            )
+
+        def call():
+            if hedge and self.hedging:
+                return self._hedged(caller, attempt)
+            return attempt()
+
+        if not single_flight or kwargs.get("stream"):
+            return await call()
+        key = chat_request_key("groq", kwargs)
+        if self.single_flight.joined(key):
+            self._caller_metrics(caller)["coalesced"] += 1
+        return await self.single_flight.do(key, call)
+
+    async def stream_chat(self, caller: str, priority: LLMPriority = LLMPriority.STANDARD,
+                          deadline: Optional[float] = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Streamed Groq chat completion through the gateway
+
+        The request is admitted and retried like chat(), but its in-flight
+        slot is held until the stream is exhausted or closed, or its deadline
+        passes or the consumer stops pulling for STREAM_IDLE_SECONDS while
+        the stream is suspended; pulling again after that raises
+        LLMDeadlineExceeded. Close the stream (e.g. contextlib.aclosing)
+        rather than relying on the idle release. Retries only
+        cover opening the stream; an error mid-stream is raised to the
+        caller. Streams are never coalesced. Time to first token and total
+        stream time (both including queueing) are recorded per caller.
+
+        Args:
+            caller: Name metrics are recorded under
+            priority: Dispatch class when slots are contended
+            deadline: Seconds allowed for the whole stream, queueing included
+            **kwargs: Arguments for chat.completions.create (stream is forced on)
+
+        Yields:
+            Content deltas as they arrive
+        """
+        kwargs["stream"] = True
+        prompt_tokens = sum(estimate_tokens(str(message.get("content", ""))) for message in kwargs.get("messages", []))
+        estimated = prompt_tokens + kwargs.get("max_tokens", 1024)
+        limits = self.limits["groq"]
+        metrics = self._caller_metrics(caller)
+        started = time.perf_counter()
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+        stream = await self.run(
+            caller, lambda: self.groq.chat.completions.create(**kwargs),
+            provider="groq", estimated_tokens=estimated, priority=priority, hold_slot=True,
+            deadline=deadline
+        )
+        usage = None
+        first_token_ms = None
+        chunks = stream.__aiter__()
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                self._end_stream()
+
+        def on_idle():
+            # Nobody is pulling: give the slot back and drop the connection
+            metrics["streams_abandoned"] += 1
+            print(f"⚠️ {caller}: stream left unconsumed, releasing its LLM slot")
+            release()
+            close = getattr(stream, "close", None)
+            if close is not None:
+                asyncio.ensure_future(close())
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    if deadline_at is None:
+                        chunk = await chunks.__anext__()
+                    else:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), deadline_at - time.monotonic())
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    metrics["deadline_exceeded"] += 1
+                    self.breakers["groq"].record_failure()
+                    raise LLMDeadlineExceeded(f"{caller}: stream not finished within {deadline:g}s")
+                x_groq = getattr(chunk, "x_groq", None)
+                if x_groq is not None and getattr(x_groq, "usage", None) is not None:
+                    usage = x_groq.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if first_token_ms is None:
+                        first_token_ms = round((time.perf_counter() - started) * 1000)
+                        metrics["streams"] += 1
+                        metrics["first_token_ms"] += first_token_ms
+                        metrics["max_first_token_ms"] = max(metrics["max_first_token_ms"], first_token_ms)
+                    idle_for = STREAM_IDLE_SECONDS
+                    if deadline_at is not None:
+                        idle_for = min(idle_for, max(deadline_at - time.monotonic(), 0))
+                    watchdog = loop.call_later(idle_for, on_idle)
+                    try:
+                        yield chunk.choices[0].delta.content
+                    finally:
+                        watchdog.cancel()
+                    if released:
+                        metrics["deadline_exceeded"] += 1
+                        raise LLMDeadlineExceeded(f"{caller}: stream resumed after its slot was released")
+        finally:
+            release()
+            if first_token_ms is not None:
+                metrics["stream_ms"] += round((time.perf_counter() - started) * 1000)
+            close = getattr(stream, "close", None)
+            if close is not None:
+                await close()
+            if usage is not None:
+                spent = (usage.prompt_tokens or 0) + (usage.completion_tokens or 0)
+                await limits.settle(estimated - spent)
+                metrics["prompt_tokens"] += usage.prompt_tokens or 0
+                metrics["completion_tokens"] += usage.completion_tokens or 0
+
+    def _end_stream(self):
+        """Hand back the slot held by a finished stream"""
+        self.in_flight -= 1
+        self._release_slot()
+
+    async def run(self, caller: str, call: Callable[[], Awaitable[Any]],
+                  provider: str = "groq", estimated_tokens: int = 1024,
+                  priority: LLMPriority = LLMPriority.STANDARD, hold_slot: bool = False,
+                  deadline: Optional[float] = None) -> Any:
+        """
+        Run one provider call under the gateway's limits, retrying rate-limited
+        and transient failures
+
+        Args:
+            caller: Name metrics are recorded under
+            call: Zero-argument coroutine factory making the request (called once per attempt)
+            provider: Key into the per-provider limits
+            estimated_tokens: Upper-bound token estimate used for admission
+            priority: Dispatch class when slots are contended
+            hold_slot: Keep the in-flight slot after a successful call (for streams);
+                the caller must hand it back with _end_stream()
+            deadline: Seconds allowed for queueing, admission, attempts and backoff
+
+        Returns:
+            Whatever call() returns
+
+        Raises:
+            CircuitOpenError: The provider's breaker is open
+            LLMDeadlineExceeded: The deadline passed first
+        """
+        limits = self.limits[provider]
+        breaker = self.breakers[provider]
+        metrics = self._caller_metrics(caller)
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+        def remaining() -> Optional[float]:
+            if deadline_at is None:
+                return None
+            left = deadline_at - time.monotonic()
+            if left <= 0:
+                metrics["deadline_exceeded"] += 1
+                raise LLMDeadlineExceeded(f"{caller}: no {provider} response within {deadline:g}s")
+            return left
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                breaker.check()
+            except CircuitOpenError:
+                metrics["circuit_rejected"] += 1
+                raise
+            queued = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._acquire_slot(priority), remaining())
+            except asyncio.TimeoutError:
+                remaining()
+                raise
+            try:
+                await asyncio.wait_for(limits.admit(estimated_tokens), remaining())
+            except BaseException as e:
+                self._release_slot()
+                if isinstance(e, asyncio.TimeoutError):
+                    remaining()
+                raise
+            self._dispatched[LLMPriority(priority).name.lower()] += 1
+            queue_wait_ms = round((time.perf_counter() - queued) * 1000)
+            metrics["queue_wait_ms"] += queue_wait_ms
+            metrics["max_queue_wait_ms"] = max(metrics["max_queue_wait_ms"], queue_wait_ms)
+
+            self.in_flight += 1
+            started = time.perf_counter()
+            holding = False
+            try:
+                response = await asyncio.wait_for(call(), remaining())
+                holding = hold_slot
+            except Exception as e:
+                await limits.settle(estimated_tokens)  # Nothing was spent, hand the estimate back
+                if is_provider_failure(e):
+                    breaker.record_failure()
+                if isinstance(e, asyncio.TimeoutError) and deadline_at is not None and time.monotonic() >= deadline_at:
+                    metrics["errors"] += 1
+                    remaining()
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    metrics["errors"] += 1
+                    raise
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt) * random.uniform(0.5, 1.0)
+                if _status_code(e) == 429:
+                    await limits.pause(delay)
+                left = remaining()
+                if left is not None and delay >= left:
+                    metrics["errors"] += 1
+                    raise  # The retry couldn't finish in time anyway
+                metrics["retries"] += 1
+                print(f"⚠️ {caller}: {provider} call failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            finally:
+                if not holding:
+                    self.in_flight -= 1
+                    self._release_slot()
+
+            breaker.record_success()
+            latency_ms = round((time.perf_counter() - started) * 1000)
+            self._latencies.setdefault(caller, deque(maxlen=LATENCY_WINDOW)).append(latency_ms)
+            usage = _usage(response)
+            spent = usage["prompt_tokens"] + usage["completion_tokens"]
+            if spent:
+                await limits.settle(estimated_tokens - spent)
+            metrics["calls"] += 1
+            metrics["latency_ms"] += latency_ms
+            metrics["prompt_tokens"] += usage["prompt_tokens"]
+            metrics["completion_tokens"] += usage["completion_tokens"]
+            return response
+
+    def stats(self) -> Dict:
+        """Gateway occupancy, provider limits and per-caller totals/averages"""
+        callers = {}
+        for caller, metrics in self._callers.items():
+            attempts = metrics["calls"] + metrics["errors"] + metrics["retries"]
+            callers[caller] = {
+                **metrics,
+                "avg_queue_wait_ms": round(metrics["queue_wait_ms"] / attempts) if attempts else 0,
+                "avg_latency_ms": round(metrics["latency_ms"] / metrics["calls"]) if metrics["calls"] else 0,
+                "avg_first_token_ms": round(metrics["first_token_ms"] / metrics["streams"]) if metrics["streams"] else 0,
+                "avg_stream_ms": round(metrics["stream_ms"] / metrics["streams"]) if metrics["streams"] else 0
+            }
+        waiting = {priority.name.lower(): 0 for priority in LLMPriority}
+        for waiter in self._waiters:
+            waiting[LLMPriority(waiter.priority).name.lower()] += 1
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "waiting_by_priority": waiting,
+            "dispatched_by_priority": dict(self._dispatched),
+            "promoted_by_aging": self._promoted,
+            "single_flight": self.single_flight.stats(),
+            "providers": {
+                name: {**limits.stats(), "breaker": self.breakers[name].stats()}
+                for name, limits in self.limits.items()
+            },
+            "callers": callers
+        }
+
+
+# Singleton instance
+_quota = create_quota_backend()
+llm_gateway = LLMGateway(
+    max_in_flight=settings.LLM_MAX_IN_FLIGHT,
+    max_retries=settings.LLM_MAX_RETRIES,
+    aging_seconds=settings.LLM_PRIORITY_AGING_SECONDS,
+    breaker_failures=settings.LLM_BREAKER_FAILURE_THRESHOLD,
+    breaker_cooldown=settings.LLM_BREAKER_COOLDOWN_SECONDS,
+    hedging=settings.LLM_HEDGING_ENABLED,
+    limits={
+        "groq": ProviderLimits("groq", settings.GROQ_REQUESTS_PER_MINUTE, settings.GROQ_TOKENS_PER_MINUTE, _quota),
+        "gemini": ProviderLimits("gemini", settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_TOKENS_PER_MINUTE, _quota)
+    }
+)
@@ -0,0 +1,195 @@
+"""
+LLM quota - Requests/tokens-per-minute budgets shared by every worker process
+"""
+import asyncio
+import json
+import os
+import re
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict
+from config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# How long a waiter sleeps at most before re-checking a shared budget, since
+# other processes may hand tokens back (settle) before the computed wait is up
+MAX_POLL_SECONDS = 1.0
+
+# Optimistic-concurrency attempts for the Mongo backend before giving up on one update
+MONGO_UPDATE_ATTEMPTS = 8
+
+
+def initial_state(requests_per_minute: int, tokens_per_minute: int) -> Dict[str, float]:
+    """A full bucket pair with no cool-down"""
+    return {
+        "requests": float(requests_per_minute),
+        "tokens": float(tokens_per_minute),
+        "updated": time.time(),
+        "paused_until": 0.0
+    }
+
+
+def _refill(state: Dict[str, float], requests_per_minute: int, tokens_per_minute: int, now: float):
+    elapsed = max(0.0, now - state["updated"])
+    if requests_per_minute:
+        state["requests"] = min(requests_per_minute, state["requests"] + elapsed * requests_per_minute / 60)
+    if tokens_per_minute:
+        state["tokens"] = min(tokens_per_minute, state["tokens"] + elapsed * tokens_per_minute / 60)
+    state["updated"] = max(state["updated"], now)
+
+
+def take(state: Dict[str, float], requests_per_minute: int, tokens_per_minute: int, tokens: float) -> float:
+    """
+    Try to take one request and `tokens` tokens from a bucket pair
+
+    Both buckets hold one minute's worth and refill continuously. Requests
+    larger than the token capacity are clamped to it so they can still run.
+
+    Returns:
+        0 if granted (state updated), otherwise seconds until it could be
+    """
+    now = time.time()
+    _refill(state, requests_per_minute, tokens_per_minute, now)
+    if state["paused_until"] > now:
+        return state["paused_until"] - now
+    if tokens_per_minute:
+        tokens = min(tokens, tokens_per_minute)
+    waits = [0.0]
+    if requests_per_minute and state["requests"] < 1:
+        waits.append((1 - state["requests"]) * 60 / requests_per_minute)
+    if tokens_per_minute and state["tokens"] < tokens:
+        waits.append((tokens - state["tokens"]) * 60 / tokens_per_minute)
+    wait = max(waits)
+    if wait == 0:
+        if requests_per_minute:
+            state["requests"] -= 1
+        if tokens_per_minute:
+            state["tokens"] -= tokens
+    return wait
+
+
+class QuotaBackend(ABC):
+    """
+    Storage for provider bucket state
+
+    Every operation is a read-modify-write of one provider's state dict
+    (see initial_state) through a function; backends only have to make that
+    update atomic for the processes that share them.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def update(self, key: str, initial: Callable[[], Dict[str, float]],
+                     mutate: Callable[[Dict[str, float]], float]) -> float:
+        """Atomically apply mutate to the state stored under key and return its result"""
+
+
+class MemoryQuota(QuotaBackend):
+    """Per-process budgets (single worker, or limits already divided per worker)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._states: Dict[str, Dict[str, float]] = {}
+
+    async def update(self, key, initial, mutate):
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = initial()
+        return mutate(state)
+
+
+class FileLockQuota(QuotaBackend):
+    """
+    Budgets shared by the worker processes on one host
+
+    Each provider's state is a small JSON file updated under an exclusive
+    flock, so every uvicorn worker draws from the same bucket.
+    """
+
+    name = "file"
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Directory for the state files (must be shared by the workers)
+        """
+        if fcntl is None:
+            raise RuntimeError("LLM_QUOTA_BACKEND=file needs fcntl (POSIX); use memory or mongo")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _update_locked(self, key, initial, mutate):
+        path = self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.json"
+        with open(path, "a+") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                handle.seek(0)
+                raw = handle.read()
+                state = json.loads(raw) if raw else initial()
+                result = mutate(state)
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(state))
+                handle.flush()
+                return result
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    async def update(self, key, initial, mutate):
+        return await asyncio.to_thread(self._update_locked, key, initial, mutate)
+
+
+class MongoQuota(QuotaBackend):
+    """
+    Budgets shared by every node using the same database
+
+    State lives in the `llm_quota` collection, one document per provider,
+    updated with compare-and-swap on a version field. Node clocks are used
+    for refill, so keep them NTP-synced.
+    """
+
+    name = "mongo"
+    COLLECTION = "llm_quota"
+
+    async def update(self, key, initial, mutate):
+        from pymongo.errors import DuplicateKeyError
+        from utils.database import Database
+
+        collection = Database.get_collection(self.COLLECTION)
+        for _ in range(MONGO_UPDATE_ATTEMPTS):
+            doc = await collection.find_one({"_id": key})
+            if doc is None:
+                state = initial()
+                result = mutate(state)
+                try:
+                    await collection.insert_one({"_id": key, "version": 1, **state})
+                    return result
+                except DuplicateKeyError:
+                    continue
+            version = doc.pop("version", 0)
+            doc.pop("_id")
+            result = mutate(doc)
+            updated = await collection.update_one(
+                {"_id": key, "version": version},
+                {"$set": {**doc, "version": version + 1}}
+            )
+            if updated.modified_count:
+                return result
+        raise RuntimeError(f"LLM quota update for {key} kept conflicting")
+
+
+def create_quota_backend() -> QuotaBackend:
+    """Build the backend selected by LLM_QUOTA_BACKEND"""
+    if settings.LLM_QUOTA_BACKEND == "file":
+        return FileLockQuota(settings.LLM_QUOTA_DIR or os.path.join(tempfile.gettempdir(), "llm-quota"))
+    if settings.LLM_QUOTA_BACKEND == "mongo":
+        return MongoQuota()
+    return MemoryQuota()
@@ -0,0 +1,444 @@
+"""
+LLM router - Provider-agnostic completions sent to the fastest healthy backend
+"""
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from config import settings
+from services.llm_gateway import LLMDeadlineExceeded, LLMPriority, llm_gateway
+
+# Backends each call class prefers, best first. Enabled providers missing
+# from a route are appended after it, so every call can fail over to them.
+CALL_ROUTES: Dict[str, List[str]] = {
+    "interview_questions": ["groq", "gemini"],
+    "follow_up_question": ["groq", "gemini"],
+    "question_generator": ["gemini", "groq"],
+    "question_generator.followup": ["gemini", "groq"],
+    "question_generator.evaluate": ["gemini", "groq"],
+    "sentiment_analyzer": ["gemini", "groq"],
+    "report_generator": ["gemini", "groq"],
+}
+
+# Outcomes older than this no longer count towards a backend's latency or error rate
+STATS_WINDOW_SECONDS = 300
+STATS_MAX_SAMPLES = 200
+# Outcomes needed before a backend's latency or error rate is trusted
+MIN_SAMPLES = 5
+
+
+class Completion:
+    """Text of a completion and where it came from"""
+
+    def __init__(self, text: str, provider: str, model: str, usage: Optional[Dict[str, int]] = None):
+        self.text = text
+        self.provider = provider
+        self.model = model
+        self.usage = usage or {"prompt_tokens": 0, "completion_tokens": 0}
+
+
+class LLMProvider(ABC):
+    """
+    One LLM backend behind the router
+
+    Messages are OpenAI-style {"role", "content"} dicts whatever the
+    provider. Providers that can't stream natively yield the whole
+    completion as a single delta.
+    """
+
+    name = "base"
+
+    def available(self) -> bool:
+        """Whether calls can be sent now (configured, and its breaker isn't open)"""
+        return True
+
+    @abstractmethod
+    async def complete(self, caller: str, model: str, messages: List[Dict], temperature: float,
+                       max_tokens: int, priority: LLMPriority, deadline: Optional[float],
+                       hedge: bool = False) -> Completion:
+        """Run one completion (deadline in seconds, None waits indefinitely)"""
+
+    async def stream(self, caller: str, model: str, messages: List[Dict], temperature: float,
+                     max_tokens: int, priority: LLMPriority, deadline: Optional[float]) -> AsyncIterator[str]:
+        """Run one completion, yielding its text as it arrives"""
+        completion = await self.complete(caller, model, messages, temperature, max_tokens, priority, deadline)
+        yield completion.text
+
+
+class GroqProvider(LLMProvider):
+    """Groq chat completions through the shared LLM gateway"""
+
+    name = "groq"
+
+    def available(self) -> bool:
+        return bool(settings.GROQ_API_KEY) and llm_gateway.breakers["groq"].allows_calls
+
+    async def complete(self, caller, model, messages, temperature, max_tokens, priority, deadline, hedge=False):
+        response = await llm_gateway.chat(
+            caller, priority=priority, deadline=deadline, hedge=hedge,
+            model=model, messages=messages, temperature=temperature, max_tokens=max_tokens
+        )
+        usage = getattr(response, "usage", None)
+        return Completion(
+            response.choices[0].message.content or "", self.name, model,
+            {"prompt_tokens": usage.prompt_tokens or 0, "completion_tokens": usage.completion_tokens or 0}
+            if usage is not None else None
+        )
+
+    async def stream(self, caller, model, messages, temperature, max_tokens, priority, deadline):
+        deltas = llm_gateway.stream_chat(
+            caller, priority=priority, deadline=deadline,
+            model=model, messages=messages, temperature=temperature, max_tokens=max_tokens
+        )
+        try:
+            async for delta in deltas:
+                yield delta
+        finally:
+            await deltas.aclose()
+
+
+class GeminiProvider(LLMProvider):
+    """
+    Google Gemini through the shared LLM gateway
+
+    Requires google-generativeai (`pip install google-generativeai`) and
+    GEMINI_API_KEY; without them the provider reports itself unavailable
+    and the router skips it. The gemini-pro API has no system role, so the
+    messages are sent as one prompt.
+    """
+
+    name = "gemini"
+
+    def __init__(self, api_key: str):
+        """
+        Args:
+            api_key: Gemini API key
+        """
+        self._genai = None
+        if api_key:
+            try:
+                import google.generativeai as genai
+                genai.configure(api_key=api_key)
+                self._genai = genai
+            except ImportError:
+                print("⚠️ GEMINI_API_KEY is set but google-generativeai is not installed; Gemini disabled")
+        self._models: Dict[str, object] = {}
+
+    def available(self) -> bool:
+        return self._genai is not None and llm_gateway.breakers["gemini"].allows_calls
+
+    def _model(self, model: str):
+        if model not in self._models:
+            self._models[model] = self._genai.GenerativeModel(model)
+        return self._models[model]
+
+    async def complete(self, caller, model, messages, temperature, max_tokens, priority, deadline, hedge=False):
+        if self._genai is None:
+            raise RuntimeError("Gemini provider needs GEMINI_API_KEY and google-generativeai")
+        prompt = "\n\n".join(str(message.get("content", "")) for message in messages)
+        config = {"temperature": temperature, "max_output_tokens": max_tokens}
+        response = await llm_gateway.run(
+            caller, lambda: self._model(model).generate_content_async(prompt, generation_config=config),
+            provider="gemini", estimated_tokens=len(prompt) // 4 + max_tokens, priority=priority,
+            deadline=deadline
+        )
+        metadata = getattr(response, "usage_metadata", None)
+        return Completion(
+            response.text, self.name, model,
+            {
+                "prompt_tokens": getattr(metadata, "prompt_token_count", 0) or 0,
+                "completion_tokens": getattr(metadata, "candidates_token_count", 0) or 0
+            } if metadata is not None else None
+        )
+
+
+class FakeProvider(LLMProvider):
+    """
+    Local stand-in provider for tests and offline development
+
+    No network calls: replies come from `reply` (messages -> text) after
+    `latency` seconds, and a `failure_rate` share of calls raise, so
+    routing and failover can be exercised without API keys.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0,
+                 reply: Optional[Callable[[List[Dict]], str]] = None):
+        """
+        Args:
+            latency: Seconds each call takes
+            failure_rate: Probability (0-1) that a call raises
+            reply: Builds the completion text from the messages (default echoes the last one)
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.reply = reply or (lambda messages: f"Fake completion: {messages[-1].get('content', '')[:200]}")
+        self.calls = 0
+
+    async def complete(self, caller, model, messages, temperature, max_tokens, priority, deadline, hedge=False):
+        self.calls += 1
+        if deadline is not None and self.latency > deadline:
+            await asyncio.sleep(deadline)
+            raise LLMDeadlineExceeded(f"{caller}: no fake response within {deadline:g}s")
+        await asyncio.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise RuntimeError("Fake provider failure")
+        return Completion(self.reply(messages), self.name, model)
+
+    async def stream(self, caller, model, messages, temperature, max_tokens, priority, deadline):
+        completion = await self.complete(caller, model, messages, temperature, max_tokens, priority, deadline)
+        for word in completion.text.split(" "):
+            yield word + " "
+
+
+class _Outcomes:
+    """Recent (time, ok, latency_ms) outcomes of one backend"""
+
+    def __init__(self):
+        self._samples: deque = deque(maxlen=STATS_MAX_SAMPLES)
+
+    def record(self, ok: bool, latency_ms: float):
+        self._samples.append((time.monotonic(), ok, latency_ms))
+
+    def _recent(self) -> List[Tuple[float, bool, float]]:
+        cutoff = time.monotonic() - STATS_WINDOW_SECONDS
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        return list(self._samples)
+
+    def error_rate(self) -> Optional[float]:
+        recent = self._recent()
+        if len(recent) < MIN_SAMPLES:
+            return None
+        return sum(1 for _, ok, _ in recent if not ok) / len(recent)
+
+    def latency_ms(self) -> Optional[float]:
+        """Median latency of recent successful calls"""
+        latencies = sorted(latency for _, ok, latency in self._recent() if ok)
+        if len(latencies) < MIN_SAMPLES:
+            return None
+        return latencies[len(latencies) // 2]
+
+    def stats(self) -> Dict:
+        recent = self._recent()
+        error_rate = self.error_rate()
+        latency = self.latency_ms()
+        return {
+            "samples": len(recent),
+            "error_rate": round(error_rate, 3) if error_rate is not None else None,
+            "p50_latency_ms": round(latency) if latency is not None else None
+        }
+
+
+class LLMRouter:
+    """
+    Sends each call class to its fastest healthy backend, failing over on errors
+
+    A backend is a (provider, model) pair. Its error rate is tracked across
+    call classes; latency is tracked per call class, since a short
+    follow-up and a 2000-token question set aren't comparable. On every
+    call the class's backends are ordered:
+
+    1. healthy ones (recent error rate under max_error_rate) before
+       unhealthy ones; providers that aren't available (not configured,
+       or circuit breaker open) are left out
+    2. then by median recent latency, backends without enough samples last
+    3. then by the class's preference in CALL_ROUTES
+
+    The call goes to the first backend and fails over down the list on any
+    error, within one overall deadline. A small share of calls
+    (explore_rate) goes to the second-best healthy backend first, so
+    backends that aren't currently winning keep fresh latency numbers. Streams only fail
+    over before their first delta.
+    """
+
+    def __init__(self, providers: Dict[str, LLMProvider], models: Dict[str, str],
+                 max_error_rate: float = 0.5, explore_rate: float = 0.05):
+        """
+        Args:
+            providers: Enabled providers by name, in overall preference order
+            models: Model used on each provider
+            max_error_rate: Recent error rate above which a backend is unhealthy
+            explore_rate: Share of calls sent to the runner-up backend first
+        """
+        self.providers = providers
+        self.models = models
+        self.max_error_rate = max_error_rate
+        self.explore_rate = explore_rate
+        self._health: Dict[Tuple[str, str], _Outcomes] = {}
+        self._latency: Dict[Tuple[str, str, str], _Outcomes] = {}
+        self._served: Dict[str, Dict[str, int]] = {}
+        self._failovers = 0
+        self._explored = 0
+
+    def backends(self, call_class: str) -> List[Tuple[str, str]]:
+        """(provider, model) pairs a call class may use, in configured preference order"""
+        route = [name for name in CALL_ROUTES.get(call_class, []) if name in self.providers]
+        route += [name for name in self.providers if name not in route]
+        return [(name, self.models[name]) for name in route]
+
+    def _healthy(self, provider: str, model: str) -> bool:
+        error_rate = self._health.setdefault((provider, model), _Outcomes()).error_rate()
+        return error_rate is None or error_rate <= self.max_error_rate
+
+    def _ordered(self, call_class: str, explore: bool = True) -> List[Tuple[str, str]]:
+        """Available backends for a call class, best first"""
+        def key(ranked):
+            rank, (provider, model) = ranked
+            latency = self._latency.setdefault((call_class, provider, model), _Outcomes()).latency_ms()
+            return (not self._healthy(provider, model), latency is None, latency or 0.0, rank)
+
+        available = [
+            (rank, backend) for rank, backend in enumerate(self.backends(call_class))
+            if self.providers[backend[0]].available()
+        ]
+        ordered = [backend for _, backend in sorted(available, key=key)]
+        healthy = sum(1 for provider, model in ordered if self._healthy(provider, model))
+        if explore and healthy > 1 and random.random() < self.explore_rate:
+            ordered[0], ordered[1] = ordered[1], ordered[0]
+            self._explored += 1
+        return ordered
+
+    def _record(self, call_class: str, provider: str, model: str, ok: bool, latency_ms: float):
+        self._health.setdefault((provider, model), _Outcomes()).record(ok, latency_ms)
+        self._latency.setdefault((call_class, provider, model), _Outcomes()).record(ok, latency_ms)
+        if ok:
+            served = self._served.setdefault(call_class, {})
+            served[f"{provider}:{model}"] = served.get(f"{provider}:{model}", 0) + 1
+
+    def _remaining(self, call_class: str, deadline_at: Optional[float]) -> Optional[float]:
+        if deadline_at is None:
+            return None
+        left = deadline_at - time.monotonic()
+        if left <= 0:
+            raise LLMDeadlineExceeded(f"{call_class}: no backend answered in time")
+        return left
+
+    async def complete(self, call_class: str, messages: List[Dict], temperature: float = 0.7,
+                       max_tokens: int = 1024, priority: LLMPriority = LLMPriority.STANDARD,
+                       deadline: Optional[float] = None, hedge: bool = False) -> Completion:
+        """
+        Run a completion on the best backend for the call class
+
+        Args:
+            call_class: Route name (see CALL_ROUTES); also the gateway caller name
+            messages: OpenAI-style chat messages
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            priority: Gateway dispatch class
+            deadline: Seconds for the whole call, failovers included
+            hedge: Let the backend hedge slow requests (Groq only)
+
+        Returns:
+            The completion and the backend that produced it
+
+        Raises:
+            The last backend's error if every backend failed
+        """
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        error: Optional[Exception] = None
+        for provider, model in self._ordered(call_class):
+            remaining = self._remaining(call_class, deadline_at)
+            if error is not None:
+                self._failovers += 1
+                print(f"🔀 {call_class}: failing over to {provider}:{model} ({type(error).__name__})")
+            started = time.perf_counter()
+            try:
+                completion = await self.providers[provider].complete(
+                    call_class, model, messages, temperature, max_tokens, priority, remaining, hedge
+                )
+            except Exception as e:
+                self._record(call_class, provider, model, False, (time.perf_counter() - started) * 1000)
+                error = e
+                continue
+            self._record(call_class, provider, model, True, (time.perf_counter() - started) * 1000)
+            return completion
+        raise error or RuntimeError(f"{call_class}: no LLM provider available")
+
+    async def stream(self, call_class: str, messages: List[Dict], temperature: float = 0.7,
+                     max_tokens: int = 1024, priority: LLMPriority = LLMPriority.STANDARD,
+                     deadline: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Stream a completion from the best backend for the call class
+
+        Latency is recorded as time to first delta. A backend that fails
+        after its first delta ends the stream with its error; before that,
+        the next backend is tried.
+
+        Yields:
+            Content deltas as they arrive
+        """
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        error: Optional[Exception] = None
+        for provider, model in self._ordered(call_class):
+            remaining = self._remaining(call_class, deadline_at)
+            if error is not None:
+                self._failovers += 1
+                print(f"🔀 {call_class}: failing over to {provider}:{model} ({type(error).__name__})")
+            started = time.perf_counter()
+            first_delta_ms = None
+            deltas = self.providers[provider].stream(
+                call_class, model, messages, temperature, max_tokens, priority, remaining
+            )
+            try:
+                async for delta in deltas:
+                    if first_delta_ms is None:
+                        first_delta_ms = (time.perf_counter() - started) * 1000
+                    yield delta
+            except Exception as e:
+                self._record(call_class, provider, model, False, (time.perf_counter() - started) * 1000)
+                if first_delta_ms is not None:
+                    raise
+                error = e
+                continue
+            finally:
+                await deltas.aclose()
+            self._record(call_class, provider, model, True,
+                         first_delta_ms if first_delta_ms is not None else (time.perf_counter() - started) * 1000)
+            return
+        raise error or RuntimeError(f"{call_class}: no LLM provider available")
+
+    def stats(self) -> Dict:
+        """Backend health, per-class latency and which backends served each class"""
+        return {
+            "providers": {name: {"available": provider.available(), "model": self.models[name]}
+                          for name, provider in self.providers.items()},
+            "backends": {f"{provider}:{model}": outcomes.stats() for (provider, model), outcomes in self._health.items()},
+            "classes": {
+                call_class: {
+                    "order": [f"{provider}:{model}" for provider, model in self._ordered(call_class, explore=False)],
+                    "latency": {
+                        f"{provider}:{model}": outcomes.stats()
+                        for (cls, provider, model), outcomes in self._latency.items() if cls == call_class
+                    },
+                    "served": self._served.get(call_class, {})
+                }
+                for call_class in sorted(set(CALL_ROUTES) | set(self._served))
+            },
+            "failovers": self._failovers,
+            "explored": self._explored
+        }
+
+
+def create_llm_router() -> LLMRouter:
+    """Build the router for the providers listed in LLM_PROVIDERS"""
+    factories = {
+        "groq": GroqProvider,
+        "gemini": lambda: GeminiProvider(settings.GEMINI_API_KEY),
+        "fake": FakeProvider
+    }
+    models = {"groq": settings.GROQ_CHAT_MODEL, "gemini": settings.GEMINI_MODEL, "fake": "fake"}
+    providers = {}
+    for name in settings.LLM_PROVIDERS:
+        if name not in factories:
+            print(f"⚠️ Unknown LLM provider '{name}' in LLM_PROVIDERS, skipping")
+            continue
+        providers[name] = factories[name]()
+    return LLMRouter(providers, models, settings.LLM_ROUTER_MAX_ERROR_RATE, settings.LLM_ROUTER_EXPLORE_RATE)
+
+
+# Singleton instance
+llm_router = create_llm_router()
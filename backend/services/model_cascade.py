@@ -0,0 +1,154 @@
+"""
+Model cascade - Field-level agreement between fast-tier and full-model resume extractions
+"""
+import re
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+from utils.database import Database
+
+# Parse-result fields produced by the LLM, grouped by how they are compared
+TEXT_FIELDS = ["name", "summary"]
+STRING_LIST_FIELDS = ["skills", "certifications", "achievements", "languages"]
+RECORD_LIST_FIELDS = {
+    "experience": ("title", "company"),
+    "education": ("degree", "institution"),
+    "projects": ("name",),
+    "publications": ("title",),
+    "volunteer": ("role", "organization"),
+}
+LLM_FIELDS = TEXT_FIELDS + STRING_LIST_FIELDS + list(RECORD_LIST_FIELDS)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9+#]+")
+
+
+def _normalize(value) -> str:
+    """Lowercase and collapse punctuation/whitespace so formatting differences don't count"""
+    if value is None:
+        return ""
+    return _NON_ALNUM.sub(" ", str(value).lower()).strip()
+
+
+def _jaccard(a: set, b: set) -> float:
+    """Set overlap in [0, 1]; two empty sets agree"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _record_key(record, keys: Iterable[str]) -> str:
+    """Identity of a list entry (e.g. title + company for experience)"""
+    if isinstance(record, dict):
+        return " | ".join(_normalize(record.get(key)) for key in keys)
+    return _normalize(record)
+
+
+def field_agreement(fast: Dict, full: Dict) -> Dict[str, float]:
+    """
+    Per-field agreement between two parse results
+
+    Names must match exactly after normalization, summaries are compared by
+    word overlap, and list fields by Jaccard overlap of their normalized
+    entries (record lists on their identifying keys only).
+
+    Returns:
+        Dict of field -> score in [0, 1]
+    """
+    scores = {
+        "name": 1.0 if _normalize(fast.get("name")) == _normalize(full.get("name")) else 0.0,
+        "summary": _jaccard(set(_normalize(fast.get("summary")).split()),
+                            set(_normalize(full.get("summary")).split()))
+    }
+    for field in STRING_LIST_FIELDS:
+        scores[field] = _jaccard({_normalize(item) for item in fast.get(field) or []},
+                                 {_normalize(item) for item in full.get(field) or []})
+    for field, keys in RECORD_LIST_FIELDS.items():
+        scores[field] = _jaccard({_record_key(item, keys) for item in fast.get(field) or []},
+                                 {_record_key(item, keys) for item in full.get(field) or []})
+    return {field: round(score, 3) for field, score in scores.items()}
+
+
+def _latency_ms(parsed: Dict) -> Optional[int]:
+    return (parsed.get("parse_metrics") or {}).get("llm_latency_ms")
+
+
+class ModelCascadeMetrics:
+    """
+    Records how the fast tier compares with the full model
+
+    Every completed upgrade is stored in the `resume_model_cascade`
+    collection (models, per-tier latency, per-field agreement, whether the
+    resume was patched) for offline tuning, and running averages are kept
+    in process for /api/metrics.
+    """
+
+    COLLECTION = "resume_model_cascade"
+
+    def __init__(self):
+        self.upgrades = 0
+        self.patched = 0
+        self._latency_totals = {"fast": 0, "full": 0}
+        self._latency_counts = {"fast": 0, "full": 0}
+        self._agreement_totals: Dict[str, float] = {field: 0.0 for field in LLM_FIELDS}
+
+    async def record(self, resume_id: str, fast: Dict, full: Dict, patched: bool) -> Dict[str, float]:
+        """
+        Store one fast-vs-full comparison
+
+        Args:
+            resume_id: Resume that was upgraded
+            fast: Fast-tier parse result
+            full: Full-model parse result
+            patched: Whether the stored resume was updated with the full result
+
+        Returns:
+            Per-field agreement scores
+        """
+        agreement = field_agreement(fast, full)
+        overall = round(sum(agreement.values()) / len(agreement), 3)
+        latencies = {"fast": _latency_ms(fast), "full": _latency_ms(full)}
+
+        self.upgrades += 1
+        self.patched += int(patched)
+        for tier, latency in latencies.items():
+            if latency is not None:
+                self._latency_totals[tier] += latency
+                self._latency_counts[tier] += 1
+        for field, score in agreement.items():
+            self._agreement_totals[field] += score
+
+        try:
+            await Database.get_collection(self.COLLECTION).insert_one({
+                "resume_id": resume_id,
+                "fast_model": (fast.get("parse_metrics") or {}).get("model"),
+                "full_model": (full.get("parse_metrics") or {}).get("model"),
+                "fast_latency_ms": latencies["fast"],
+                "full_latency_ms": latencies["full"],
+                "agreement": agreement,
+                "overall_agreement": overall,
+                "patched": patched,
+                "created_at": datetime.utcnow()
+            })
+        except Exception as e:
+            print(f"⚠️ Could not record model cascade metrics: {e}")
+
+        print(f"📊 Fast/full agreement for resume {resume_id}: {overall:.0%}")
+        return agreement
+
+    def stats(self) -> Dict:
+        """Running averages since process start"""
+        return {
+            "upgrades": self.upgrades,
+            "patched": self.patched,
+            "avg_latency_ms": {
+                tier: round(self._latency_totals[tier] / count) if count else 0
+                for tier, count in self._latency_counts.items()
+            },
+            "avg_agreement": {
+                field: round(total / self.upgrades, 3) if self.upgrades else 0.0
+                for field, total in self._agreement_totals.items()
+            }
+        }
+
+
+# Singleton instance
+model_cascade_metrics = ModelCascadeMetrics()
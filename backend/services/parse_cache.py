@@ -0,0 +1,136 @@
+"""
+Resume parse cache - Reuse extracted resume data for byte-identical uploads
+"""
+import copy
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+from config import settings
+from utils.database import Database
+
+
+class ResumeParseCache:
+    """
+    Content-addressed cache of ResumeParser results
+
+    Entries are keyed by the SHA-256 of the uploaded file plus the parser's
+    extraction_version, so editing the prompt or switching models makes
+    older entries unreachable. A bounded in-process LRU sits in front of the
+    persistent `resume_parse_cache` collection.
+    """
+
+    COLLECTION = "resume_parse_cache"
+
+    def __init__(self, max_entries: int):
+        """
+        Args:
+            max_entries: Maximum number of parses kept in the in-process LRU
+        """
+        self.max_entries = max_entries
+        self._lru: "OrderedDict[str, Dict]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    @staticmethod
+    def _key(content_hash: str, version: str) -> str:
+        """Cache document _id for a file hash and extraction version"""
+        return f"{content_hash}:{version}"
+
+    def _remember(self, key: str, entry: Dict):
+        """Insert into the LRU, evicting the least recently used entry"""
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _record_hit(self, entry: Dict):
+        """Count the LLM tokens a hit avoided spending"""
+        usage = entry.get("llm_usage") or {}
+        self.tokens_saved += usage.get("total_tokens", 0)
+
+    async def get(self, content_hash: str, version: str) -> Optional[Dict]:
+        """
+        Look up a previous parse of the same file
+
+        Args:
+            content_hash: SHA-256 hex digest of the uploaded bytes
+            version: ResumeParser.extraction_version
+
+        Returns:
+            A copy of the cached parse result, or None on a miss
+        """
+        key = self._key(content_hash, version)
+
+        entry = self._lru.get(key)
+        if entry is not None:
+            self._lru.move_to_end(key)
+            self.memory_hits += 1
+            self._record_hit(entry)
+            print(f"⚡ Parse cache hit (memory): {content_hash[:12]}")
+            return copy.deepcopy(entry["parsed"])
+
+        try:
+            entry = await Database.get_collection(self.COLLECTION).find_one_and_update(
+                {"_id": key},
+                {"$inc": {"hit_count": 1}, "$set": {"last_hit_at": datetime.utcnow()}},
+                projection={"parsed": 1, "llm_usage": 1}
+            )
+        except Exception as e:
+            print(f"⚠️ Parse cache lookup failed: {e}")
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.db_hits += 1
+        self._record_hit(entry)
+        self._remember(key, {"parsed": entry["parsed"], "llm_usage": entry.get("llm_usage")})
+        print(f"⚡ Parse cache hit (database): {content_hash[:12]}")
+        return copy.deepcopy(entry["parsed"])
+
+    async def put(self, content_hash: str, version: str, parsed: Dict):
+        """
+        Store a parse result
+
+        Results without LLM usage (failed or skipped LLM extraction) are not
+        cached so a transient Groq error isn't replayed for every re-upload.
+        """
+        if not parsed.get("llm_usage"):
+            return
+
+        key = self._key(content_hash, version)
+        entry = {"parsed": copy.deepcopy(parsed), "llm_usage": parsed["llm_usage"]}
+        self._remember(key, entry)
+
+        try:
+            await Database.get_collection(self.COLLECTION).update_one(
+                {"_id": key},
+                {
+                    "$set": {**entry, "content_hash": content_hash, "version": version},
+                    "$setOnInsert": {"created_at": datetime.utcnow(), "hit_count": 0}
+                },
+                upsert=True
+            )
+        except Exception as e:
+            print(f"⚠️ Could not persist parse cache entry: {e}")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters since process start"""
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "llm_tokens_saved": self.tokens_saved,
+            "lru_size": len(self._lru),
+            "lru_capacity": self.max_entries
+        }
+
+
+# Singleton instance
+resume_parse_cache = ResumeParseCache(max_entries=settings.RESUME_CACHE_MAX_ENTRIES)
@@ -0,0 +1,188 @@
+"""
+Resume parse pool - Run CPU-bound resume text extraction in worker processes
+"""
+import asyncio
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from config import settings
+
+
+class ParsePoolFullError(Exception):
+    """Raised when the parse queue has reached its depth limit"""
+    pass
+
+
+def _warm_worker():
+    """Import the parser once per worker so the first job doesn't pay for it"""
+    import services.resume_parser  # noqa: F401
+
+
+def _extract_text_worker(file_path: str, max_serial_pages: int) -> Tuple[Optional[str], int]:
+    """
+    Entry point executed inside a worker process
+
+    Returns (text, page_count). For PDFs longer than max_serial_pages the
+    text is None and the caller fans the document out by page range instead.
+    """
+    from services.resume_parser import PdfTooLongError, resume_parser
+    try:
+        # The page count comes from the document opened for extraction
+        return resume_parser.extract_text(file_path, max_pdf_pages=max_serial_pages), 0
+    except PdfTooLongError as e:
+        return None, e.page_count
+
+
+def _extract_page_range_worker(file_path: str, first_page: int, last_page: int) -> List[Tuple[int, str, List[str]]]:
+    """Extract one page range inside a worker process"""
+    from services.resume_parser import resume_parser
+    return resume_parser.extract_pdf_page_range(file_path, first_page, last_page)
+
+
+def split_page_ranges(page_count: int, parts: int, min_pages_per_part: int) -> List[Tuple[int, int]]:
+    """
+    Split pages 1..page_count into at most `parts` contiguous, ordered ranges
+
+    Each range holds at least min_pages_per_part pages so short documents
+    aren't spread thinner than the cost of a worker round trip.
+    """
+    parts = max(1, min(parts, page_count // max(1, min_pages_per_part)))
+    size = math.ceil(page_count / parts)
+    return [(first, min(first + size - 1, page_count)) for first in range(1, page_count + 1, size)]
+
+
+class ResumeParsePool:
+    """
+    Bounded process pool for resume text extraction
+
+    pdfplumber and PyPDF2 hold the GIL for the whole extraction, so running
+    them on the event loop (or in a thread) freezes every other request on
+    the worker. Jobs are sent to a small pool of processes instead, and the
+    number of jobs running or waiting is capped so a burst of uploads fails
+    fast with ParsePoolFullError rather than queueing without bound.
+
+    PDFs with more than page_parallel_threshold pages are split into page
+    ranges that are extracted concurrently on the same workers and stitched
+    back together in page order.
+    """
+
+    def __init__(self, max_workers: int, max_queue_depth: int,
+                 page_parallel_threshold: int = 0, min_pages_per_range: int = 2):
+        """
+        Args:
+            max_workers: Number of worker processes
+            max_queue_depth: Jobs allowed to wait once all workers are busy
+            page_parallel_threshold: Page count above which a PDF is split
+                across workers (0 disables page-parallel extraction)
+            min_pages_per_range: Smallest page range handed to one worker
+        """
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.page_parallel_threshold = page_parallel_threshold
+        self.min_pages_per_range = min_pages_per_range
+        self._page_parallel_jobs = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._rejected = 0
+
+    def start(self):
+        """Create the worker processes"""
+        if self._executor is None:
+            # spawn avoids forking a process that already owns Motor/Groq sockets and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker
+            )
+            print(f"✅ Resume parse pool started ({self.max_workers} workers, queue depth {self.max_queue_depth})")
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            print("✅ Resume parse pool stopped")
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs running or queued at once"""
+        return self.max_workers + self.max_queue_depth
+
+    def stats(self) -> Dict[str, int]:
+        """Current pool occupancy"""
+        return {
+            "workers": self.max_workers,
+            "queue_depth_limit": self.max_queue_depth,
+            "in_flight": self._in_flight,
+            "queued": max(0, self._in_flight - self.max_workers),
+            "rejected": self._rejected,
+            "page_parallel_threshold": self.page_parallel_threshold,
+            "page_parallel_jobs": self._page_parallel_jobs
+        }
+
+    async def extract_text(self, file_path: str) -> str:
+        """
+        Extract resume text in a worker process
+
+        Args:
+            file_path: Path to the uploaded resume
+
+        Returns:
+            Extracted text
+
+        Raises:
+            ParsePoolFullError: If the pool is already at capacity
+        """
+        if self._in_flight >= self.capacity:
+            self._rejected += 1
+            raise ParsePoolFullError(
+                f"Resume parse queue is full ({self._in_flight} jobs in flight)"
+            )
+
+        self.start()
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            text, page_count = await loop.run_in_executor(
+                self._executor, _extract_text_worker, file_path, self.page_parallel_threshold
+            )
+            if text is None:
+                text = await self._extract_pages_in_parallel(file_path, page_count)
+            return text
+        finally:
+            self._in_flight -= 1
+
+    async def _extract_pages_in_parallel(self, file_path: str, page_count: int) -> str:
+        """Fan a long PDF out across the workers by page range and stitch the results"""
+        from services.resume_parser import resume_parser
+
+        ranges = split_page_ranges(page_count, self.max_workers, self.min_pages_per_range)
+        print(f"📚 Extracting {page_count} pages in {len(ranges)} parallel ranges")
+        self._page_parallel_jobs += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(self._executor, _extract_page_range_worker, file_path, first, last)
+                for first, last in ranges
+            ])
+        except Exception as e:
+            print(f"⚠️ Page-parallel extraction failed ({e}), extracting serially")
+            text, _ = await loop.run_in_executor(self._executor, _extract_text_worker, file_path, 0)
+            return text
+
+        # Ranges come back in submission order, so pages are already in sequence
+        pages = [page for result in results for page in result]
+        text = resume_parser.assemble_pdf_text(pages)
+        print(f"✅ Extracted {len(text)} characters from PDF across {len(ranges)} workers")
+        return text
+
+
+# Singleton instance
+parse_pool = ResumeParsePool(
+    max_workers=settings.PARSE_POOL_WORKERS,
+    max_queue_depth=settings.PARSE_QUEUE_DEPTH,
+    page_parallel_threshold=settings.PDF_PARALLEL_PAGE_THRESHOLD,
+    min_pages_per_range=settings.PDF_MIN_PAGES_PER_RANGE
+)
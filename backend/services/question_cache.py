@@ -0,0 +1,215 @@
+"""
+Question set cache - Reuse generated interview questions for equivalent candidate profiles
+"""
+import copy
+import hashlib
+import itertools
+import json
+import random
+import re
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from config import settings
+from utils.database import Database
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(value) -> str:
+    return _WHITESPACE.sub(" ", str(value or "")).strip().lower()
+
+
+def profile_fingerprint(profile: Dict, version: str) -> str:
+    """
+    Canonical key for a question prompt's inputs
+
+    Job role and degree are case/whitespace-normalized and the skills are
+    compared as a set, so profiles that only differ in formatting or skill
+    order share a key. `version` covers the model and prompt template.
+    """
+    canonical = {
+        "job_role": _normalize(profile.get("job_role")),
+        "skills": sorted({_normalize(skill) for skill in profile.get("skills") or []}),
+        "exp_years": profile.get("exp_years"),
+        "degree": _normalize(profile.get("degree")),
+        "project_count": profile.get("project_count"),
+        "num_questions": profile.get("num_questions"),
+        "version": version
+    }
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+
+class QuestionSetCache:
+    """
+    Cache of generated question sets keyed by profile fingerprint
+
+    Mirrors ResumeParseCache: a bounded in-process LRU in front of the
+    `question_set_cache` collection, so a hit on /api/interviews/start
+    skips the LLM call entirely. Entries expire after ttl_seconds (a TTL
+    index, see utils/indexes.py, removes them from Mongo).
+
+    Each fingerprint keeps up to `variants` independently generated sets.
+    Until that many exist, lookups miss so another set gets generated;
+    afterwards the sets are served in turn, so consecutive candidates with
+    the same profile get different questions. A worker loading an entry
+    from Mongo starts its rotation at the stored hit_count, so workers
+    don't all open with the same set. With
+    variants=1 every candidate gets the same questions. The policy decides
+    what a hit returns:
+    - "reuse": the stored set as generated
+    - "shuffle": the same questions with everything after the opening
+      question in random order (a different sequence, not a different set)
+    """
+
+    COLLECTION = "question_set_cache"
+    POLICIES = ("reuse", "shuffle")
+
+    def __init__(self, max_entries: int, ttl_seconds: int, policy: str = "shuffle", variants: int = 1):
+        """
+        Args:
+            max_entries: Maximum number of fingerprints kept in the in-process LRU
+            ttl_seconds: Lifetime of a cached set; 0 disables the cache
+            policy: "reuse" or "shuffle"
+            variants: Distinct sets to collect per fingerprint and serve in turn
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown question cache policy '{policy}', expected one of {self.POLICIES}")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.policy = policy
+        self.variants = max(1, variants)
+        self._lru: "OrderedDict[str, Dict]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _remember(self, key: str, entry: Dict):
+        """Insert into the LRU, evicting the least recently used entry"""
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _serve(self, entry: Dict) -> Optional[List[Dict]]:
+        """Pick and prepare one variant, or None if more variants are still wanted"""
+        if len(entry["variants"]) < self.variants:
+            return None
+        turn = next(entry["turns"])
+        questions = copy.deepcopy(entry["variants"][turn % len(entry["variants"])])
+        if self.policy == "shuffle" and len(questions) > 2:
+            rest = questions[1:]
+            random.shuffle(rest)
+            questions = questions[:1] + rest
+        return questions
+
+    async def get(self, profile: Dict, version: str) -> Optional[List[Dict]]:
+        """
+        Look up questions for an equivalent profile
+
+        Args:
+            profile: Prompt inputs (see GroqService.question_profile)
+            version: Model and prompt template version
+
+        Returns:
+            A question list ready to use, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        key = profile_fingerprint(profile, version)
+        now = datetime.utcnow()
+
+        entry = self._lru.get(key)
+        if entry is not None and entry["expires_at"] <= now:
+            del self._lru[key]
+            entry = None
+        if entry is not None:
+            self._lru.move_to_end(key)
+            questions = self._serve(entry)
+            if questions is not None:
+                self.memory_hits += 1
+                print(f"⚡ Question cache hit (memory): {key[:12]}")
+                return questions
+
+        # Not in memory, or still collecting variants here (other workers may have added some)
+        try:
+            doc = await Database.get_collection(self.COLLECTION).find_one_and_update(
+                {"_id": key, "expires_at": {"$gt": now}},
+                {"$inc": {"hit_count": 1}, "$set": {"last_hit_at": now}},
+                projection={"variants": 1, "expires_at": 1, "hit_count": 1}
+            )
+        except Exception as e:
+            print(f"⚠️ Question cache lookup failed: {e}")
+            doc = None
+        if doc is not None:
+            # Continue the rotation from the shared hit count
+            entry = {"variants": doc["variants"], "expires_at": doc["expires_at"],
+                     "turns": itertools.count(doc.get("hit_count", 0))}
+            self._remember(key, entry)
+            questions = self._serve(entry)
+            if questions is not None:
+                self.db_hits += 1
+                print(f"⚡ Question cache hit (database): {key[:12]}")
+                return questions
+
+        self.misses += 1
+        return None
+
+    async def put(self, profile: Dict, version: str, questions: List[Dict]):
+        """Store a freshly generated (not fallback) question set as one variant"""
+        if not self.enabled or not questions:
+            return
+        key = profile_fingerprint(profile, version)
+        now = datetime.utcnow()
+
+        entry = self._lru.get(key)
+        if entry is None or entry["expires_at"] <= now:
+            entry = {"variants": [], "expires_at": now + timedelta(seconds=self.ttl_seconds),
+                     "turns": itertools.count()}
+        entry["variants"] = (entry["variants"] + [copy.deepcopy(questions)])[-self.variants:]
+        self._remember(key, entry)
+
+        try:
+            collection = Database.get_collection(self.COLLECTION)
+            # An expired document may linger until the TTL monitor runs; start it over
+            await collection.delete_one({"_id": key, "expires_at": {"$lte": now}})
+            await collection.update_one(
+                {"_id": key},
+                {
+                    "$push": {"variants": {"$each": [questions], "$slice": -self.variants}},
+                    "$set": {"job_role": profile.get("job_role"), "version": version},
+                    "$setOnInsert": {"created_at": now, "expires_at": entry["expires_at"], "hit_count": 0}
+                },
+                upsert=True
+            )
+        except Exception as e:
+            print(f"⚠️ Could not persist question cache entry: {e}")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters since process start"""
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "policy": self.policy,
+            "variants": self.variants,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "lru_size": len(self._lru),
+            "lru_capacity": self.max_entries
+        }
+
+
+# Singleton instance
+question_set_cache = QuestionSetCache(
+    max_entries=settings.QUESTION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.QUESTION_CACHE_TTL_SECONDS,
+    policy=settings.QUESTION_CACHE_POLICY,
+    variants=settings.QUESTION_CACHE_VARIANTS
+)
@@ -0,0 +1,148 @@
+"""
+Question feed - Deliver interview questions to the candidate while they are still being generated
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from services.user_stats import user_interview_stats
+from utils.database import Database
+
+# Values of an interview's questions_status field
+QUESTIONS_GENERATING = "generating"
+QUESTIONS_COMPLETE = "complete"
+
+# A "generating" interview not updated for this long lost its generator (process exit)
+STALE_GENERATION_SECONDS = 120
+
+
+class InterviewQuestionFeed:
+    """
+    Progressive delivery of an interview's questions
+
+    /api/interviews/start stores the interview as soon as its first question
+    is complete, with questions_status "generating". A background task here
+    appends the remaining questions to the interview's `questions` array as
+    the LLM finishes each one, then sets questions_status to "complete".
+
+    follow() replays the stored questions and then follows new ones. Appends
+    made by this process wake followers immediately; appends made by
+    another API process are picked up by re-reading the document every
+    poll_interval seconds.
+    """
+
+    def __init__(self, poll_interval: float = 1.0):
+        """
+        Args:
+            poll_interval: Seconds between re-reads of the interview while following
+        """
+        self.poll_interval = poll_interval
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._listeners: Dict[str, List[asyncio.Event]] = {}
+
+    def _collection(self):
+        return Database.get_collection("interviews")
+
+    def start(self, session_id: str, questions: AsyncIterator[Dict], user_id: Optional[str] = None):
+        """
+        Append the rest of a question stream to an interview in the background
+
+        Args:
+            session_id: Interview the questions belong to (already stored)
+            questions: Remaining questions, in order
+            user_id: Interview owner, whose dashboard stats count the question categories
+        """
+        task = asyncio.create_task(self._append(session_id, questions, user_id))
+        self._tasks[session_id] = task
+        task.add_done_callback(lambda done: self._tasks.pop(session_id, None))
+
+    async def stop(self):
+        """Cancel generations still running (their interviews keep the questions so far)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _append(self, session_id: str, questions: AsyncIterator[Dict], user_id: Optional[str]):
+        appended = 0
+        try:
+            async for question in questions:
+                await self._collection().update_one(
+                    {"session_id": session_id},
+                    {"$push": {"questions": question}, "$set": {"updated_at": datetime.utcnow()}}
+                )
+                appended += 1
+                self._notify(session_id)
+                if user_id is not None:
+                    await user_interview_stats.questions_added(user_id, [question])
+        except Exception as e:
+            print(f"❌ Question generation for session {session_id} stopped: {e}")
+        finally:
+            await questions.aclose()
+            await self._collection().update_one(
+                {"session_id": session_id},
+                {"$set": {"questions_status": QUESTIONS_COMPLETE, "updated_at": datetime.utcnow()}}
+            )
+            self._notify(session_id)
+            print(f"📝 Session {session_id}: {appended} more question(s) delivered")
+
+    def _notify(self, session_id: str):
+        for event in self._listeners.get(session_id, []):
+            event.set()
+
+    async def follow(self, session_id: str, keepalive: float = 15.0) -> AsyncIterator[Optional[Tuple[str, Dict]]]:
+        """
+        Replay an interview's questions, then follow it until generation is complete
+
+        Yields:
+            (event, data) tuples: "question" with the index and question for
+            each question, then "complete" with the final count (or "failed"
+            if the interview doesn't exist). None is yielded when nothing
+            happened for `keepalive` seconds.
+        """
+        wake = asyncio.Event()
+        self._listeners.setdefault(session_id, []).append(wake)
+        sent = 0
+        idle = 0.0
+        try:
+            while True:
+                interview = await self._collection().find_one(
+                    {"session_id": session_id},
+                    {"questions": 1, "questions_status": 1, "updated_at": 1}
+                )
+                if interview is None:
+                    yield "failed", {"session_id": session_id, "message": "Interview session not found"}
+                    return
+
+                questions = interview.get("questions", [])
+                for index in range(sent, len(questions)):
+                    yield "question", {"session_id": session_id, "index": index, "question": questions[index]}
+                    idle = 0.0
+                sent = len(questions)
+
+                stale = (
+                    session_id not in self._tasks
+                    and interview.get("updated_at") is not None
+                    and interview["updated_at"] < datetime.utcnow() - timedelta(seconds=STALE_GENERATION_SECONDS)
+                )
+                if interview.get("questions_status", QUESTIONS_COMPLETE) == QUESTIONS_COMPLETE or stale:
+                    yield "complete", {"session_id": session_id, "questions_count": sent}
+                    return
+
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    idle += self.poll_interval
+                    if idle >= keepalive:
+                        idle = 0.0
+                        yield None
+        finally:
+            listeners = self._listeners.get(session_id, [])
+            if wake in listeners:
+                listeners.remove(wake)
+            if not listeners:
+                self._listeners.pop(session_id, None)
+
+
+# Singleton instance
+question_feed = InterviewQuestionFeed()
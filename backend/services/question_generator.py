@@ -1,11 +1,19 @@
-import google.generativeai as genai
 from typing import List, Dict
+from services.llm_gateway import LLMPriority
+from services.llm_router import llm_router
+
+# Seconds a question call may take, queueing and retries included
+GENERATION_DEADLINE_SECONDS = 30
 
 class QuestionGenerator:
-    def __init__(self):
-        self.model = genai.GenerativeModel('gemini-pro')
+    async def _generate(self, caller: str, prompt: str, priority: LLMPriority = LLMPriority.STANDARD):
+        """Completion through the LLM router (Gemini preferred)"""
+        return await llm_router.complete(
+            caller, [{"role": "user", "content": prompt}],
+            max_tokens=1024, priority=priority, deadline=GENERATION_DEADLINE_SECONDS
+        )
     
-    def generate_questions(self, resume_data: Dict, job_role: str) -> List[str]:
+    async def generate_questions(self, resume_data: Dict, job_role: str) -> List[str]:
         """Generate initial interview questions based on resume"""
         
         skills = ", ".join(resume_data.get("skills", []))
@@ -25,12 +33,12 @@ class QuestionGenerator:
         Return as a numbered list.
         """
         
-        response = self.model.generate_content(prompt)
+        response = await self._generate("question_generator", prompt)
         questions = response.text.strip().split('\n')
         
         return [q.strip() for q in questions if q.strip() and any(c.isalnum() for c in q)]
     
-    def generate_followup(self, previous_answer: str, skills: List[str], job_role: str) -> str:
+    async def generate_followup(self, previous_answer: str, skills: List[str], job_role: str) -> str:
         """Generate follow-up question based on candidate's answer"""
         
         prompt = f"""
@@ -47,10 +55,10 @@ class QuestionGenerator:
         Return only the question, nothing else.
         """
         
-        response = self.model.generate_content(prompt)
+        response = await self._generate("question_generator.followup", prompt, LLMPriority.INTERACTIVE)
         return response.text.strip()
     
-    def evaluate_answer(self, question: str, answer: str, expected_skills: List[str]) -> Dict:
+    async def evaluate_answer(self, question: str, answer: str, expected_skills: List[str]) -> Dict:
         """Evaluate candidate's answer using Gemini"""
         
         prompt = f"""
@@ -69,7 +77,7 @@ class QuestionGenerator:
         Format: technical:X, clarity:X, depth:X, relevance:X
         """
         
-        response = self.model.generate_content(prompt)
+        response = await self._generate("question_generator.evaluate", prompt)
         
         # Parse scores
         scores = {
@@ -0,0 +1,203 @@
+"""
+Question speculation - Generate interview questions while the candidate is still on the upload page
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from config import settings
+from services.groq_service import QUESTION_PROMPT_VERSION, groq_service
+from services.llm_gateway import LLMPriority
+from services.question_cache import profile_fingerprint
+from utils.database import Database
+
+# Questions per interview (what /api/interviews/start asks for)
+INTERVIEW_QUESTION_COUNT = 10
+
+
+class QuestionSpeculator:
+    """
+    Speculative question generation for freshly parsed resumes
+
+    Once a resume is saved, its upload already tells us the target job role,
+    so questions are generated right away at BACKGROUND priority and stored
+    in the `question_speculations` collection under the resume id.
+    /api/interviews/start then claims them instead of blocking on the LLM.
+
+    A speculation records the fingerprint of the prompt inputs it was
+    generated from (see GroqService.question_profile). It is only used if
+    the resume and job role at /start still produce that fingerprint, so a
+    changed job role, an edited profile or a model upgrade falls back to
+    generating on demand. Claims delete the speculation either way, and
+    unclaimed ones expire after ttl_seconds (TTL index).
+    """
+
+    COLLECTION = "question_speculations"
+
+    def __init__(self, ttl_seconds: int):
+        """
+        Args:
+            ttl_seconds: How long an unclaimed speculation stays usable (0 disables speculation)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._tasks: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self.scheduled = 0
+        self.stored = 0
+        self.failed = 0
+        self.claimed = 0
+        self.joined = 0
+        self.stale = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _version(self) -> str:
+        return f"{groq_service.llm_model}:{QUESTION_PROMPT_VERSION}"
+
+    def _fingerprint(self, resume_data: Dict, job_role: str) -> str:
+        profile = groq_service.question_profile(resume_data, job_role, INTERVIEW_QUESTION_COUNT)
+        return profile_fingerprint(profile, self._version())
+
+    async def stop(self):
+        """Cancel speculations still generating (they are simply not stored)"""
+        tasks = [task for _, task in self._tasks.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def schedule(self, resume_id: str, resume_data: Dict):
+        """
+        Start generating questions for a just-saved resume in the background
+
+        Args:
+            resume_id: Resume document id the speculation is stored under
+            resume_data: The saved resume document (with user_id and job_role)
+        """
+        if not self.enabled or not resume_data.get("job_role") or not resume_data.get("skills"):
+            return
+        fingerprint = self._fingerprint(resume_data, resume_data["job_role"])
+        task = asyncio.create_task(self._speculate(resume_id, resume_data, fingerprint))
+        self._tasks[resume_id] = (fingerprint, task)
+        task.add_done_callback(lambda done: self._finished(resume_id, done))
+        self.scheduled += 1
+
+    def _finished(self, resume_id: str, task: asyncio.Task):
+        """Forget a finished speculation task and log why it failed, if it did"""
+        entry = self._tasks.get(resume_id)
+        if entry is not None and entry[1] is task:
+            del self._tasks[resume_id]
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.failed += 1
+            print(f"❌ Question speculation for resume {resume_id} failed: {type(error).__name__}: {error}")
+
+    async def _speculate(self, resume_id: str, resume_data: Dict, fingerprint: str) -> Optional[List[Dict]]:
+        """Generate and store questions; None if generation failed"""
+        job_role = resume_data["job_role"]
+        questions = await groq_service.generate_questions(
+            resume_data=resume_data,
+            job_role=job_role,
+            num_questions=INTERVIEW_QUESTION_COUNT,
+            priority=LLMPriority.BACKGROUND,
+            use_fallback=False
+        )
+        if questions is None:
+            self.failed += 1
+            return None
+
+        now = datetime.utcnow()
+        try:
+            await Database.get_collection(self.COLLECTION).replace_one(
+                {"_id": resume_id},
+                {
+                    "user_id": resume_data.get("user_id"),
+                    "job_role": job_role,
+                    "fingerprint": fingerprint,
+                    "questions": questions,
+                    "created_at": now,
+                    "expires_at": now + timedelta(seconds=self.ttl_seconds)
+                },
+                upsert=True
+            )
+            self.stored += 1
+            print(f"🔮 Speculated {len(questions)} questions for resume {resume_id} ({job_role})")
+        except Exception as e:
+            print(f"⚠️ Could not store question speculation for resume {resume_id}: {e}")
+        return questions
+
+    async def claim(self, resume_id: str, resume_data: Dict, job_role: str) -> Optional[List[Dict]]:
+        """
+        Take the speculated questions for a resume, if they still apply
+
+        A speculation still generating in this process is awaited rather
+        than started again.
+
+        Args:
+            resume_id: Resume the interview is started for
+            resume_data: Current resume document
+            job_role: Job role the interview is started for
+
+        Returns:
+            The questions, or None if the caller has to generate them
+        """
+        if not self.enabled:
+            return None
+        fingerprint = self._fingerprint(resume_data, job_role)
+
+        running = self._tasks.get(resume_id)
+        if running is not None and running[0] == fingerprint:
+            try:
+                questions = await asyncio.shield(running[1])
+            except Exception:
+                questions = None
+            if questions is not None:
+                await self._discard(resume_id)
+                self.joined += 1
+                print(f"🔮 Joined in-flight question speculation for resume {resume_id}")
+                return questions
+
+        try:
+            doc = await Database.get_collection(self.COLLECTION).find_one_and_delete({"_id": resume_id})
+        except Exception as e:
+            print(f"⚠️ Question speculation lookup failed: {e}")
+            doc = None
+
+        if doc is None:
+            self.misses += 1
+            return None
+        if doc["fingerprint"] != fingerprint or doc["expires_at"] <= datetime.utcnow():
+            self.stale += 1
+            print(f"🗑️ Discarded stale question speculation for resume {resume_id}")
+            return None
+
+        self.claimed += 1
+        print(f"🔮 Using speculated questions for resume {resume_id}")
+        return doc["questions"]
+
+    async def _discard(self, resume_id: str):
+        try:
+            await Database.get_collection(self.COLLECTION).delete_one({"_id": resume_id})
+        except Exception as e:
+            print(f"⚠️ Could not discard question speculation for resume {resume_id}: {e}")
+
+    def stats(self) -> Dict:
+        """Speculation outcome counters since process start"""
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._tasks),
+            "scheduled": self.scheduled,
+            "stored": self.stored,
+            "failed": self.failed,
+            "claimed": self.claimed,
+            "joined_in_flight": self.joined,
+            "stale": self.stale,
+            "misses": self.misses
+        }
+
+
+# Singleton instance
+question_speculator = QuestionSpeculator(ttl_seconds=settings.QUESTION_SPECULATION_TTL_SECONDS)
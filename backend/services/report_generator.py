@@ -1,4 +1,3 @@
-import google.generativeai as genai
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
@@ -6,10 +5,14 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from datetime import datetime
 from typing import Dict
 import os
+from services.llm_gateway import LLMPriority
+from services.llm_router import llm_router
+
+# Seconds the recommendation call may take, queueing and retries included
+RECOMMENDATION_DEADLINE_SECONDS = 120
 
 class ReportGenerator:
     def __init__(self):
-        self.model = genai.GenerativeModel('gemini-pro')
         os.makedirs("reports", exist_ok=True)
     
     def calculate_scores(self, interview_data: Dict) -> Dict:
@@ -64,7 +67,7 @@ class ReportGenerator:
             "overall_score": 50.0
         }
     
-    def generate_recommendation(self, scores: Dict) -> str:
+    async def generate_recommendation(self, scores: Dict) -> str:
         """Generate hiring recommendation using Gemini"""
         
         prompt = f"""
@@ -80,14 +83,17 @@ class ReportGenerator:
         Then add 2-3 sentence justification.
         """
         
-        response = self.model.generate_content(prompt)
+        response = await llm_router.complete(
+            "report_generator", [{"role": "user", "content": prompt}],
+            max_tokens=512, priority=LLMPriority.BACKGROUND, deadline=RECOMMENDATION_DEADLINE_SECONDS
+        )
         return response.text.strip()
     
-    def generate_report(self, candidate: Dict, interview_data: Dict) -> Dict:
+    async def generate_report(self, candidate: Dict, interview_data: Dict) -> Dict:
         """Generate comprehensive interview report"""
         
         scores = self.calculate_scores(interview_data)
-        recommendation = self.generate_recommendation(scores)
+        recommendation = await self.generate_recommendation(scores)
         
         report = {
             "candidate_name": candidate.get("name", "Unknown"),
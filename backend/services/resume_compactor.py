@@ -0,0 +1,237 @@
+"""
+Resume compactor - Deterministic clean-up and token budgeting of resume text before LLM extraction
+"""
+import math
+import re
+from typing import Dict, List, Tuple
+
+# Bump when the compaction output changes so cached parses are invalidated
+COMPACTOR_VERSION = "2"
+
+# Rough chars-per-token ratio for English resume text on Llama tokenizers
+CHARS_PER_TOKEN = 4
+
+# Every section keeps at least this many tokens before higher-priority
+# sections are allowed to grow, so late sections are never dropped outright
+MIN_SECTION_TOKENS = 120
+
+# Section headings as they appear in resumes, mapped to a canonical name
+SECTION_ALIASES = {
+    "summary": ["summary", "professional summary", "profile", "objective", "career objective", "about me", "about"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "employment history",
+                   "work history", "internships", "internship", "internship experience"],
+    "education": ["education", "academic background", "academics", "qualifications", "educational qualifications"],
+    "skills": ["skills", "technical skills", "core competencies", "key skills", "technologies", "tech stack",
+               "tools", "skills and tools", "technical expertise"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects", "selected projects"],
+    "certifications": ["certifications", "certificates", "licenses", "licenses and certifications", "courses",
+                       "coursework", "relevant coursework"],
+    "achievements": ["achievements", "awards", "honors", "honors and awards", "accomplishments", "awards and achievements"],
+    "publications": ["publications", "research", "research papers", "papers"],
+    "volunteer": ["volunteer", "volunteering", "volunteer experience", "extracurricular", "extracurricular activities",
+                  "leadership", "activities", "positions of responsibility"],
+    "languages": ["languages", "spoken languages"],
+}
+
+# Order in which sections claim the token budget (header holds name and contact info)
+SECTION_PRIORITY = [
+    "header", "links", "experience", "skills", "education", "projects", "summary",
+    "certifications", "achievements", "publications", "languages", "volunteer",
+]
+
+_HEADING_LOOKUP = {alias: name for name, aliases in SECTION_ALIASES.items() for alias in aliases}
+
+_PAGE_MARKER = re.compile(r"^--- Page \d+ ---$")
+_LINKS_MARKER = "--- Extracted Links ---"
+_ALL_LINKS_HEADING = "All Hyperlinks found in resume:"
+_NUMBERED_LINK = re.compile(r"^\d+\.\s+(\S+)$")
+_BULLETS = re.compile(r"^(?:[•●▪◦‣⁃∙·➢]|[–—*\-](?=\s))\s*")
+_SPACES = re.compile(r"[ \t\u00a0\u200b]+")
+_BOILERPLATE = [
+    re.compile(r"^page \d+( of \d+)?$", re.IGNORECASE),
+    re.compile(r"^(curriculum vitae|resume|r[ée]sum[ée]|cv)$", re.IGNORECASE),
+    re.compile(r"^references( are)? available (up)?on request\.?$", re.IGNORECASE),
+    re.compile(r"^i hereby declare\b.*", re.IGNORECASE),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (no tokenizer dependency)"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _heading_name(line: str) -> str:
+    """Canonical section name if the line is a section heading, else empty string"""
+    if len(line) > 40:
+        return ""
+    key = re.sub(r"[^a-z& ]", "", line.lower()).replace("&", "and").strip()
+    return _HEADING_LOOKUP.get(key, "")
+
+
+def _running_lines(pages: List[List[str]]) -> set:
+    """Lines that open or close two or more pages (running headers/footers)"""
+    counts: Dict[str, int] = {}
+    for lines in pages:
+        for line in {lines[0], lines[-1]} if lines else ():
+            counts[line] = counts.get(line, 0) + 1
+    return {line for line, count in counts.items() if count >= 2}
+
+
+def _clean_lines(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Normalize whitespace and bullets, drop page markers and boilerplate
+
+    Returns (body_lines, link_lines) with the extracted-links block split off.
+    """
+    body, _, links = text.partition(_LINKS_MARKER)
+
+    pages: List[List[str]] = [[]]
+    for raw_line in body.splitlines():
+        line = _SPACES.sub(" ", raw_line).strip()
+        if _PAGE_MARKER.match(line):
+            pages.append([])
+        elif line and not any(pattern.match(line) for pattern in _BOILERPLATE):
+            pages[-1].append(_BULLETS.sub("- ", line))
+
+    running = _running_lines(pages)
+    kept_running = set()
+    body_lines: List[str] = []
+    for line in (line for lines in pages for line in lines):
+        # Keep the first copy of a running header (often the candidate's name)
+        if line in running:
+            if line in kept_running:
+                continue
+            kept_running.add(line)
+        body_lines.append(line)
+
+    link_lines = [_SPACES.sub(" ", line).strip() for line in links.splitlines() if line.strip()]
+    return body_lines, link_lines
+
+
+def _compact_links(link_lines: List[str]) -> List[str]:
+    """Keep labelled profile links and list each remaining URL once"""
+    labelled = [line for line in link_lines if ":" in line and not _NUMBERED_LINK.match(line)
+                and line != _ALL_LINKS_HEADING]
+    labelled_urls = {line.split(":", 1)[1].strip() for line in labelled}
+
+    urls: List[str] = []
+    for line in link_lines:
+        match = _NUMBERED_LINK.match(line)
+        if match and match.group(1) not in labelled_urls and match.group(1) not in urls:
+            urls.append(match.group(1))
+
+    compacted = [_LINKS_MARKER] + labelled
+    if urls:
+        compacted.append(_ALL_LINKS_HEADING)
+        compacted.extend(f"{i}. {url}" for i, url in enumerate(urls, 1))
+    return compacted if len(compacted) > 1 else []
+
+
+def segment_sections(lines: List[str]) -> List[Tuple[str, List[str]]]:
+    """
+    Split cleaned lines into (section_name, lines) in document order
+
+    Lines before the first recognised heading belong to "header". Headings
+    that aren't recognised stay inside the current section.
+    """
+    sections: List[Tuple[str, List[str]]] = [("header", [])]
+    for line in lines:
+        name = _heading_name(line)
+        if name:
+            sections.append((name, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, body) for name, body in sections if body]
+
+
+def _truncate_lines(lines: List[str], token_budget: int) -> List[str]:
+    """
+    Keep lines from the top of a section until the budget is spent
+
+    The first line that doesn't fit is cut (at a word boundary when one is
+    close) to fill what's left, so a section that is one long paragraph
+    (DOCX, PyPDF2 fallback text) keeps its opening instead of collapsing
+    to the marker.
+    """
+    kept: List[str] = []
+    used = 0
+    for line in lines:
+        cost = estimate_tokens(line + "\n")
+        if used + cost > token_budget:
+            # Characters that fit alongside the line's newline and the "[...]" marker
+            room = (token_budget - used - estimate_tokens("[...]\n")) * CHARS_PER_TOKEN - 1
+            if room > 0:
+                cut = line[:room]
+                space = cut.rfind(" ")
+                if space > room // 2:
+                    cut = cut[:space]
+                kept.append(cut.rstrip())
+            kept.append("[...]")
+            break
+        kept.append(line)
+        used += cost
+    return kept
+
+
+def _allocate(costs: List[Tuple[str, int]], token_budget: int) -> List[int]:
+    """
+    Split the budget across sections by priority
+
+    Each section first gets min(cost, MIN_SECTION_TOKENS) in priority order,
+    then whatever is left goes to sections in priority order until spent.
+    """
+    order = sorted(range(len(costs)), key=lambda i: (SECTION_PRIORITY.index(costs[i][0]), i))
+    grants = [0] * len(costs)
+    remaining = token_budget
+    for i in order:
+        grants[i] = min(costs[i][1], MIN_SECTION_TOKENS, remaining)
+        remaining -= grants[i]
+    for i in order:
+        extra = min(costs[i][1] - grants[i], remaining)
+        grants[i] += extra
+        remaining -= extra
+    return grants
+
+
+def compact_resume_text(text: str, token_budget: int) -> Dict:
+    """
+    Clean and fit resume text to a token budget by section priority
+
+    Args:
+        text: Extracted resume text (with page markers and links section)
+        token_budget: Maximum estimated tokens for the compacted text
+
+    Returns:
+        Dict with the compacted "text" and counters: "tokens_in",
+        "original_tokens", "sections" and "truncated_sections"
+    """
+    body_lines, link_lines = _clean_lines(text)
+    sections = segment_sections(body_lines)
+    links = _compact_links(link_lines)
+    if links:
+        sections.append(("links", links))
+
+    costs = [(name, estimate_tokens("\n".join(lines) + "\n")) for name, lines in sections]
+    truncated: List[str] = []
+
+    if sum(cost for _, cost in costs) > token_budget:
+        grants = _allocate(costs, token_budget)
+        fitted = []
+        for (name, lines), (_, cost), grant in zip(sections, costs, grants):
+            if grant >= cost:
+                fitted.append((name, lines))
+            elif grant > 0:
+                fitted.append((name, _truncate_lines(lines, grant)))
+                truncated.append(name)
+            else:
+                truncated.append(name)
+        sections = fitted
+
+    compacted = "\n\n".join("\n".join(lines) for _, lines in sections)
+    return {
+        "text": compacted,
+        "tokens_in": estimate_tokens(compacted),
+        "original_tokens": estimate_tokens(text),
+        "sections": list(dict.fromkeys(name for name, _ in sections)),
+        "truncated_sections": list(dict.fromkeys(truncated))
+    }
@@ -0,0 +1,591 @@
+"""
+Resume parse jobs - Mongo-backed background queue for resume parsing
+"""
+import asyncio
+import os
+import socket
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from bson import ObjectId
+from pymongo import ReturnDocument
+from config import settings
+from models.resume import ResumeJobStage, ResumeUploadResponse
+from services.blob_store import blob_store
+from services.model_cascade import LLM_FIELDS, model_cascade_metrics
+from services.parse_cache import resume_parse_cache
+from services.parse_pool import ParsePoolFullError
+from services.question_speculation import question_speculator
+from services.resume_parser import resume_parser
+from utils.database import Database
+
+# Delay before retrying a job that hit a full parse pool or a transient error
+RETRY_DELAY_SECONDS = 5
+
+# Job kinds: the user-facing parse, and the background full-model upgrade
+# of a resume first parsed by the fast tier. Claims sort on kind, so
+# "parse" jobs always go ahead of "upgrade" jobs.
+PARSE_JOB = "parse"
+UPGRADE_JOB = "upgrade"
+
+
+class LeaseLostError(Exception):
+    """Raised when a job's lease expired and another worker has claimed it"""
+    pass
+
+
+def _llm_resume_fields(parsed_data: Dict) -> Dict:
+    """Resume document fields that come from the LLM (replaced by a model upgrade)"""
+    return {
+        "full_name": parsed_data.get("name", "Unknown"),
+        "skills": parsed_data.get("skills", []),
+        "experience": parsed_data.get("experience", []),
+        "education": parsed_data.get("education", []),
+        "certifications": parsed_data.get("certifications", []),
+        "projects": parsed_data.get("projects", []),
+        "achievements": parsed_data.get("achievements", []),
+        "languages": parsed_data.get("languages", []),
+        "publications": parsed_data.get("publications", []),
+        "volunteer": parsed_data.get("volunteer", []),
+        "summary": parsed_data.get("summary")
+    }
+
+
+def _build_resume_document(job: Dict, parsed_data: Dict, model_tier: str) -> Dict:
+    """Resume document stored in the `resumes` collection for a finished parse"""
+    return {
+        "user_id": job["user_id"],
+        "full_name": parsed_data.get("name", "Unknown"),
+        "email": parsed_data.get("email"),
+        "phone": parsed_data.get("phone"),
+        "skills": parsed_data.get("skills", []),
+        "experience": parsed_data.get("experience", []),
+        "education": parsed_data.get("education", []),
+        "certifications": parsed_data.get("certifications", []),
+        "projects": parsed_data.get("projects", []),
+        "achievements": parsed_data.get("achievements", []),
+        "languages": parsed_data.get("languages", []),
+        "publications": parsed_data.get("publications", []),
+        "volunteer": parsed_data.get("volunteer", []),
+        "summary": parsed_data.get("summary"),
+        "job_role": job["job_role"],
+        "linkedin": parsed_data.get("linkedin"),
+        "github": parsed_data.get("github"),
+        "portfolio": parsed_data.get("portfolio"),
+        "raw_text": parsed_data.get("raw_text", ""),
+        "filename": job["filename"],
+        "file_path": blob_store.uri(job["blob_key"]) if job.get("blob_key") else job["file_path"],
+        "blob_key": job.get("blob_key"),
+        "file_size": job["file_size"],
+        "content_hash": job["content_hash"],
+        "parse_metrics": parsed_data.get("parse_metrics"),
+        "model_tier": model_tier,
+        "uploaded_at": datetime.utcnow()
+    }
+
+
+def _build_upload_response(resume_id: str, resume_data: Dict) -> Dict:
+    """ResumeUploadResponse payload returned once the job is done"""
+    extracted_data = {
+        "name": resume_data["full_name"],
+        "email": resume_data["email"],
+        "phone": resume_data["phone"],
+        "skills": resume_data["skills"],
+        "experience": resume_data["experience"],  # Full experience array
+        "education": resume_data["education"],    # Full education array
+        "certifications": resume_data["certifications"],
+        "projects": resume_data["projects"],
+        "achievements": resume_data["achievements"],
+        "languages": resume_data["languages"],
+        "publications": resume_data["publications"],
+        "volunteer": resume_data["volunteer"],
+        "summary": resume_data["summary"],
+        "linkedin": resume_data["linkedin"],
+        "github": resume_data["github"],
+        "portfolio": resume_data["portfolio"]
+    }
+    return ResumeUploadResponse(
+        success=True,
+        message="Resume uploaded and parsed successfully!",
+        resume_id=resume_id,
+        extracted_data=extracted_data,
+        can_start_interview=len(resume_data["skills"]) > 0
+    ).model_dump()
+
+
+@asynccontextmanager
+async def _job_file(job: Dict):
+    """Local path of the upload a job works on"""
+    if job.get("blob_key"):
+        async with blob_store.local_file(job["blob_key"]) as path:
+            yield str(path)
+    else:
+        # Queued before uploads moved to the blob store
+        yield job["file_path"]
+
+
+class ResumeJobQueue:
+    """
+    Durable queue of resume parse jobs
+
+    Uploads are stored in the `resume_parse_jobs` collection and picked up
+    by a fixed number of worker tasks on the event loop. A worker claims a
+    job with an atomic find_one_and_update and holds a lease that is renewed
+    on every stage change and by a heartbeat every lease_seconds / 3 while
+    the job runs, so a slow stage (queued LLM extraction) keeps its lease
+    and only jobs left `running` by a process that died are claimed again
+    once their lease expires. Stage transitions are appended
+    to the job document, which is what the SSE endpoint replays and follows.
+    Every stage change matches on the worker holding the lease, so a worker
+    whose job was claimed again stops instead of overwriting the new run.
+    """
+
+    COLLECTION = "resume_parse_jobs"
+
+    def __init__(self, concurrency: int, lease_seconds: int, max_attempts: int,
+                 poll_interval: float = 2.0):
+        """
+        Args:
+            concurrency: Number of jobs processed at once by this process
+            lease_seconds: How long a claimed job stays reserved without a renewal
+            max_attempts: Claims allowed before a job is marked failed
+            poll_interval: Seconds between queue polls when idle (picks up jobs
+                enqueued by other API processes)
+        """
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._listeners: Dict[str, List[asyncio.Event]] = {}
+
+    def _collection(self):
+        return Database.get_collection(self.COLLECTION)
+
+    def _lease_expiry(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.lease_seconds)
+
+    async def start(self):
+        """Start the worker tasks"""
+        if self._workers:
+            return
+        self._wakeup = asyncio.Event()
+        self._workers = [asyncio.create_task(self._worker_loop()) for _ in range(self.concurrency)]
+        print(f"✅ Resume job workers started ({self.concurrency} workers, id {self.worker_id})")
+
+    async def stop(self):
+        """
+        Cancel the worker tasks
+
+        Jobs interrupted here stay `running` in Mongo and are claimed again
+        after their lease expires.
+        """
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        print("✅ Resume job workers stopped")
+
+    async def enqueue(self, user_id: str, job_role: str, filename: str, blob_key: str,
+                      file_size: int, content_hash: str) -> str:
+        """
+        Persist a new parse job
+
+        Args:
+            user_id: Owner of the upload
+            job_role: Target job role for the interview
+            filename: Original filename of the upload
+            blob_key: Blob store key of the upload
+            file_size: Size of the upload in bytes
+            content_hash: SHA-256 hex digest of the upload
+
+        Returns:
+            Job ID
+        """
+        job_id = await self._insert_job({
+            "kind": PARSE_JOB,
+            "user_id": user_id,
+            "job_role": job_role,
+            "filename": filename,
+            "blob_key": blob_key,
+            "file_size": file_size,
+            "content_hash": content_hash
+        })
+        print(f"📥 Queued resume parse job {job_id} for user {user_id}")
+        return job_id
+
+    async def enqueue_upgrade(self, resume_id: str, job: Dict, fast_result: Dict) -> str:
+        """
+        Queue a full-model re-extraction of a resume parsed by the fast tier
+
+        Args:
+            resume_id: Resume document to patch when the upgrade finishes
+            job: The parse job that produced the fast result
+            fast_result: Fast-tier parse result (kept for the agreement metrics)
+
+        Returns:
+            Job ID
+        """
+        job_id = await self._insert_job({
+            "kind": UPGRADE_JOB,
+            "user_id": job["user_id"],
+            "resume_id": resume_id,
+            "filename": job["filename"],
+            "blob_key": job.get("blob_key"),
+            "file_path": job.get("file_path"),
+            "content_hash": job["content_hash"],
+            "fast_result": {
+                **{field: fast_result.get(field) for field in LLM_FIELDS},
+                "parse_metrics": fast_result.get("parse_metrics")
+            }
+        })
+        print(f"📥 Queued full-model upgrade job {job_id} for resume {resume_id}")
+        return job_id
+
+    async def _insert_job(self, fields: Dict) -> str:
+        """Insert a queued job document and wake an idle worker"""
+        now = datetime.utcnow()
+        job_id = str(uuid.uuid4())
+        await self._collection().insert_one({
+            "_id": job_id,
+            **fields,
+            "stage": ResumeJobStage.QUEUED.value,
+            "stages": [{"stage": ResumeJobStage.QUEUED.value, "at": now}],
+            "attempts": 0,
+            "available_at": now,
+            "lease_expires_at": None,
+            "worker_id": None,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        })
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job_id
+
+    async def get_job(self, job_id: str) -> Optional[Dict]:
+        """Fetch a job document"""
+        return await self._collection().find_one({"_id": job_id})
+
+    async def _claim(self) -> Optional[Dict]:
+        """Atomically reserve the oldest runnable job (queued, or running with an expired lease)"""
+        now = datetime.utcnow()
+        active_stages = [ResumeJobStage.EXTRACTING.value, ResumeJobStage.LLM.value, ResumeJobStage.SAVING.value]
+        return await self._collection().find_one_and_update(
+            {"$or": [
+                {"stage": ResumeJobStage.QUEUED.value, "available_at": {"$lte": now}},
+                {"stage": {"$in": active_stages}, "lease_expires_at": {"$lt": now}}
+            ]},
+            {
+                "$set": {
+                    "worker_id": self.worker_id,
+                    "lease_expires_at": self._lease_expiry(now),
+                    "updated_at": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("kind", 1), ("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _worker_loop(self):
+        """Claim and run jobs until cancelled"""
+        while True:
+            try:
+                job = await self._claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Could not claim resume job: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run(job)
+
+    async def _run(self, job: Dict):
+        """Process a claimed job and record its outcome, unless another worker claims it meanwhile"""
+        try:
+            await self._run_claimed(job)
+        except LeaseLostError as e:
+            print(f"⚠️ {e}, leaving it to the worker that claimed it")
+
+    async def _run_claimed(self, job: Dict):
+        job_id = job["_id"]
+        if job["attempts"] > self.max_attempts:
+            await self._finish(job_id, ResumeJobStage.FAILED, error="Resume parsing failed after several attempts")
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            if job.get("kind") == UPGRADE_JOB:
+                result = await self._upgrade(job)
+            else:
+                result = await self._process(job)
+        except asyncio.CancelledError:
+            raise
+        except LeaseLostError:
+            raise
+        except ParsePoolFullError as e:
+            # Not the job's fault - put it back without using up an attempt
+            print(f"⚠️ {e}, retrying job {job_id} in {RETRY_DELAY_SECONDS}s")
+            await self._requeue(job_id, refund_attempt=True)
+            return
+        except Exception as e:
+            print(f"❌ Resume parse job {job_id} failed (attempt {job['attempts']}): {e}")
+            if job["attempts"] < self.max_attempts:
+                await self._requeue(job_id)
+            else:
+                await self._finish(job_id, ResumeJobStage.FAILED, error=f"Failed to parse resume: {str(e)}")
+            return
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        await self._finish(job_id, ResumeJobStage.DONE, result=result)
+
+    async def _heartbeat(self, job_id: str):
+        """Renew a running job's lease until cancelled, as long as this worker still holds it"""
+        active_stages = [ResumeJobStage.EXTRACTING.value, ResumeJobStage.LLM.value, ResumeJobStage.SAVING.value]
+        while True:
+            await asyncio.sleep(max(self.lease_seconds / 3, 1))
+            try:
+                now = datetime.utcnow()
+                renewed = await self._collection().update_one(
+                    {"_id": job_id, "worker_id": self.worker_id, "stage": {"$in": active_stages}},
+                    {"$set": {"lease_expires_at": self._lease_expiry(now), "updated_at": now}}
+                )
+                if renewed.matched_count == 0:
+                    print(f"⚠️ Lost the lease on resume job {job_id}")
+                    return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Could not renew lease on resume job {job_id}: {e}")
+
+    async def _process(self, job: Dict) -> Dict:
+        """Extract, parse and store one resume; returns the ResumeUploadResponse payload"""
+        job_id = job["_id"]
+        await self.set_stage(job_id, ResumeJobStage.EXTRACTING)
+
+        # Reuse a previous full-model parse of the same file if we have one
+        parsed_data = await resume_parse_cache.get(job["content_hash"], resume_parser.extraction_version)
+        model_tier = "full"
+
+        if parsed_data is None:
+            # With the cascade on, the user gets the fast model's result now
+            # and the full model's result is patched in by an upgrade job
+            model = resume_parser.model
+            if settings.RESUME_MODEL_CASCADE:
+                model = resume_parser.fast_model
+                model_tier = "fast"
+            extraction_version = resume_parser.get_extraction_version(model)
+            if model_tier == "fast":
+                parsed_data = await resume_parse_cache.get(job["content_hash"], extraction_version)
+
+            if parsed_data is None:
+                print(f"📄 Parsing resume: {job['filename']} with {model} (job {job_id})")
+                async with _job_file(job) as file_path:
+                    parsed_data = await resume_parser.parse_async(
+                        file_path,
+                        on_stage=lambda stage: self.set_stage(job_id, ResumeJobStage(stage)),
+                        model=model
+                    )
+                await resume_parse_cache.put(job["content_hash"], extraction_version, parsed_data)
+
+        await self.set_stage(job_id, ResumeJobStage.SAVING)
+        user_id = job["user_id"]
+
+        # Delete previous resumes for this user (keep only the latest)
+        resumes_collection = Database.get_collection("resumes")
+        previous_resumes = await resumes_collection.find({"user_id": user_id}).to_list(length=None)
+
+        if previous_resumes:
+            print(f"🗑️ Found {len(previous_resumes)} previous resume(s) for user {user_id}")
+            for old_resume in previous_resumes:
+                await resumes_collection.delete_one({"_id": old_resume["_id"]})
+                print(f"   ✅ Deleted old resume from database: {old_resume['_id']}")
+
+        resume_data = _build_resume_document(job, parsed_data, model_tier)
+        result = await resumes_collection.insert_one(resume_data)
+        resume_id = str(result.inserted_id)
+
+        print(f"✅ Resume saved with ID: {resume_id}")
+        print(f"✅ Saved with user_id: {resume_data['user_id']}")
+
+        # Have the interview questions ready by the time the candidate clicks start
+        question_speculator.schedule(resume_id, resume_data)
+
+        # Nothing to upgrade if no usable text was found
+        if model_tier == "fast" and parsed_data.get("raw_text"):
+            await self.enqueue_upgrade(resume_id, job, parsed_data)
+
+        return _build_upload_response(resume_id, resume_data)
+
+    async def _upgrade(self, job: Dict) -> Dict:
+        """
+        Re-extract a fast-tier resume with the full model and patch the stored document
+
+        The resume is only patched while it still holds the fast-tier result
+        and hasn't been edited by the user since.
+        """
+        job_id = job["_id"]
+        resume_id = job["resume_id"]
+        await self.set_stage(job_id, ResumeJobStage.EXTRACTING)
+
+        extraction_version = resume_parser.extraction_version
+        full_data = await resume_parse_cache.get(job["content_hash"], extraction_version)
+        if full_data is None:
+            async with _job_file(job) as file_path:
+                full_data = await resume_parser.parse_async(
+                    file_path,
+                    on_stage=lambda stage: self.set_stage(job_id, ResumeJobStage(stage))
+                )
+            if not full_data.get("llm_usage"):
+                raise RuntimeError("Full-model extraction returned no data")
+            await resume_parse_cache.put(job["content_hash"], extraction_version, full_data)
+
+        await self.set_stage(job_id, ResumeJobStage.SAVING)
+        result = await Database.get_collection("resumes").update_one(
+            {"_id": ObjectId(resume_id), "model_tier": "fast", "profile_edited_at": {"$exists": False}},
+            {"$set": {
+                **_llm_resume_fields(full_data),
+                "parse_metrics": full_data.get("parse_metrics"),
+                "model_tier": "full",
+                "upgraded_at": datetime.utcnow()
+            }}
+        )
+        patched = result.matched_count > 0
+        if patched:
+            print(f"⬆️ Resume {resume_id} upgraded to {resume_parser.model} extraction")
+        else:
+            print(f"⏭️ Resume {resume_id} was edited or replaced, keeping fast-tier data")
+
+        agreement = await model_cascade_metrics.record(resume_id, job["fast_result"], full_data, patched)
+        return {"resume_id": resume_id, "patched": patched, "agreement": agreement}
+
+    async def set_stage(self, job_id: str, stage: ResumeJobStage, **fields):
+        """
+        Record a stage transition, renew the lease and wake SSE listeners
+
+        Raises:
+            LeaseLostError: If this worker no longer holds the job's lease
+        """
+        now = datetime.utcnow()
+        updated = await self._collection().update_one(
+            {"_id": job_id, "worker_id": self.worker_id},
+            {
+                "$set": {"stage": stage.value, "updated_at": now, "lease_expires_at": self._lease_expiry(now), **fields},
+                "$push": {"stages": {"stage": stage.value, "at": now}}
+            }
+        )
+        if updated.matched_count == 0:
+            raise LeaseLostError(f"Resume job {job_id} is no longer held by {self.worker_id}")
+        self._notify(job_id)
+
+    async def _requeue(self, job_id: str, refund_attempt: bool = False):
+        """
+        Put a job back in the queue after RETRY_DELAY_SECONDS
+
+        Raises:
+            LeaseLostError: If this worker no longer holds the job's lease
+        """
+        now = datetime.utcnow()
+        update = {
+            "$set": {
+                "stage": ResumeJobStage.QUEUED.value,
+                "available_at": now + timedelta(seconds=RETRY_DELAY_SECONDS),
+                "lease_expires_at": None,
+                "worker_id": None,
+                "updated_at": now
+            },
+            "$push": {"stages": {"stage": ResumeJobStage.QUEUED.value, "at": now}}
+        }
+        if refund_attempt:
+            update["$inc"] = {"attempts": -1}
+        updated = await self._collection().update_one({"_id": job_id, "worker_id": self.worker_id}, update)
+        if updated.matched_count == 0:
+            raise LeaseLostError(f"Resume job {job_id} is no longer held by {self.worker_id}")
+        self._notify(job_id)
+
+    async def _finish(self, job_id: str, stage: ResumeJobStage, result: Optional[Dict] = None,
+                      error: Optional[str] = None):
+        """Mark a job done or failed"""
+        await self.set_stage(job_id, stage, result=result, error=error, lease_expires_at=None)
+        if stage == ResumeJobStage.DONE:
+            print(f"✅ Resume parse job {job_id} done")
+        else:
+            print(f"❌ Resume parse job {job_id} failed: {error}")
+
+    def _notify(self, job_id: str):
+        for event in self._listeners.get(job_id, []):
+            event.set()
+
+    async def follow(self, job_id: str, keepalive: float = 15.0) -> AsyncIterator[Optional[Tuple[str, Dict]]]:
+        """
+        Replay a job's stage transitions, then follow it until it finishes
+
+        Transitions made by this process wake the listener immediately; jobs
+        run by another API process are picked up by re-reading the document
+        every poll_interval seconds.
+
+        Yields:
+            (event, data) tuples: "stage" for every transition, then "result"
+            with the ResumeUploadResponse or "failed". None is yielded when
+            nothing happened for `keepalive` seconds.
+        """
+        wake = asyncio.Event()
+        self._listeners.setdefault(job_id, []).append(wake)
+        sent = 0
+        idle = 0.0
+        try:
+            while True:
+                job = await self.get_job(job_id)
+                if job is None:
+                    yield "failed", {"job_id": job_id, "message": "Job not found"}
+                    return
+
+                for entry in job["stages"][sent:]:
+                    yield "stage", {"job_id": job_id, "stage": entry["stage"], "at": entry["at"].isoformat()}
+                    idle = 0.0
+                sent = len(job["stages"])
+
+                if job["stage"] == ResumeJobStage.DONE.value:
+                    yield "result", job["result"]
+                    return
+                if job["stage"] == ResumeJobStage.FAILED.value:
+                    yield "failed", {"job_id": job_id, "message": job.get("error") or "Resume parsing failed"}
+                    return
+
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    idle += self.poll_interval
+                    if idle >= keepalive:
+                        idle = 0.0
+                        yield None
+        finally:
+            listeners = self._listeners.get(job_id, [])
+            if wake in listeners:
+                listeners.remove(wake)
+            if not listeners:
+                self._listeners.pop(job_id, None)
+
+
+# Singleton instance
+resume_job_queue = ResumeJobQueue(
+    concurrency=settings.RESUME_JOB_WORKERS,
+    lease_seconds=settings.RESUME_JOB_LEASE_SECONDS,
+    max_attempts=settings.RESUME_JOB_MAX_ATTEMPTS
+)
@@ -4,241 +4,39 @@ Resume Parser Service - Extract information from PDF and DOCX files using LLM
 import PyPDF2
 import docx
 import re
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 import json
-from groq import Groq
+import hashlib
+import time
 from config import settings
+from services.parse_pool import parse_pool
+from services.contact_scanner import categorize_links, scan_contacts
+from services.llm_gateway import LLMPriority, llm_gateway
+from services.resume_compactor import COMPACTOR_VERSION, compact_resume_text
 
 
-class ResumeParser:
-    """Parse resumes and extract structured information using Groq LLM"""
-    
-    def __init__(self):
-        """Initialize Groq client for LLM-based parsing"""
-        self.client = Groq(api_key=settings.GROQ_API_KEY)
-        # Using llama-3.3-70b-versatile - Latest high-performance model
-        # Alternative: "llama-3.1-70b-versatile" or "gemma2-9b-it"
-        self.model = "llama-3.3-70b-versatile"
-    
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            print(f"Error extracting PDF: {e}")
-        return text
-    
-    def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file"""
-        text = ""
-        try:
-            doc = docx.Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-        except Exception as e:
-            print(f"Error extracting DOCX: {e}")
-        return text
-    
-    def extract_text(self, file_path: str) -> str:
-        """Extract text based on file extension with enhanced methods"""
-        file_ext = Path(file_path).suffix.lower()
-        if file_ext == '.pdf':
-            # Try enhanced extraction first
-            text = self.extract_text_from_pdf_enhanced(file_path)
-            if not text or len(text.strip()) < 50:
-                # Fallback to basic extraction
-                print("⚠️ Enhanced extraction failed, using basic method")
-                text = self.extract_text_from_pdf(file_path)
-            return text
-        elif file_ext in ['.docx', '.doc']:
-            return self.extract_text_from_docx(file_path)
-        else:
-            return ""
-    
-    def extract_basic_info_with_regex(self, text: str) -> Dict[str, Optional[str]]:
-        """Extract basic contact info using regex (fast and reliable)"""
-        # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        email = emails[0] if emails else None
-        
-        # Phone extraction with country code
-        phone_patterns = [
-            r'\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}',  # International format with +
-            r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # +1 (555) 555-5555
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'  # Simple 10-digit
-        ]
-        phone = None
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                phone = matches[0].strip()
-                break
-        
-        # LinkedIn extraction
-        linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+'
-        linkedin_match = re.search(linkedin_pattern, text, re.IGNORECASE)
-        linkedin = linkedin_match.group(0) if linkedin_match else None
-        
-        # GitHub extraction
-        github_pattern = r'(?:https?://)?(?:www\.)?github\.com/[\w-]+'
-        github_match = re.search(github_pattern, text, re.IGNORECASE)
-        github = github_match.group(0) if github_match else None
-        
-        # Portfolio extraction - try multiple patterns
-        portfolio_patterns = [
-            r'(?:https?://)?(?:www\.)?[\w-]+\.vercel\.app/?[\w/-]*',
-            r'(?:https?://)?(?:www\.)?[\w-]+\.netlify\.app/?[\w/-]*',
-            r'(?:https?://)?(?:www\.)?[\w-]+\.herokuapp\.com/?[\w/-]*',
-            r'(?:https?://)?(?:www\.)?[\w-]+\.github\.io/?[\w/-]*',
-            r'(?:https?://)?portfolio\.[\w-]+\.[\w.]+/?[\w/-]*'
-        ]
-        portfolio = None
-        for pattern in portfolio_patterns:
-            portfolio_match = re.search(pattern, text, re.IGNORECASE)
-            if portfolio_match:
-                portfolio = portfolio_match.group(0)
-                break
-        
-        return {
-            'email': email,
-            'phone': phone,
-            'linkedin': linkedin,
-            'github': github,
-            'portfolio': portfolio
-        }
-    
-    def extract_hyperlinks_from_pdf(self, file_path: str) -> Dict[str, str]:
-        """
-        Extract hyperlinks from PDF annotations
-        Returns dict with link text mapped to URLs
-        """
-        links = {}
-        all_links = []  # Store all project/portfolio links
-        
-        try:
-            import pdfplumber
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    # Extract annotations/links
-                    if hasattr(page, 'annots') and page.annots:
-                        for annot in page.annots:
-                            if annot.get('uri'):  # External URL
-                                url = annot['uri']
-                                all_links.append(url)
-                                
-                                # Categorize based on URL
-                                url_lower = url.lower()
-                                if 'github.com' in url_lower and '/github.com/' in url_lower:
-                                    links['github'] = url
-                                elif 'linkedin.com/in' in url_lower:
-                                    links['linkedin'] = url
-                                elif any(domain in url_lower for domain in ['vercel.app', 'netlify.app', 'herokuapp.com', 'github.io']):
-                                    # Check if it's not the GitHub profile link
-                                    if 'github.io' in url_lower or 'vercel' in url_lower or 'netlify' in url_lower:
-                                        if 'portfolio' not in links:
-                                            links['portfolio'] = url
-                                        else:
-                                            # Store as additional project link
-                                            if 'project_links' not in links:
-                                                links['project_links'] = []
-                                            links['project_links'].append(url)
-            
-            # Store all links for reference
-            if all_links:
-                links['all_links'] = all_links
-            
-            if links:
-                print(f"🔗 Extracted {len(all_links)} total hyperlinks from PDF")
-                for key, url in links.items():
-                    if key in ['github', 'linkedin', 'portfolio']:
-                        print(f"   {key}: {url}")
-                if 'project_links' in links:
-                    print(f"   📦 Project links: {len(links['project_links'])} found")
-        except Exception as e:
-            print(f"⚠️ Could not extract hyperlinks: {e}")
-        
-        return links
-    
-    def extract_text_from_pdf_enhanced(self, file_path: str) -> str:
-        """
-        Enhanced PDF text extraction with better handling
-        Extracts text page by page and preserves structure
-        Also extracts hyperlinks and appends them to text
-        """
-        text = ""
-        try:
-            import pdfplumber
-            
-            # Extract hyperlinks first
-            hyperlinks = self.extract_hyperlinks_from_pdf(file_path)
-            
-            # Extract text
-            with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += f"\n--- Page {page_num} ---\n"
-                        text += page_text + "\n"
-            
-            # Append extracted links to text for LLM to process
-            if hyperlinks:
-                text += "\n--- Extracted Links ---\n"
-                if 'github' in hyperlinks:
-                    text += f"GitHub Profile: {hyperlinks['github']}\n"
-                if 'linkedin' in hyperlinks:
-                    text += f"LinkedIn Profile: {hyperlinks['linkedin']}\n"
-                if 'portfolio' in hyperlinks:
-                    text += f"Portfolio Website: {hyperlinks['portfolio']}\n"
-                
-                # Add all links so LLM can match them to projects
-                if 'all_links' in hyperlinks:
-                    text += "\nAll Hyperlinks found in resume:\n"
-                    for i, link in enumerate(hyperlinks['all_links'], 1):
-                        text += f"{i}. {link}\n"
-            
-            print(f"✅ Extracted {len(text)} characters from PDF using pdfplumber")
-        except ImportError:
-            print("⚠️ pdfplumber not available, falling back to PyPDF2")
-            # Fallback to PyPDF2
-            try:
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page_num, page in enumerate(pdf_reader.pages, 1):
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += f"\n--- Page {page_num} ---\n"
-                            text += page_text + "\n"
-                print(f"✅ Extracted {len(text)} characters from PDF using PyPDF2")
-            except Exception as e:
-                print(f"❌ Error extracting PDF: {e}")
-        except Exception as e:
-            print(f"❌ Error with pdfplumber: {e}")
-        
-        return text
-    
-    def extract_info_with_llm(self, text: str) -> Dict:
-        """
-        Use Groq LLM to intelligently extract structured information from resume
-        Enhanced with better prompting and error handling
-        """
-        if not text or len(text.strip()) < 50:
-            print("⚠️ Text too short for LLM extraction")
-            return self._get_empty_structure()
-        
-        # Use more text for better context (up to 12000 chars)
-        resume_text = text[:12000] if len(text) > 12000 else text
-        
-        print(f"📝 Sending {len(resume_text)} characters to Groq LLM...")
-        
-        prompt = f"""You are an expert resume parser. Carefully analyze the following resume and extract ALL information accurately.
+# Pages whose pdfplumber text is shorter than this are retried with PyPDF2
+PAGE_FALLBACK_MIN_CHARS = 20
+
+
+class PdfTooLongError(Exception):
+    """Raised when a PDF has more pages than the caller wants extracted in one pass"""
+
+    def __init__(self, page_count: int):
+        super().__init__(f"PDF has {page_count} pages")
+        self.page_count = page_count
+
+
+# Longest a resume extraction may take, retries included, before the empty structure is returned
+EXTRACTION_DEADLINE_SECONDS = 120
+
+# System prompt and user prompt template for LLM extraction.
+# Any change here (or to the model / sampling params) changes
+# ResumeParser.extraction_version and invalidates cached parses.
+EXTRACTION_SYSTEM_PROMPT = "You are a professional resume parser. Return only valid JSON with no markdown formatting."
+
+EXTRACTION_PROMPT_TEMPLATE = """You are an expert resume parser. Carefully analyze the following resume and extract ALL information accurately.
 
 RESUME TEXT:
 {resume_text}
@@ -313,97 +111,441 @@ CRITICAL INSTRUCTIONS:
 18. Ensure the JSON is valid and properly formatted
 19. Be thorough - extract EVERY section present in the resume"""
 
+
+class ResumeParser:
+    """Parse resumes and extract structured information using Groq LLM"""
+    
+    def __init__(self):
+        """Set up models and stats; LLM calls go through the shared llm_gateway"""
+        # Using llama-3.3-70b-versatile - Latest high-performance model
+        # Alternative: "llama-3.1-70b-versatile" (fast tier: see RESUME_FAST_MODEL)
+        self.model = "llama-3.3-70b-versatile"
+        # Small model used for the first pass when the model cascade is on
+        self.fast_model = settings.RESUME_FAST_MODEL
+        self.prompt_token_budget = settings.RESUME_PROMPT_TOKEN_BUDGET
+        # Running totals for LLM extraction calls made by this process
+        self.llm_stats = {
+            "calls": 0,
+            "llm_latency_ms": 0,
+            "resume_tokens_estimated": 0,
+            "original_tokens_estimated": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
+        # Call count and latency per model (fast tier vs full model)
+        self.model_stats: Dict[str, Dict[str, int]] = {}
+    
+    @property
+    def extraction_version(self) -> str:
+        """
+        Fingerprint of everything that shapes the LLM output
+        Used to key cached parses so a prompt or model change invalidates them
+        """
+        return self.get_extraction_version()
+    
+    def get_extraction_version(self, model: Optional[str] = None) -> str:
+        """extraction_version for a specific model (defaults to the full model)"""
+        fingerprint = json.dumps({
+            "model": model or self.model,
+            "system": EXTRACTION_SYSTEM_PROMPT,
+            "template": EXTRACTION_PROMPT_TEMPLATE,
+            "compactor": COMPACTOR_VERSION,
+            "prompt_token_budget": self.prompt_token_budget,
+            "params": {k: v for k, v in self._get_completion_kwargs("").items() if k not in ("messages", "model")}
+        }, sort_keys=True)
+        return hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+    
+    def extract_text_from_pdf(self, file_path: str) -> str:
+        """Extract text from PDF file"""
+        text = ""
+        try:
+            with open(file_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                for page in pdf_reader.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += page_text + "\n"
+        except Exception as e:
+            print(f"Error extracting PDF: {e}")
+        return text
+    
+    def extract_text_from_docx(self, file_path: str) -> str:
+        """Extract text from DOCX file"""
+        text = ""
         try:
-            print("🤖 Calling Groq API...")
+            doc = docx.Document(file_path)
+            for paragraph in doc.paragraphs:
+                text += paragraph.text + "\n"
+        except Exception as e:
+            print(f"Error extracting DOCX: {e}")
+        return text
+    
+    def extract_text(self, file_path: str, max_pdf_pages: int = 0) -> str:
+        """
+        Extract text based on file extension with enhanced methods
+        
+        Args:
+            file_path: Resume file
+            max_pdf_pages: Raise PdfTooLongError instead of extracting PDFs with more pages (0: no limit)
+        """
+        file_ext = Path(file_path).suffix.lower()
+        if file_ext == '.pdf':
+            # Single pass; short pages already fall back to PyPDF2 individually
+            return self.extract_text_from_pdf_enhanced(file_path, max_pdf_pages)
+        elif file_ext in ['.docx', '.doc']:
+            return self.extract_text_from_docx(file_path)
+        else:
+            return ""
+    
+    def extract_basic_info_with_regex(self, text: str) -> Dict[str, Optional[str]]:
+        """Extract basic contact info using regex (fast and reliable)"""
+        return scan_contacts(text)
+    
+    def _categorize_links(self, all_links: List[str]) -> Dict:
+        """
+        Categorize hyperlink URLs into GitHub / LinkedIn / portfolio / project links
+        Returns dict with link categories mapped to URLs
+        """
+        links = categorize_links(all_links)
+        
+        if links:
+            print(f"🔗 Extracted {len(all_links)} total hyperlinks from PDF")
+            for key, url in links.items():
+                if key in ['github', 'linkedin', 'portfolio']:
+                    print(f"   {key}: {url}")
+            if 'project_links' in links:
+                print(f"   📦 Project links: {len(links['project_links'])} found")
+        
+        return links
+    
+    def iter_pdf_pages(
+        self,
+        file_path: str,
+        first_page: int = 1,
+        last_page: Optional[int] = None
+    ) -> Iterator[Tuple[int, str, List[str]]]:
+        """
+        Walk a PDF once, yielding (page_number, text, link_uris) for each page
+        
+        The document is opened a single time with pdfplumber and text and link
+        annotations are read from the same page object. Pages whose text is
+        shorter than PAGE_FALLBACK_MIN_CHARS are retried with PyPDF2; its reader
+        is only created the first time a page needs it.
+        
+        first_page/last_page (1-based, inclusive) restrict the walk to a page
+        range so several processes can split one document.
+        """
+        import pdfplumber
+        
+        page_numbers = None
+        if first_page > 1 or last_page is not None:
+            page_numbers = list(range(first_page, (last_page or self.count_pdf_pages(file_path)) + 1))
+        
+        with pdfplumber.open(file_path, pages=page_numbers) as pdf:
+            yield from self._walk_pdf_pages(pdf, file_path)
+    
+    def _walk_pdf_pages(self, pdf, file_path: str) -> Iterator[Tuple[int, str, List[str]]]:
+        """iter_pdf_pages over an already opened pdfplumber document"""
+        fallback_reader = None
+        for page in pdf.pages:
+            page_index = page.page_number - 1
+            page_text = page.extract_text() or ""
             
-            # Call Groq API with retry logic
-            max_retries = 2
-            for attempt in range(max_retries):
+            if len(page_text.strip()) < PAGE_FALLBACK_MIN_CHARS:
                 try:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a professional resume parser. Return only valid JSON with no markdown formatting."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        temperature=0.1,  # Low temperature for consistent extraction
-                        max_tokens=3000,  # Increased for comprehensive extraction
-                        top_p=1,
-                        stream=False
-                    )
-                    break
+                    if fallback_reader is None:
+                        fallback_reader = PyPDF2.PdfReader(file_path)
+                    fallback_text = fallback_reader.pages[page_index].extract_text() or ""
+                    if len(fallback_text.strip()) > len(page_text.strip()):
+                        print(f"⚠️ Page {page_index + 1}: using PyPDF2 text")
+                        page_text = fallback_text
                 except Exception as e:
-                    if attempt < max_retries - 1:
-                        print(f"⚠️ API call failed (attempt {attempt + 1}), retrying... Error: {e}")
-                        continue
-                    else:
-                        raise
-            
-            # Extract JSON from response
-            response_text = response.choices[0].message.content.strip()
-            
-            print(f"📥 Received response ({len(response_text)} chars)")
-            print(f"📄 First 200 chars of response: {response_text[:200]}")
+                    print(f"⚠️ PyPDF2 fallback failed on page {page_index + 1}: {e}")
             
-            # Clean up response text
-            # Remove markdown code blocks if present
-            if '```' in response_text:
-                # Extract content between code blocks
-                json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(1)
-                else:
-                    # Try to remove just the markers
-                    response_text = re.sub(r'^```(?:json)?\s*', '', response_text)
-                    response_text = re.sub(r'\s*```$', '', response_text)
-            
-            # Remove any leading/trailing whitespace
-            response_text = response_text.strip()
+            uris = [annot['uri'] for annot in (page.annots or []) if annot.get('uri')]
+            # Drop the page's cached layout objects before moving on
+            page.close()
+            yield page_index + 1, page_text, uris
+    
+    def count_pdf_pages(self, file_path: str) -> int:
+        """Number of pages in a PDF (reads the page tree only, no content)"""
+        return len(PyPDF2.PdfReader(file_path).pages)
+    
+    def extract_pdf_page_range(self, file_path: str, first_page: int, last_page: int) -> List[Tuple[int, str, List[str]]]:
+        """Extract one contiguous page range; the unit of work for page-parallel extraction"""
+        return list(self.iter_pdf_pages(file_path, first_page, last_page))
+    
+    def assemble_pdf_text(self, pages: Iterable[Tuple[int, str, List[str]]]) -> str:
+        """
+        Join per-page results into the text sent to the LLM
+        Adds the --- Page N --- markers and the extracted links section
+        """
+        text = ""
+        all_links = []
+        for page_num, page_text, uris in pages:
+            if page_text:
+                text += f"\n--- Page {page_num} ---\n"
+                text += page_text + "\n"
+            all_links.extend(uris)
+        
+        # Append extracted links to text for LLM to process
+        text += self._format_links_section(self._categorize_links(all_links))
+        return text
+    
+    def extract_hyperlinks_from_pdf(self, file_path: str) -> Dict[str, str]:
+        """
+        Extract hyperlinks from PDF annotations
+        Returns dict with link text mapped to URLs
+        """
+        all_links = []
+        try:
+            import pdfplumber
+            with pdfplumber.open(file_path) as pdf:
+                for page in pdf.pages:
+                    all_links.extend(annot['uri'] for annot in (page.annots or []) if annot.get('uri'))
+        except Exception as e:
+            print(f"⚠️ Could not extract hyperlinks: {e}")
+        
+        return self._categorize_links(all_links)
+    
+    def _format_links_section(self, hyperlinks: Dict) -> str:
+        """Render extracted links as a text section for the LLM to process"""
+        if not hyperlinks:
+            return ""
+        
+        text = "\n--- Extracted Links ---\n"
+        if 'github' in hyperlinks:
+            text += f"GitHub Profile: {hyperlinks['github']}\n"
+        if 'linkedin' in hyperlinks:
+            text += f"LinkedIn Profile: {hyperlinks['linkedin']}\n"
+        if 'portfolio' in hyperlinks:
+            text += f"Portfolio Website: {hyperlinks['portfolio']}\n"
+        
+        # Add all links so LLM can match them to projects
+        if 'all_links' in hyperlinks:
+            text += "\nAll Hyperlinks found in resume:\n"
+            for i, link in enumerate(hyperlinks['all_links'], 1):
+                text += f"{i}. {link}\n"
+        return text
+    
+    def extract_text_from_pdf_enhanced(self, file_path: str, max_pages: int = 0) -> str:
+        """
+        Enhanced PDF text extraction with better handling
+        Extracts text page by page and preserves structure
+        Also extracts hyperlinks and appends them to text
+        
+        Text and links come from a single pass over the document
+        (see iter_pdf_pages), so each page is parsed only once.
+        
+        With max_pages set, the page count of that same opened document
+        decides whether to extract: longer PDFs raise PdfTooLongError so the
+        caller can split them, without a separate open to count pages.
+        """
+        text = ""
+        try:
+            import pdfplumber
+            with pdfplumber.open(file_path) as pdf:
+                if max_pages > 0 and len(pdf.pages) > max_pages:
+                    raise PdfTooLongError(len(pdf.pages))
+                text = self.assemble_pdf_text(self._walk_pdf_pages(pdf, file_path))
             
+            print(f"✅ Extracted {len(text)} characters from PDF using pdfplumber")
+        except PdfTooLongError:
+            raise
+        except ImportError:
+            print("⚠️ pdfplumber not available, falling back to PyPDF2")
+            text = self._extract_text_from_pdf_with_markers(file_path)
+        except Exception as e:
+            print(f"❌ Error with pdfplumber: {e}, falling back to PyPDF2")
+            text = self._extract_text_from_pdf_with_markers(file_path)
+        
+        return text
+    
+    def _extract_text_from_pdf_with_markers(self, file_path: str) -> str:
+        """PyPDF2-only extraction that keeps the page markers"""
+        text = ""
+        try:
+            with open(file_path, 'rb') as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                for page_num, page in enumerate(pdf_reader.pages, 1):
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += f"\n--- Page {page_num} ---\n"
+                        text += page_text + "\n"
+            print(f"✅ Extracted {len(text)} characters from PDF using PyPDF2")
+        except Exception as e:
+            print(f"❌ Error extracting PDF: {e}")
+        return text
+    
+    def _build_extraction_prompt(self, text: str) -> Tuple[str, Dict]:
+        """
+        Build the extraction prompt sent to the LLM
+        
+        The resume text is compacted (whitespace, page markers, boilerplate and
+        duplicate links removed) and fitted to the token budget by section
+        priority instead of being cut at a fixed character offset.
+        
+        Returns:
+            (prompt, compaction stats)
+        """
+        compacted = compact_resume_text(text, self.prompt_token_budget)
+        
+        print(f"📝 Sending {len(compacted['text'])} characters (~{compacted['tokens_in']} tokens, "
+              f"was ~{compacted['original_tokens']}) to Groq LLM...")
+        if compacted["truncated_sections"]:
+            print(f"   ✂️ Trimmed to fit budget: {', '.join(compacted['truncated_sections'])}")
+        
+        stats = {key: value for key, value in compacted.items() if key != "text"}
+        return EXTRACTION_PROMPT_TEMPLATE.format(resume_text=compacted["text"]), stats
+    
+    def _record_llm_call(self, compaction: Dict, usage: Optional[Dict], latency: float, model: str) -> Dict:
+        """Update running token totals and return the per-parse metrics"""
+        metrics = {
+            "model": model,
+            "llm_latency_ms": round(latency * 1000),
+            "resume_tokens_estimated": compaction["tokens_in"],
+            "original_tokens_estimated": compaction["original_tokens"],
+            "truncated_sections": compaction["truncated_sections"],
+            "prompt_tokens": usage["prompt_tokens"] if usage else None,
+            "completion_tokens": usage["completion_tokens"] if usage else None
+        }
+        self.llm_stats["calls"] += 1
+        self.llm_stats["llm_latency_ms"] += metrics["llm_latency_ms"]
+        self.llm_stats["resume_tokens_estimated"] += compaction["tokens_in"]
+        self.llm_stats["original_tokens_estimated"] += compaction["original_tokens"]
+        if usage:
+            self.llm_stats["prompt_tokens"] += usage["prompt_tokens"]
+            self.llm_stats["completion_tokens"] += usage["completion_tokens"]
+        model_stats = self.model_stats.setdefault(model, {"calls": 0, "llm_latency_ms": 0})
+        model_stats["calls"] += 1
+        model_stats["llm_latency_ms"] += metrics["llm_latency_ms"]
+        return metrics
+    
+    def _get_completion_kwargs(self, prompt: str, model: Optional[str] = None) -> Dict:
+        """Request parameters for the extraction call"""
+        return {
+            "model": model or self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": EXTRACTION_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.1,  # Low temperature for consistent extraction
+            "max_tokens": 3000,  # Increased for comprehensive extraction
+            "top_p": 1,
+            "stream": False
+        }
+    
+    def _parse_llm_response(self, response_text: str) -> Optional[Dict]:
+        """Clean up, parse and validate the JSON returned by the LLM (None if unusable)"""
+        print(f"📥 Received response ({len(response_text)} chars)")
+        print(f"📄 First 200 chars of response: {response_text[:200]}")
+        
+        # Clean up response text
+        # Remove markdown code blocks if present
+        if '```' in response_text:
+            # Extract content between code blocks
+            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
+            if json_match:
+                response_text = json_match.group(1)
+            else:
+                # Try to remove just the markers
+                response_text = re.sub(r'^```(?:json)?\s*', '', response_text)
+                response_text = re.sub(r'\s*```$', '', response_text)
+        
+        # Remove any leading/trailing whitespace
+        response_text = response_text.strip()
+        
+        try:
             # Parse JSON
             print("🔍 Parsing JSON response...")
             extracted_data = json.loads(response_text)
-            
-            # Validate extracted data
-            if not isinstance(extracted_data, dict):
-                print(f"⚠️ Response is not a dict: {type(extracted_data)}")
-                return self._get_empty_structure()
-            
-            # Ensure all required keys exist
-            required_keys = ['name', 'skills', 'experience', 'education', 'certifications', 'summary']
-            optional_keys = ['projects', 'achievements', 'languages', 'publications', 'volunteer']
-            
-            for key in required_keys:
-                if key not in extracted_data:
-                    extracted_data[key] = [] if key in ['skills', 'experience', 'education', 'certifications'] else None
-            
-            for key in optional_keys:
-                if key not in extracted_data:
-                    extracted_data[key] = []
-            
-            # Log success
-            print(f"✅ LLM extraction successful!")
-            print(f"   📛 Name: {extracted_data.get('name')}")
-            print(f"   ⚡ Skills: {len(extracted_data.get('skills', []))} found")
-            print(f"   💼 Experience: {len(extracted_data.get('experience', []))} positions")
-            print(f"   🎓 Education: {len(extracted_data.get('education', []))} entries")
-            print(f"   📜 Certifications: {len(extracted_data.get('certifications', []))} found")
-            print(f"   🚀 Projects: {len(extracted_data.get('projects', []))} found")
-            print(f"   🏆 Achievements: {len(extracted_data.get('achievements', []))} found")
-            
-            return extracted_data
-            
         except json.JSONDecodeError as e:
             print(f"❌ JSON parse error: {e}")
             print(f"📄 Raw response (first 500 chars):")
-            print(response_text[:500] if 'response_text' in locals() else "No response")
+            print(response_text[:500])
+            return None
+        
+        # Validate extracted data
+        if not isinstance(extracted_data, dict):
+            print(f"⚠️ Response is not a dict: {type(extracted_data)}")
+            return None
+        
+        # Ensure all required keys exist
+        required_keys = ['name', 'skills', 'experience', 'education', 'certifications', 'summary']
+        optional_keys = ['projects', 'achievements', 'languages', 'publications', 'volunteer']
+        
+        for key in required_keys:
+            if key not in extracted_data:
+                extracted_data[key] = [] if key in ['skills', 'experience', 'education', 'certifications'] else None
+        
+        for key in optional_keys:
+            if key not in extracted_data:
+                extracted_data[key] = []
+        
+        # Log success
+        print(f"✅ LLM extraction successful!")
+        print(f"   📛 Name: {extracted_data.get('name')}")
+        print(f"   ⚡ Skills: {len(extracted_data.get('skills', []))} found")
+        print(f"   💼 Experience: {len(extracted_data.get('experience', []))} positions")
+        print(f"   🎓 Education: {len(extracted_data.get('education', []))} entries")
+        print(f"   📜 Certifications: {len(extracted_data.get('certifications', []))} found")
+        print(f"   🚀 Projects: {len(extracted_data.get('projects', []))} found")
+        print(f"   🏆 Achievements: {len(extracted_data.get('achievements', []))} found")
+        
+        return extracted_data
+    
+    def _get_usage(self, response) -> Optional[Dict[str, int]]:
+        """Token usage reported by the API, if any"""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+        return {
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens
+        }
+    
+    async def extract_info_with_llm_async(self, text: str, model: Optional[str] = None) -> Dict:
+        """
+        Use Groq LLM to intelligently extract structured information from resume
+        Goes through the shared LLM gateway so the event loop is not blocked
+        during the request and the call counts against the global rate limits
+        
+        Args:
+            text: Extracted resume text
+            model: Groq model to use (defaults to self.model)
+        """
+        model = model or self.model
+        if not text or len(text.strip()) < 50:
+            print("⚠️ Text too short for LLM extraction")
             return self._get_empty_structure()
+        
+        prompt, compaction = self._build_extraction_prompt(text)
+        
+        try:
+            print(f"🤖 Calling Groq API (async, {model})...")
+            
+            # The gateway queues under its rate limits and retries 429s/transient errors
+            started = time.perf_counter()
+            response = await llm_gateway.chat(
+                "resume_extraction", priority=LLMPriority.BACKGROUND, deadline=EXTRACTION_DEADLINE_SECONDS,
+                **self._get_completion_kwargs(prompt, model)
+            )
+            
+            extracted_data = self._parse_llm_response(response.choices[0].message.content.strip())
+            if extracted_data is None:
+                return self._get_empty_structure()
+            extracted_data["llm_usage"] = self._get_usage(response)
+            extracted_data["parse_metrics"] = self._record_llm_call(
+                compaction, extracted_data["llm_usage"], time.perf_counter() - started, model
+            )
+            return extracted_data
             
         except Exception as e:
             print(f"❌ LLM extraction error: {type(e).__name__}: {e}")
@@ -427,45 +569,29 @@ CRITICAL INSTRUCTIONS:
             "summary": None
         }
     
-    def parse(self, file_path: str) -> Dict:
-        """
-        Main parsing function - extract all information from resume using LLM
-        
-        This method:
-        1. Extracts text from PDF/DOCX
-        2. Uses regex for contact info (fast & reliable)
-        3. Uses Groq LLM for intelligent extraction of skills, experience, education
-        
-        Why this hybrid approach?
-        - Regex: Perfect for structured data like email, phone, URLs
-        - LLM: Much better for understanding context, extracting skills, summarizing
-        """
-        print(f"📄 Parsing resume: {file_path}")
-        
-        # Step 1: Extract text from file
-        text = self.extract_text(file_path)
-        
-        if not text or len(text.strip()) < 50:
-            print("⚠️ Resume text is too short or empty")
-            return {
-                "name": "Unknown",
-                "email": None,
-                "phone": None,
-                "skills": [],
-                "experience": [],
-                "education": [],
-                "certifications": [],
-                "summary": None,
-                "linkedin": None,
-                "github": None,
-                "portfolio": None,
-                "raw_text": ""
-            }
-        
+    def _get_short_text_result(self) -> Dict:
+        """Result returned when no usable text could be extracted"""
+        return {
+            "name": "Unknown",
+            "email": None,
+            "phone": None,
+            "skills": [],
+            "experience": [],
+            "education": [],
+            "certifications": [],
+            "summary": None,
+            "linkedin": None,
+            "github": None,
+            "portfolio": None,
+            "raw_text": ""
+        }
+    
+    def _extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
+        """Run regex contact extraction and log the results"""
         print(f"✅ Extracted {len(text)} characters from resume")
         print(f"📄 Text preview (first 300 chars):\n{text[:300]}...\n")
         
-        # Step 2: Extract contact info using regex (fast and reliable)
+        # Extract contact info using regex (fast and reliable)
         print("📧 Extracting contact information with regex...")
         basic_info = self.extract_basic_info_with_regex(text)
         print(f"   ✉️  Email: {basic_info.get('email')}")
@@ -473,12 +599,10 @@ CRITICAL INSTRUCTIONS:
         print(f"   🔗 LinkedIn: {basic_info.get('linkedin')}")
         print(f"   🔗 GitHub: {basic_info.get('github')}")
         print(f"   🌐 Portfolio: {basic_info.get('portfolio')}")
-        
-        # Step 3: Extract structured data using LLM (intelligent parsing)
-        print("\n🤖 Extracting structured data with Groq LLM...")
-        llm_data = self.extract_info_with_llm(text)
-        
-        # Step 4: Combine results
+        return basic_info
+    
+    def _combine_results(self, text: str, basic_info: Dict, llm_data: Dict) -> Dict:
+        """Merge regex contact info and LLM-extracted data into the parse result"""
         result = {
             "name": llm_data.get("name") or "Candidate",
             "email": basic_info["email"],
@@ -496,7 +620,9 @@ CRITICAL INSTRUCTIONS:
             "linkedin": basic_info["linkedin"],
             "github": basic_info["github"],
             "portfolio": basic_info.get("portfolio"),  # Use portfolio from regex extraction
-            "raw_text": text[:5000]  # Limit to first 5000 chars
+            "raw_text": text[:5000],  # Limit to first 5000 chars
+            "llm_usage": llm_data.get("llm_usage"),  # None if the LLM call failed
+            "parse_metrics": llm_data.get("parse_metrics")
         }
         
         print(f"✅ Parsing complete! Found: {len(result['skills'])} skills, "
@@ -504,6 +630,55 @@ CRITICAL INSTRUCTIONS:
               f"{len(result['projects'])} projects, {len(result['achievements'])} achievements")
         
         return result
+    
+    async def parse_async(self, file_path: str,
+                          on_stage: Optional[Callable[[str], Awaitable[None]]] = None,
+                          model: Optional[str] = None) -> Dict:
+        """
+        Main parsing function - extract all information from resume using LLM
+        
+        This method:
+        1. Extracts text from PDF/DOCX
+        2. Uses regex for contact info (fast & reliable)
+        3. Uses Groq LLM for intelligent extraction of skills, experience, education
+        
+        Why this hybrid approach?
+        - Regex: Perfect for structured data like email, phone, URLs
+        - LLM: Much better for understanding context, extracting skills, summarizing
+        
+        Text extraction (pdfplumber/PyPDF2) runs in the parse pool's worker
+        processes and the Groq call uses the async client, so a slow upload
+        does not stall other requests on the same event loop.
+        
+        Args:
+            file_path: Path to the uploaded resume
+            on_stage: Optional coroutine called with "llm" once text
+                extraction is done and the Groq call is about to start
+            model: Groq model for the extraction (defaults to self.model)
+        
+        Raises:
+            ParsePoolFullError: If the parse queue is at capacity
+        """
+        print(f"📄 Parsing resume: {file_path}")
+        
+        # Step 1: Extract text in a worker process
+        text = await parse_pool.extract_text(file_path)
+        
+        if not text or len(text.strip()) < 50:
+            print("⚠️ Resume text is too short or empty")
+            return self._get_short_text_result()
+        
+        # Step 2: Extract contact info using regex
+        basic_info = self._extract_contact_info(text)
+        
+        # Step 3: Extract structured data using LLM without blocking the loop
+        if on_stage is not None:
+            await on_stage("llm")
+        print("\n🤖 Extracting structured data with Groq LLM...")
+        llm_data = await self.extract_info_with_llm_async(text, model)
+        
+        # Step 4: Combine results
+        return self._combine_results(text, basic_info, llm_data)
 
 
 # Singleton instance
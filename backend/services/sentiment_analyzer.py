@@ -1,11 +1,11 @@
-import google.generativeai as genai
 from typing import Dict
+from services.llm_router import llm_router
+
+# Seconds a sentiment call may take, queueing and retries included
+ANALYSIS_DEADLINE_SECONDS = 20
 
 class SentimentAnalyzer:
-    def __init__(self):
-        self.model = genai.GenerativeModel('gemini-pro')
-    
-    def analyze(self, text: str, audio_features: dict = None) -> Dict:
+    async def analyze(self, text: str, audio_features: dict = None) -> Dict:
         """Analyze sentiment and confidence from text and speech"""
         
         prompt = f"""
@@ -21,7 +21,10 @@ class SentimentAnalyzer:
         Format: confidence:X, enthusiasm:X, clarity:X, professionalism:X, sentiment:XXX
         """
         
-        response = self.model.generate_content(prompt)
+        response = await llm_router.complete(
+            "sentiment_analyzer", [{"role": "user", "content": prompt}],
+            max_tokens=256, deadline=ANALYSIS_DEADLINE_SECONDS
+        )
         
         # Parse scores
         scores = {
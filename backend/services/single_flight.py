@@ -0,0 +1,85 @@
+"""
+Single flight - Share one in-flight call between concurrent identical requests
+"""
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, Awaitable, Callable, Dict, List
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def chat_request_key(provider: str, kwargs: Dict) -> str:
+    """
+    Key for a chat completion request
+
+    Message contents are whitespace-normalized, so prompts that differ only
+    in indentation or line breaks share a key. Model and every other
+    parameter (temperature, max_tokens, ...) are part of the key.
+    """
+    messages: List[Dict] = [
+        {"role": message.get("role"), "content": _WHITESPACE.sub(" ", str(message.get("content", ""))).strip()}
+        for message in kwargs.get("messages", [])
+    ]
+    params = {key: value for key, value in kwargs.items() if key != "messages"}
+    fingerprint = json.dumps({"provider": provider, "messages": messages, "params": params},
+                             sort_keys=True, default=str)
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+class SingleFlight:
+    """
+    In-process request coalescing
+
+    The first caller for a key starts the call as its own task. Callers
+    arriving with the same key before it finishes await that task instead
+    of starting another one, and all of them get its result (or its
+    exception). Nothing is kept once the call completes, so this never
+    serves stale results; it only merges requests that overlap in time.
+
+    The shared task is shielded, so one caller being cancelled (e.g. a
+    client disconnect) doesn't cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run factory() for key, or join the call already running for it
+
+        Args:
+            key: Request identity (see chat_request_key)
+            factory: Zero-argument coroutine factory making the call
+
+        Returns:
+            The shared call's result
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: str, task: asyncio.Task):
+        self._calls.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Mark retrieved in case every caller was cancelled
+
+    def joined(self, key: str) -> bool:
+        """Whether a call for key is currently in flight"""
+        return key in self._calls
+
+    def stats(self) -> Dict:
+        return {
+            "in_flight": len(self._calls),
+            "calls": self.leaders,
+            "coalesced": self.coalesced
+        }
@@ -0,0 +1,299 @@
+"""
+User interview stats - Dashboard stats kept up to date as interviews change
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from pymongo.errors import DuplicateKeyError
+from config import settings
+from services.interview_events import stored_count
+from services.interview_stats import PENDING_STATUSES, RECENT_INTERVIEWS, interview_stats
+from utils.database import Database
+
+# Counters kept in each stats document
+COUNTER_FIELDS = ("total_interviews", "completed_interviews", "pending_interviews", "score_total", "scored_interviews")
+
+# Times a rebuild recomputes when updates keep landing while it computes
+REBUILD_ATTEMPTS = 3
+
+
+def _summary(interview: Dict) -> Dict:
+    """The fields of an interview the dashboard's recent list shows"""
+    return {
+        "_id": interview.get("_id"),
+        "session_id": interview.get("session_id"),
+        "job_role": interview.get("job_role"),
+        "created_at": interview.get("created_at"),
+        "status": interview.get("status"),
+        "overall_score": interview.get("overall_score"),
+        "duration": interview.get("duration"),
+        "responses_count": stored_count(interview, "responses")
+    }
+
+
+def _categories(questions: Iterable) -> List:
+    return [q.get("category") for q in questions or [] if isinstance(q, dict) and q.get("category")]
+
+
+def _status_counters(interview: Dict) -> Dict[str, float]:
+    """What one interview contributes to the status and score counters"""
+    status = interview.get("status")
+    score = interview.get("overall_score")
+    scored = status == "completed" and bool(score)
+    return {
+        "completed_interviews": 1 if status == "completed" else 0,
+        "pending_interviews": 1 if status in PENDING_STATUSES else 0,
+        "score_total": score if scored else 0,
+        "scored_interviews": 1 if scored else 0
+    }
+
+
+class UserInterviewStats:
+    """
+    Materialized per-user dashboard stats (`user_interview_stats`, keyed by user id)
+
+    The interview routes apply each change as one atomic $inc/$set/$push on
+    the user's document, so GET /api/interviews/user/stats is a point read
+    by _id. A document is built from the interviews collection (see
+    InterviewStatsService.compute) the first time a user's stats are read;
+    updates for users without a document are skipped, since that build
+    includes them.
+
+    Every update increments the document's version. A rebuild first makes
+    sure a document exists (an empty placeholder marked `building` for a
+    new user, so updates landing mid-build are counted in it), computes,
+    and replaces the document only if its version is unchanged; otherwise
+    it computes again, so increments made during a rebuild aren't lost.
+
+    Updates run after the interview write and are not transactional with
+    it, so a crash in between leaves the stats off by that change.
+    reconcile() rebuilds every user's stats from source, reports which
+    fields had drifted, and runs periodically.
+    """
+
+    COLLECTION = "user_interview_stats"
+
+    def __init__(self, reconcile_interval_seconds: int):
+        """
+        Args:
+            reconcile_interval_seconds: Seconds between reconciliation runs (0 disables the background task)
+        """
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.reads = 0
+        self.builds = 0
+        self.update_errors = 0
+        self.runs = 0
+        self.total_drifted = 0
+        self.last_run: Optional[Dict] = None
+
+    def _collection(self):
+        return Database.get_collection(self.COLLECTION)
+
+    async def start(self):
+        """Start the periodic reconciliation"""
+        if self._task is None and self.reconcile_interval_seconds > 0:
+            self._task = asyncio.create_task(self._loop())
+            print(f"✅ User stats reconciliation scheduled every {self.reconcile_interval_seconds}s")
+
+    async def stop(self):
+        """Cancel the periodic reconciliation"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.reconcile_interval_seconds)
+            try:
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ User stats reconciliation failed: {e}")
+
+    async def get(self, user_id: str) -> Dict:
+        """
+        Dashboard stats for a user
+
+        Args:
+            user_id: Interview owner
+
+        Returns:
+            {"stats": {...}, "recent_interviews": [...]} as served by /api/interviews/user/stats
+        """
+        self.reads += 1
+        stored = await self._collection().find_one({"_id": user_id})
+        if stored is None or stored.get("building"):
+            stored = await self.rebuild(user_id)
+        return interview_stats.format(stored)
+
+    async def rebuild(self, user_id: str) -> Dict:
+        """Recompute a user's stats from the interviews collection and store them"""
+        computed: Dict = {}
+        for _ in range(REBUILD_ATTEMPTS):
+            stored = await self._collection().find_one({"_id": user_id}, {"version": 1})
+            if stored is None:
+                placeholder = {field: 0 for field in COUNTER_FIELDS}
+                try:
+                    await self._collection().insert_one({
+                        "_id": user_id, **placeholder, "categories": [], "recent_interviews": [],
+                        "version": 0, "building": True
+                    })
+                except DuplicateKeyError:
+                    continue  # Another rebuild created it first
+                version = 0
+            else:
+                version = stored.get("version")
+
+            computed = await interview_stats.compute(user_id)
+            now = datetime.utcnow()
+            replaced = await self._collection().replace_one(
+                {"_id": user_id, "version": version},
+                {**computed, "version": (version or 0) + 1, "rebuilt_at": now, "updated_at": now}
+            )
+            if replaced.matched_count:
+                self.builds += 1
+                return computed
+        print(f"⚠️ User stats for {user_id} kept changing during rebuild (reconciliation will repair it)")
+        return computed
+
+    async def _apply(self, user_id: str, update: Dict, session_id: Optional[str] = None):
+        """Apply one update to a user's stats; session_id scopes $[recent] to that interview"""
+        update.setdefault("$set", {})["updated_at"] = datetime.utcnow()
+        update.setdefault("$inc", {})["version"] = 1
+        try:
+            await self._collection().update_one(
+                {"_id": user_id}, update,
+                array_filters=[{"recent.session_id": session_id}] if session_id is not None else None
+            )
+        except Exception as e:
+            self.update_errors += 1
+            print(f"⚠️ User stats update for {user_id} failed (reconciliation will repair it): {e}")
+
+    async def interview_created(self, interview: Dict):
+        """Count a new interview and put it at the top of the recent list"""
+        counters = {"total_interviews": 1, **_status_counters(interview)}
+        update = {
+            "$inc": {field: value for field, value in counters.items() if value},
+            "$push": {"recent_interviews": {
+                "$each": [_summary(interview)], "$sort": {"created_at": -1}, "$slice": RECENT_INTERVIEWS
+            }}
+        }
+        categories = _categories(interview.get("questions"))
+        if categories:
+            update["$addToSet"] = {"categories": {"$each": categories}}
+        await self._apply(interview["user_id"], update)
+
+    async def questions_added(self, user_id: str, questions: List[Dict]):
+        """Record the categories of questions appended to an interview"""
+        categories = _categories(questions)
+        if categories:
+            await self._apply(user_id, {"$addToSet": {"categories": {"$each": categories}}})
+
+    async def status_changed(self, before: Dict, after: Dict):
+        """
+        Move an interview between the status/score counters
+
+        Args:
+            before: Interview as it was before the update (e.g. find_one_and_update's return value)
+            after: The same interview with the update applied
+        """
+        old, new = _status_counters(before), _status_counters(after)
+        update = {
+            "$set": {
+                f"recent_interviews.$[recent].{field}": after.get(field)
+                for field in ("status", "overall_score", "duration")
+            }
+        }
+        delta = {field: new[field] - old[field] for field in new if new[field] != old[field]}
+        if delta:
+            update["$inc"] = delta
+        await self._apply(after["user_id"], update, session_id=after["session_id"])
+
+    async def answer_added(self, user_id: str, session_id: str):
+        """Count a submitted answer on the interview's recent-list entry"""
+        await self._apply(user_id, {"$inc": {"recent_interviews.$[recent].responses_count": 1}}, session_id=session_id)
+
+    @staticmethod
+    def _drifted_fields(stored: Dict, source: Dict) -> List[str]:
+        fields = [field for field in COUNTER_FIELDS if stored.get(field, 0) != source[field]]
+        if set(stored.get("categories", [])) != set(source["categories"]):
+            fields.append("categories")
+        if interview_stats.format(stored)["recent_interviews"] != interview_stats.format(source)["recent_interviews"]:
+            fields.append("recent_interviews")
+        return fields
+
+    async def reconcile(self, fix: bool = True) -> Dict:
+        """
+        Compare every stored stats document with stats recomputed from source
+
+        Args:
+            fix: Overwrite drifted documents with the recomputed stats
+
+        Returns:
+            Report with users checked, documents drifted/fixed and how often each field drifted
+        """
+        started = time.perf_counter()
+        interviews = Database.get_collection("interviews")
+        user_ids = await self._collection().distinct("_id")
+
+        drifted = 0
+        fixed = 0
+        fields: Dict[str, int] = {}
+        examples = []
+        for user_id in user_ids:
+            stored = await self._collection().find_one({"_id": user_id})
+            if stored is None:
+                continue  # Deleted mid-run
+            source = await interview_stats.compute(user_id)
+            drift = self._drifted_fields(stored, source)
+            if not drift:
+                continue
+            drifted += 1
+            for field in drift:
+                fields[field] = fields.get(field, 0) + 1
+            if len(examples) < 10:
+                examples.append({
+                    "user_id": user_id,
+                    "fields": drift,
+                    "stored": {field: stored.get(field, 0) for field in COUNTER_FIELDS},
+                    "source": {field: source[field] for field in COUNTER_FIELDS}
+                })
+            if fix:
+                await self.rebuild(user_id)
+                fixed += 1
+
+        report = {
+            "ran_at": datetime.utcnow(),
+            "duration_ms": round((time.perf_counter() - started) * 1000),
+            "checked": len(user_ids),
+            "users_without_stats": len(set(await interviews.distinct("user_id")) - set(user_ids)),
+            "drifted": drifted,
+            "fixed": fixed,
+            "fields": fields,
+            "examples": examples
+        }
+        self.runs += 1
+        self.total_drifted += drifted
+        self.last_run = report
+        print(f"🔁 User stats reconciliation: {drifted}/{len(user_ids)} drifted, {fixed} rebuilt")
+        return report
+
+    def stats(self) -> Dict:
+        """Read/build counters and the last reconciliation's report"""
+        return {
+            "reconcile_interval_seconds": self.reconcile_interval_seconds,
+            "reads": self.reads,
+            "builds": self.builds,
+            "update_errors": self.update_errors,
+            "reconcile_runs": self.runs,
+            "total_drifted": self.total_drifted,
+            "last_run": self.last_run
+        }
+
+
+# Singleton instance
+user_interview_stats = UserInterviewStats(reconcile_interval_seconds=settings.USER_STATS_RECONCILE_INTERVAL_SECONDS)
@@ -3,10 +3,15 @@ Utilities package
 """
 from .database import Database
 from .helpers import generate_id, validate_file, format_response
+from .json_stream import JSONArrayStream
+from .upload_stream import UploadRejectedError, receive_upload
 
 __all__ = [
     "Database",
     "generate_id",
     "validate_file",
     "format_response",
+    "JSONArrayStream",
+    "UploadRejectedError",
+    "receive_upload",
 ]
@@ -0,0 +1,76 @@
+"""
+Index registry - Every MongoDB index the API relies on, created at startup
+"""
+from typing import Dict, List
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from utils.database import Database
+
+# Collection -> indexes, with the queries each one serves. Add an entry here
+# (and a query to benchmarks/check_query_plans.py) whenever a new query shape
+# is introduced. Index names are left to MongoDB's defaults so indexes
+# created by earlier versions are recognised rather than duplicated.
+INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        # Registration duplicate check and login lookup; one account per email
+        IndexModel([("email", ASCENDING)], unique=True),
+        # Login's $or branch and /auth/me (null until the first Firebase login)
+        IndexModel([("firebase_uid", ASCENDING)]),
+    ],
+    "interviews": [
+        # Every /api/interviews/{session_id} route, the question feed and the WebSocket
+        IndexModel([("session_id", ASCENDING)], unique=True),
+        # Dashboard stats and reconciliation, newest first
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "interview_event_buckets": [
+        # Appends, paged reads and migration address buckets by session, stream and sequence
+        IndexModel([("session_id", ASCENDING), ("kind", ASCENDING), ("seq", ASCENDING)], unique=True),
+    ],
+    "resumes": [
+        # A user's resumes newest first (profile, /user/all, replace-on-upload)
+        IndexModel([("user_id", ASCENDING), ("uploaded_at", DESCENDING)]),
+        # Blob reference counts for the garbage collector
+        IndexModel([("blob_key", ASCENDING)]),
+    ],
+    "resume_parse_jobs": [
+        # Claiming the next queued job / a job whose lease expired
+        IndexModel([("stage", ASCENDING), ("available_at", ASCENDING)]),
+        IndexModel([("stage", ASCENDING), ("lease_expires_at", ASCENDING)]),
+        # Blobs still needed by unfinished jobs
+        IndexModel([("blob_key", ASCENDING)]),
+    ],
+    "question_set_cache": [
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+    "question_speculations": [
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+}
+
+
+async def apply_indexes(registry: Dict[str, List[IndexModel]] = INDEXES) -> Dict[str, List[str]]:
+    """
+    Create every registered index that doesn't exist yet
+
+    Indexes are created one at a time so a failure (e.g. duplicate emails
+    already stored under a new unique index) only skips that index; it is
+    logged and startup continues.
+
+    Args:
+        registry: Collection -> indexes to create
+
+    Returns:
+        Index names created or already present, per collection
+    """
+    applied: Dict[str, List[str]] = {}
+    for collection_name, indexes in registry.items():
+        collection = Database.get_collection(collection_name)
+        for index in indexes:
+            try:
+                names = await collection.create_indexes([index])
+                applied.setdefault(collection_name, []).extend(names)
+            except Exception as e:
+                print(f"⚠️ Could not create index {index.document['name']} on {collection_name}: {e}")
+    total = sum(len(names) for names in applied.values())
+    print(f"✅ MongoDB indexes ensured: {total} across {len(applied)} collections")
+    return applied
@@ -0,0 +1,74 @@
+"""
+Incremental JSON array parsing - Pull complete elements out of a streamed JSON array
+"""
+import json
+from typing import Any, List
+
+
+class JSONArrayStream:
+    """
+    Parser for a top-level JSON array arriving in chunks (e.g. LLM tokens)
+
+    Text before the opening "[" (a ```json fence, a preamble) and after the
+    closing "]" is ignored. Each object or array element is decoded as soon
+    as its closing bracket arrives; scalar elements are skipped, since the
+    arrays we stream hold objects. Elements that fail to decode are dropped
+    and counted in `invalid`.
+    """
+
+    def __init__(self):
+        self.started = False
+        self.finished = False
+        self.invalid = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._element: List[str] = []
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Consume the next piece of text
+
+        Args:
+            chunk: Text continuing the stream
+
+        Returns:
+            Elements completed by this chunk, in order
+        """
+        completed = []
+        for char in chunk:
+            if self.finished:
+                break
+            if not self.started:
+                self.started = char == "["
+                continue
+
+            if self._depth == 0:
+                if char in "{[":
+                    self._depth = 1
+                    self._element = [char]
+                elif char == "]":
+                    self.finished = True
+                continue
+
+            self._element.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        completed.append(json.loads("".join(self._element)))
+                    except json.JSONDecodeError:
+                        self.invalid += 1
+                    self._element = []
+        return completed
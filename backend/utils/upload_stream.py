@@ -0,0 +1,248 @@
+"""
+Streaming multipart uploads - Write an uploaded file to disk as its bytes arrive
+"""
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+from fastapi import Request
+from starlette.requests import ClientDisconnect
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ModuleNotFoundError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+
+# Leading bytes of each accepted file type
+FILE_SIGNATURES = {
+    ".pdf": b"%PDF-",
+    ".docx": b"PK\x03\x04",  # ZIP container
+    ".doc": b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",  # OLE2 compound file
+}
+SNIFF_BYTES = max(len(signature) for signature in FILE_SIGNATURES.values())
+
+# Cap on the size of each non-file form field
+MAX_FIELD_SIZE = 4 * 1024
+
+# Allowance for boundaries, part headers and form fields when checking Content-Length
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadRejectedError(Exception):
+    """Raised when an upload is refused; carries the HTTP status to return"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class _UploadReceiver:
+    """
+    Callbacks for python-multipart's streaming parser
+
+    The file part is hashed and written to a hidden `.part` file in the
+    destination directory chunk by chunk. Nothing is written until the
+    first bytes match the signature for the file's extension, and the
+    part is abandoned the moment it grows past max_size.
+    """
+
+    def __init__(self, file_field: str, dest_dir: Path, allowed_extensions: List[str], max_size: int):
+        self.file_field = file_field
+        self.dest_dir = dest_dir
+        self.allowed_extensions = allowed_extensions
+        self.max_size = max_size
+
+        self.fields: Dict[str, str] = {}
+        self.filename: Optional[str] = None
+        self.extension: Optional[str] = None
+        self.temp_path: Optional[Path] = None
+        self.size = 0
+        self.hasher = hashlib.sha256()
+
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._headers: Dict[bytes, bytes] = {}
+        self._part_name: Optional[str] = None
+        self._in_file = False
+        self._field_buffer = bytearray()
+        self._sniff_buffer: Optional[bytearray] = None
+        self._out = None
+
+    def callbacks(self) -> Dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+    def on_part_begin(self):
+        self._headers = {}
+        self._part_name = None
+        self._in_file = False
+        self._field_buffer = bytearray()
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def on_header_end(self):
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._part_name = options.get(b"name", b"").decode("latin-1")
+        if self._part_name != self.file_field or b"filename" not in options:
+            return
+
+        if self.temp_path is not None:
+            raise UploadRejectedError(400, "Only one file can be uploaded")
+
+        # Browsers may send a full client path as the filename
+        self.filename = Path(options[b"filename"].decode("utf-8", "replace").replace("\\", "/")).name
+        self.extension = Path(self.filename).suffix.lower()
+        if self.extension not in self.allowed_extensions:
+            raise UploadRejectedError(400, f"Invalid file type. Allowed types: {', '.join(self.allowed_extensions)}")
+
+        self._in_file = True
+        self._sniff_buffer = bytearray()
+        self.temp_path = self.dest_dir / f".{uuid.uuid4().hex}.part"
+        self._out = open(self.temp_path, "wb")
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        chunk = data[start:end]
+        if not self._in_file:
+            self._field_buffer += chunk
+            if len(self._field_buffer) > MAX_FIELD_SIZE:
+                raise UploadRejectedError(400, f"Form field '{self._part_name}' is too large")
+            return
+
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise UploadRejectedError(413, f"File too large. Maximum size: {self.max_size // (1024*1024)}MB")
+
+        if self._sniff_buffer is not None:
+            self._sniff_buffer += chunk
+            if len(self._sniff_buffer) < SNIFF_BYTES:
+                return
+            self._check_signature()
+            chunk = bytes(self._sniff_buffer)
+            self._sniff_buffer = None
+
+        self.hasher.update(chunk)
+        self._out.write(chunk)
+
+    def on_part_end(self):
+        if not self._in_file:
+            if self._part_name:
+                self.fields[self._part_name] = self._field_buffer.decode("utf-8", "replace")
+            return
+
+        if self._sniff_buffer is not None:
+            # File shorter than SNIFF_BYTES
+            self._check_signature()
+            self.hasher.update(self._sniff_buffer)
+            self._out.write(self._sniff_buffer)
+            self._sniff_buffer = None
+        self._out.close()
+        self._out = None
+        self._in_file = False
+
+    @property
+    def file_complete(self) -> bool:
+        """True once the file part has been fully written"""
+        return self.temp_path is not None and self._out is None
+
+    def _check_signature(self):
+        """Reject files whose leading bytes don't match their extension"""
+        if not bytes(self._sniff_buffer).startswith(FILE_SIGNATURES[self.extension]):
+            raise UploadRejectedError(400, f"File content does not match a {self.extension} file")
+
+    def discard(self):
+        """Close and delete a partially written file"""
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if self.temp_path is not None:
+            self.temp_path.unlink(missing_ok=True)
+            self.temp_path = None
+
+
+async def receive_upload(request: Request, file_field: str, dest_dir: Path, dest_stem: str,
+                         allowed_extensions: List[str], max_size: int) -> Dict:
+    """
+    Stream a multipart/form-data upload straight to its final location
+
+    The request body is parsed as it is received instead of being spooled
+    to a temporary file first, so the file bytes are written exactly once
+    and memory use stays flat regardless of upload size. Size and SHA-256
+    are computed on the fly, and the upload is refused as soon as it
+    exceeds max_size or its first bytes don't match its extension.
+
+    Args:
+        request: Incoming request
+        file_field: Form field holding the file
+        dest_dir: Directory the file is stored in
+        dest_stem: Stored filename without extension (the upload's extension is appended)
+        allowed_extensions: Accepted lowercase extensions (each needs a FILE_SIGNATURES entry)
+        max_size: Maximum file size in bytes
+
+    Returns:
+        Dict with "fields" (other form fields), "original_filename",
+        "filename", "file_path", "file_size" and "content_hash"
+
+    Raises:
+        UploadRejectedError: If the upload is malformed, too large or of the wrong type
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or not params.get(b"boundary"):
+        raise UploadRejectedError(400, "Expected a multipart/form-data upload")
+
+    # Refuse obviously oversized bodies before reading any of them
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+        raise UploadRejectedError(413, f"File too large. Maximum size: {max_size // (1024*1024)}MB")
+
+    receiver = _UploadReceiver(file_field, dest_dir, allowed_extensions, max_size)
+    parser = MultipartParser(params[b"boundary"], receiver.callbacks())
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+        parser.finalize()
+
+        if receiver.temp_path is None or receiver.size == 0:
+            raise UploadRejectedError(400, "No file uploaded")
+        if not receiver.file_complete:
+            raise UploadRejectedError(400, "Upload ended before the file was complete")
+
+        final_path = dest_dir / f"{dest_stem}{receiver.extension}"
+        os.replace(receiver.temp_path, final_path)
+    except UploadRejectedError:
+        receiver.discard()
+        raise
+    except ClientDisconnect:
+        receiver.discard()
+        raise UploadRejectedError(400, "Upload was interrupted")
+    except Exception as e:
+        receiver.discard()
+        print(f"⚠️ Could not parse multipart upload: {e}")
+        raise UploadRejectedError(400, "Malformed multipart upload")
+
+    return {
+        "fields": receiver.fields,
+        "original_filename": receiver.filename,
+        "filename": final_path.name,
+        "file_path": final_path,
+        "file_size": receiver.size,
+        "content_hash": receiver.hasher.hexdigest()
+    }
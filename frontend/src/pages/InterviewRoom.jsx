@@ -4,6 +4,7 @@
 import { useParams, useNavigate } from 'react-router-dom';
 import { useState, useEffect, useRef } from 'react';
 import { interviewAPI } from '../services/api';
+import { FollowUpChannel } from '../services/followUpStream';
 import voiceAgent from '../services/voiceAgent';
 import speechRecognition from '../services/speechRecognition';
 import { 
@@ -18,6 +19,10 @@ const InterviewRoom = () => {
   const conversationEndRef = useRef(null);
   const timeoutRef = useRef(null);
   const silenceTimeoutRef = useRef(null);
+  const questionsRef = useRef([]); // Latest questions, including ones streamed in after load
+  const questionsCompleteRef = useRef(true);
+  const questionSourceRef = useRef(null);
+  const followUpChannelRef = useRef(null); // Interview WebSocket, shared by every follow-up
 
   // Interview state
   const [interview, setInterview] = useState(null);
@@ -51,6 +56,7 @@ const InterviewRoom = () => {
 
   // Initialize interview
   useEffect(() => {
+    followUpChannelRef.current = new FollowUpChannel(sessionId);
     initializeInterview();
     
     return () => {
@@ -60,6 +66,8 @@ const InterviewRoom = () => {
       }
       voiceAgent.stop();
       speechRecognition.stop();
+      questionSourceRef.current?.close();
+      followUpChannelRef.current?.close();
       if (timeoutRef.current) {
         clearTimeout(timeoutRef.current);
       }
@@ -99,6 +107,10 @@ const InterviewRoom = () => {
       if (response.data.success) {
         const interviewData = response.data.data;
         setInterview(interviewData);
+        questionsRef.current = interviewData.questions || [];
+        if (interviewData.questions_status === 'generating') {
+          followQuestions();
+        }
         
         // Initialize camera
         const mediaStream = await navigator.mediaDevices.getUserMedia({
@@ -120,6 +132,45 @@ const InterviewRoom = () => {
     }
   };
 
+  // Questions still being generated arrive over SSE and are appended as each one completes
+  const followQuestions = () => {
+    questionsCompleteRef.current = false;
+    const source = new EventSource(interviewAPI.questionEventsUrl(sessionId));
+    questionSourceRef.current = source;
+
+    const finish = () => {
+      source.close();
+      questionsCompleteRef.current = true;
+    };
+    source.addEventListener('question', (event) => {
+      const { index, question } = JSON.parse(event.data);
+      if (index < questionsRef.current.length) return; // Replay of one we already have
+      questionsRef.current = [...questionsRef.current, question];
+      setInterview(prev => ({ ...prev, questions: questionsRef.current }));
+    });
+    source.addEventListener('complete', finish);
+    source.addEventListener('failed', finish);
+    // EventSource reconnects on its own; stop waiting only once it has closed
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        finish();
+      }
+    };
+  };
+
+  // Resolves once question `index` has arrived or generation is over
+  const waitForQuestion = (index) =>
+    new Promise((resolve) => {
+      const check = () => {
+        if (index < questionsRef.current.length || questionsCompleteRef.current) {
+          resolve();
+        } else {
+          setTimeout(check, 250);
+        }
+      };
+      check();
+    });
+
   const startInterview = async (interviewData) => {
     try {
       setLoading(true);
@@ -164,6 +215,15 @@ const InterviewRoom = () => {
   };
 
   const askNextQuestion = async (questions, index) => {
+    // Later questions may have streamed in since `questions` was captured
+    if (questionsRef.current.length > (questions?.length || 0)) {
+      questions = questionsRef.current;
+    }
+    if (index >= (questions?.length || 0) && !questionsCompleteRef.current) {
+      await waitForQuestion(index);
+      questions = questionsRef.current;
+    }
+
     if (!questions || questions.length === 0) {
       setError('No questions available. Please try starting the interview again.');
       setLoading(false);
@@ -341,7 +401,51 @@ const InterviewRoom = () => {
     }
   };
 
+  // Speak the follow-up while it is still being generated, clause by clause
+  const streamAndAskFollowUp = async (previousAnswer) => {
+    let speech = Promise.resolve();
+    let spoken = false;
+    setAgentSpeaking(!agentMuted);
+
+    const speakClause = (clause) => {
+      spoken = true;
+      speech = speech.then(async () => {
+        setAgentText(clause);
+        if (!agentMuted) {
+          await voiceAgent.speak(clause).catch(err => console.error('Voice agent error:', err));
+        }
+      });
+    };
+
+    try {
+      const followUp = await followUpChannelRef.current.streamFollowUp(
+        currentQuestionObj._id || currentQuestionIndex,
+        previousAnswer,
+        speakClause
+      );
+      addToConversation('agent', followUp, { isFollowUp: true });
+    } catch (err) {
+      if (!spoken) throw err;
+      console.error('Follow-up stream interrupted:', err);
+    } finally {
+      await speech;
+      setAgentSpeaking(false);
+      setAgentText('');
+    }
+
+    setTimeout(() => {
+      startListening();
+    }, 500);
+  };
+
   const generateAndAskFollowUp = async (previousAnswer) => {
+    try {
+      await streamAndAskFollowUp(previousAnswer);
+      return;
+    } catch (err) {
+      console.error('Follow-up stream unavailable, falling back to request:', err);
+    }
+
     try {
       const response = await interviewAPI.generateFollowUp(
         sessionId,
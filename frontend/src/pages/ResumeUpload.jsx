@@ -3,13 +3,59 @@
  */
 import { useState, useRef, useEffect } from 'react';
 import { useNavigate, useLocation } from 'react-router-dom';
-import api from '../services/api';
+import api, { resumeAPI } from '../services/api';
+import { auth } from '../config/firebase';
+
+// Progress shown for each parse job stage reported by the server
+const STAGE_PROGRESS = {
+  queued: 25,
+  extracting: 40,
+  llm: 65,
+  saving: 90,
+  done: 100,
+};
+
+const STAGE_LABELS = {
+  uploading: 'Uploading resume...',
+  queued: 'Waiting for a parser...',
+  extracting: 'Extracting text...',
+  llm: 'Analyzing with AI...',
+  saving: 'Saving your profile...',
+  done: 'Done!',
+};
+
+// Follow a parse job over SSE; resolves with the ResumeUploadResponse
+const followParseJob = async (jobId, onStage) => {
+  const token = await auth.currentUser?.getIdToken();
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(resumeAPI.jobEventsUrl(jobId, token));
+
+    source.addEventListener('stage', (event) => {
+      onStage(JSON.parse(event.data).stage);
+    });
+    source.addEventListener('result', (event) => {
+      source.close();
+      resolve(JSON.parse(event.data));
+    });
+    source.addEventListener('failed', (event) => {
+      source.close();
+      reject(new Error(JSON.parse(event.data).message));
+    });
+    // EventSource reconnects on its own; give up only once it has closed
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        reject(new Error('Lost connection while analyzing resume'));
+      }
+    };
+  });
+};
 
 const ResumeUpload = () => {
   const [file, setFile] = useState(null);
   const [jobRole, setJobRole] = useState('Software Engineer');
   const [uploading, setUploading] = useState(false);
   const [uploadProgress, setUploadProgress] = useState(0);
+  const [uploadStage, setUploadStage] = useState('uploading');
   const [dragActive, setDragActive] = useState(false);
   const [error, setError] = useState('');
   const [extractedData, setExtractedData] = useState(null);
@@ -117,40 +163,39 @@ const ResumeUpload = () => {
     setUploading(true);
     setError('');
     setUploadProgress(0);
+    setUploadStage('uploading');
 
     try {
-      // Simulate upload progress
-      const progressInterval = setInterval(() => {
-        setUploadProgress((prev) => {
-          if (prev >= 90) {
-            clearInterval(progressInterval);
-            return 90;
-          }
-          return prev + 10;
-        });
-      }, 200);
-
       const formData = new FormData();
       formData.append('file', file);
       formData.append('job_role', jobRole);
 
+      // The upload itself fills the first 20% of the bar
       const response = await api.post('/api/resumes/upload', formData, {
         headers: {
           'Content-Type': 'multipart/form-data',
         },
+        onUploadProgress: (event) => {
+          if (event.total) {
+            setUploadProgress(Math.round((event.loaded / event.total) * 20));
+          }
+        },
       });
 
-      clearInterval(progressInterval);
-      setUploadProgress(100);
+      // Parsing continues in the background; follow its real stages
+      const result = await followParseJob(response.data.job_id, (stage) => {
+        setUploadStage(stage);
+        setUploadProgress((prev) => Math.max(prev, STAGE_PROGRESS[stage] ?? prev));
+      });
 
-      if (response.data.success) {
-        setExtractedData(response.data.extracted_data);
-        setResumeId(response.data.resume_id);
+      if (result.success) {
+        setExtractedData(result.extracted_data);
+        setResumeId(result.resume_id);
         setShowSuccess(true);
       }
     } catch (err) {
       console.error('Upload error:', err);
-      setError(err.response?.data?.detail || 'Failed to upload resume. Please try again.');
+      setError(err.response?.data?.detail || err.message || 'Failed to upload resume. Please try again.');
     } finally {
       setUploading(false);
     }
@@ -326,7 +371,7 @@ const ResumeUpload = () => {
                   {uploading && (
                     <div className="mt-4 space-y-2">
                       <div className="flex justify-between text-sm text-gray-300">
-                        <span>Uploading and analyzing...</span>
+                        <span>{STAGE_LABELS[uploadStage] || 'Uploading and analyzing...'}</span>
                         <span>{uploadProgress}%</span>
                       </div>
                       <div className="h-2 bg-gray-700 rounded-full overflow-hidden">
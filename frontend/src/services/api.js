@@ -55,6 +55,15 @@ export const resumeAPI = {
     });
   },
 
+  // Get resume parse job status
+  getJob: async (jobId) => {
+    return api.get(`/api/resumes/jobs/${jobId}`);
+  },
+
+  // Server-Sent Events URL for resume parse job progress (auth token as a query param)
+  jobEventsUrl: (jobId, token) =>
+    `${API_BASE_URL}/api/resumes/jobs/${jobId}/events?token=${encodeURIComponent(token || '')}`,
+
   // Get resume by ID
   getById: async (resumeId) => {
     return api.get(`/api/resumes/${resumeId}`);
@@ -101,6 +110,13 @@ export const interviewAPI = {
     return api.get(`/api/interviews/${sessionId}`);
   },
 
+  // Server-Sent Events URL for questions still being generated
+  questionEventsUrl: (sessionId) => `${API_BASE_URL}/api/interviews/${sessionId}/questions/events`,
+
+  // WebSocket URL for the live interview channel (auth token as a query param)
+  socketUrl: (sessionId, token) =>
+    `${API_BASE_URL.replace(/^http/, 'ws')}/api/interviews/ws/${sessionId}?token=${encodeURIComponent(token || '')}`,
+
   // Update interview status
   updateStatus: async (sessionId, status) => {
     return api.put(`/api/interviews/${sessionId}/status`, { status });
@@ -0,0 +1,112 @@
+/**
+ * Follow-up Stream Service
+ * Streams follow-up questions over the interview WebSocket, clause by clause
+ */
+import { auth } from '../config/firebase';
+import { interviewAPI } from './api';
+
+// The first clause is spoken as soon as it is complete; after that, whole sentences
+const FIRST_CLAUSE_END = /^(.+?[,;:.!?])\s+/;
+const SENTENCE_END = /^(.+?[.!?])\s+/;
+
+/**
+ * The interview's WebSocket, opened on first use and shared by every follow-up
+ * of the session; it is reopened only if the server closed it.
+ */
+export class FollowUpChannel {
+  constructor(sessionId) {
+    this.sessionId = sessionId;
+    this.socket = null;
+    this.opening = null;
+    this.handler = null; // Message handler of the follow-up in flight
+    this.closed = false;
+  }
+
+  // Resolves with an open socket, reusing the current one
+  async connect() {
+    if (this.closed) throw new Error('Follow-up channel closed');
+    if (this.socket?.readyState === WebSocket.OPEN) return this.socket;
+    if (this.opening) return this.opening;
+
+    this.opening = (async () => {
+      const token = await auth.currentUser?.getIdToken();
+      return new Promise((resolve, reject) => {
+        const socket = new WebSocket(interviewAPI.socketUrl(this.sessionId, token));
+        socket.onopen = () => {
+          this.socket = socket;
+          resolve(socket);
+        };
+        socket.onmessage = (event) => this.handler?.(JSON.parse(event.data));
+        socket.onclose = (event) => {
+          if (this.socket === socket) this.socket = null;
+          reject(new Error(`Follow-up stream closed (${event.code})`));
+          this.handler?.({ type: 'closed', code: event.code });
+        };
+      });
+    })();
+    try {
+      return await this.opening;
+    } finally {
+      this.opening = null;
+    }
+  }
+
+  /**
+   * Request a follow-up question and receive it as it is generated
+   *
+   * @param {string|number} questionId - Question the answer was given to
+   * @param {string} answer - Candidate's answer
+   * @param {function} onClause - Called with each clause/sentence ready to be spoken
+   * @returns {Promise<string>} The complete follow-up question
+   */
+  async streamFollowUp(questionId, answer, onClause) {
+    const socket = await this.connect();
+
+    return new Promise((resolve, reject) => {
+      let pending = '';
+      let spokenFirst = false;
+
+      const flush = () => {
+        let match;
+        while ((match = (spokenFirst ? SENTENCE_END : FIRST_CLAUSE_END).exec(pending))) {
+          onClause(match[1]);
+          spokenFirst = true;
+          pending = pending.slice(match[0].length);
+        }
+      };
+
+      this.handler = (message) => {
+        if (message.type === 'follow_up_token') {
+          pending += message.token;
+          flush();
+        } else if (message.type === 'follow_up_done') {
+          const rest = pending.trim().replace(/["']+$/, '');
+          if (rest) onClause(rest);
+          this.handler = null;
+          resolve(message.follow_up);
+        } else if (message.type === 'error') {
+          this.handler = null;
+          reject(new Error(message.message));
+        } else if (message.type === 'closed') {
+          this.handler = null;
+          reject(new Error(`Follow-up stream closed (${message.code})`));
+        }
+      };
+
+      socket.send(JSON.stringify({
+        type: 'follow_up_request',
+        question_id: questionId,
+        answer
+      }));
+    });
+  }
+
+  // Close the socket when the interview room goes away
+  close() {
+    this.closed = true;
+    this.socket?.close();
+    this.socket = null;
+  }
+}
+
+export default FollowUpChannel;